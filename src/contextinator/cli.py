@@ -10,11 +10,18 @@ import json
 import sys
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Already loaded with the package (this module lives inside it), so importing
+# here costs nothing at startup and spares read_command a per-call import
+from contextinator import fs_read
+
 
 def read_command(args):
     """Execute fs_read tool (Rust-based)."""
-    from contextinator import fs_read
-    
     try:
         result = fs_read(
             path=args.path,
@@ -27,7 +34,7 @@ def read_command(args):
         )
         
         if args.format == "json":
-            print(json.dumps(result, indent=2))
+            _write_json(result)
         else:
             _print_result(result, args.mode)
             
@@ -36,6 +43,26 @@ def read_command(args):
         sys.exit(1)
 
 
+def _write_json(result):
+    """Write result to stdout as indented JSON without building it as a str."""
+    # Text-only replacements for stdout (e.g. StringIO) have no byte buffer
+    buffer = getattr(sys.stdout, "buffer", None)
+    if orjson is not None and buffer is not None:
+        try:
+            payload = orjson.dumps(result, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            # orjson rejects a few inputs json accepts (e.g. ints wider than 64 bits)
+            payload = None
+        if payload is not None:
+            sys.stdout.flush()
+            buffer.write(payload + b"\n")
+            buffer.flush()
+            return
+
+    json.dump(result, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
 def _print_result(result, mode):
     """Pretty print result based on mode."""
     if mode == "Line":
@@ -43,23 +70,24 @@ def _print_result(result, mode):
         print(f"\n[{result['lines_returned']}/{result['total_lines']} lines]", file=sys.stderr)
     
     elif mode == "Directory":
-        for entry in result["entries"]:
-            prefix = "📁" if entry["is_dir"] else "📄"
-            size = f"({entry['size']} bytes)" if not entry["is_dir"] else ""
-            print(f"{prefix} {entry['path']} {size}")
+        # Collect all lines and write them at once instead of a print per entry
+        out = [
+            f"📁 {entry['path']} \n"
+            if entry["is_dir"]
+            else f"📄 {entry['path']} ({entry['size']} bytes)\n"
+            for entry in result["entries"]
+        ]
+        sys.stdout.writelines(out)
         print(f"\n[{result['total_count']} entries]", file=sys.stderr)
     
     elif mode == "Search":
+        out = []
         for match in result["matches"]:
-            print(f"\n{match['file_path']}:{match['line_number']}")
-            
-            for line in match["context_before"]:
-                print(f"  {line}")
-            
-            print(f"> {match['line_content']}")
-            
-            for line in match["context_after"]:
-                print(f"  {line}")
+            out.append(f"\n{match['file_path']}:{match['line_number']}\n")
+            out.extend(f"  {line}\n" for line in match["context_before"])
+            out.append(f"> {match['line_content']}\n")
+            out.extend(f"  {line}\n" for line in match["context_after"])
+        sys.stdout.writelines(out)
         
         print(f"\n[{result['total_matches']} matches]", file=sys.stderr)
 
@@ -10,17 +10,20 @@ Advanced semantic search and code intelligence using:
 For basic filesystem operations, use the primary fs_read tool instead.
 """
 
-from .chunking import chunk_repository
-from .embedding import embed_chunks
-from .vectorstore import store_repository_embeddings, ChromaVectorStore
-from .ingestion import AsyncIngestionService
-from .tools import (
-    semantic_search,
-    symbol_search,
-    cat_file,
-    grep_search,
-    analyze_structure,
-)
+# Public names are imported on first access, so importing a subpackage such
+# as contextinator.rag.utils does not load chromadb, openai or tree-sitter
+_LAZY_IMPORTS = {
+    "chunk_repository": ".chunking",
+    "embed_chunks": ".embedding",
+    "store_repository_embeddings": ".vectorstore",
+    "ChromaVectorStore": ".vectorstore",
+    "AsyncIngestionService": ".ingestion",
+    "semantic_search": ".tools",
+    "symbol_search": ".tools",
+    "cat_file": ".tools",
+    "grep_search": ".tools",
+    "analyze_structure": ".tools",
+}
 
 __all__ = [
     "chunk_repository",
@@ -34,3 +37,14 @@ __all__ = [
     "grep_search",
     "analyze_structure",
 ]
+
+
+def __getattr__(name):
+    """Lazy import public names to avoid heavy dependencies unless needed."""
+    if name in _LAZY_IMPORTS:
+        from importlib import import_module
+
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
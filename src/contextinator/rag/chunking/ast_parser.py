@@ -11,6 +11,7 @@ from typing import Any, Dict, List, Optional, TYPE_CHECKING
 
 from ..config import SUPPORTED_EXTENSIONS
 from ..utils.logger import logger
+from ..utils.repo_utils import repo_relative_path
 
 # Tree-sitter imports with graceful fallback
 try:
@@ -141,8 +142,6 @@ try:
         tree_sitter_xml = None
         HAS_XML = False
 
-    from .ast_visualizer import save_ast_visualization
-
     # Language module mapping for parser creation
     LANGUAGE_MODULES: Dict[str, Any] = {
         "python": tree_sitter_python,
@@ -488,6 +487,7 @@ def parse_file(
     save_ast: bool = False,
     chunks_dir: Optional[Path] = None,
     repo_path: Optional[Path] = None,
+    save_full_ast: bool = False,
 ) -> Optional[Dict[str, Any]]:
     """
     Parse a file and return its AST representation with extracted nodes.
@@ -497,6 +497,7 @@ def parse_file(
         save_ast: Whether to save AST visualization data
         chunks_dir: Repository-specific chunks directory for AST data (required if save_ast=True)
         repo_path: Repository root path for computing relative paths (optional)
+        save_full_ast: Also save the serialized AST tree (only used with save_ast)
 
     Returns:
         Dictionary containing AST nodes and metadata, or None if parsing fails
@@ -515,9 +516,8 @@ def parse_file(
     # Compute repo-relative path with forward slashes for cross-platform compatibility
     if repo_path:
         try:
-            relative_path = file_path.relative_to(repo_path)
-            # Convert to forward slashes for consistency
-            file_path_str = relative_path.as_posix()
+            # Forward slashes for consistency
+            file_path_str = repo_relative_path(file_path, repo_path)
         except ValueError:
             # If file is not relative to repo_path, use absolute path
             logger.warning(
@@ -573,8 +573,9 @@ def parse_file(
                 )
                 return _fallback_parse(file_path, file_path_str, language, content)
 
-            tree = parser.parse(bytes(content, "utf-8"))
-            nodes = extract_nodes(tree.root_node, content, language)
+            content_bytes = content.encode("utf-8")
+            tree = parser.parse(content_bytes)
+            nodes = extract_nodes(tree.root_node, content, language, content_bytes)
 
             logger.debug(f"Parsed {file_path} - Found {len(nodes)} semantic nodes")
 
@@ -618,6 +619,8 @@ def parse_file(
                 result["nodes"],
                 chunks_dir,
                 result.get("tree_info"),
+                content_bytes,
+                save_full_ast,
             )
 
         return result
@@ -734,7 +737,12 @@ def get_parser(language: str) -> Optional["Parser"]:
             return None
 
 
-def extract_nodes(root_node: Any, content: str, language: str) -> List[Dict[str, Any]]:
+def extract_nodes(
+    root_node: Any,
+    content: str,
+    language: str,
+    content_bytes: Optional[bytes] = None,
+) -> List[Dict[str, Any]]:
     """
     Extract relevant nodes from AST based on language-specific node types.
 
@@ -742,6 +750,7 @@ def extract_nodes(root_node: Any, content: str, language: str) -> List[Dict[str,
         root_node: Root node of the AST
         content: Source code content
         language: Programming language
+        content_bytes: Already-encoded content (encoded from content if omitted)
 
     Returns:
         List of extracted nodes with metadata including hierarchy
@@ -752,7 +761,8 @@ def extract_nodes(root_node: Any, content: str, language: str) -> List[Dict[str,
 
     parent_types = set(PARENT_NODE_TYPES.get(language, []))
     nodes = []
-    content_bytes = content.encode("utf-8")
+    if content_bytes is None:
+        content_bytes = content.encode("utf-8")
 
     def traverse(
         node: Any, parent_id: Optional[str] = None, parent_info: Optional[Dict] = None
@@ -796,12 +806,12 @@ def extract_nodes(root_node: Any, content: str, language: str) -> List[Dict[str,
 
     traverse(root_node)
 
-    # Populate children_ids
+    # Populate children_ids in one pass (nodes are in traversal order)
+    parents = {node["id"]: node for node in nodes if node["is_parent"]}
     for node in nodes:
-        if node["is_parent"]:
-            node["children_ids"] = [
-                n["id"] for n in nodes if n["parent_id"] == node["id"]
-            ]
+        parent = parents.get(node["parent_id"])
+        if parent is not None:
+            parent["children_ids"].append(node["id"])
 
     return nodes
 
@@ -908,6 +918,8 @@ def _save_ast_safely(
     nodes: List[Dict[str, Any]],
     chunks_dir: Path,
     tree_info: Optional[Dict[str, Any]],
+    content_bytes: Optional[bytes] = None,
+    save_full_ast: bool = False,
 ) -> None:
     """
     Safely save AST visualization with error handling.
@@ -920,11 +932,23 @@ def _save_ast_safely(
         nodes: Extracted nodes
         chunks_dir: Directory for AST files
         tree_info: Tree metadata
+        content_bytes: Already-encoded content, if available
+        save_full_ast: Whether to also save the serialized AST tree
     """
     try:
+        from .ast_visualizer import save_ast_visualization
+
         logger.debug(f"Saving AST for {file_path}")
         save_ast_visualization(
-            str(file_path), language, root_node, content, nodes, chunks_dir, tree_info
+            str(file_path),
+            language,
+            root_node,
+            content,
+            nodes,
+            chunks_dir,
+            tree_info,
+            content_bytes,
+            save_full_ast,
         )
     except Exception as e:
         logger.warning(f"Could not save AST for {file_path}: {e}")
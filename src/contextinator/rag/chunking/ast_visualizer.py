@@ -5,13 +5,92 @@ This module provides functionality to visualize and save AST trees
 created by tree-sitter for understanding the parsing and chunking process.
 """
 
-import json
+import os
+import sys
+from collections import Counter, deque
+from contextlib import nullcontext
+from concurrent.futures import Future, ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Deque, Dict, Any, Iterator, List, Optional, Set, Tuple
 from ..config import CHUNKS_DIR
+from ..utils.json_utils import dump_json, dumps_json, load_json, loads_json
 from ..utils.logger import logger
 
 
+# Index of per-file overview records, written alongside the AST files; records
+# are appended per file and compacted to the latest per file by save_ast_overview
+AST_INDEX_FILE = "ast_overview.ndjson"
+
+# AST directories already created by this process; the writer recreates one
+# that has since been removed
+_created_ast_dirs: Set[Path] = set()
+
+# Background writer that overlaps AST file writes with parsing of the next file.
+# It is created lazily per process (forked workers must not reuse the parent's),
+# and a single thread keeps index appends in submission order.
+_writer: Optional[ThreadPoolExecutor] = None
+_writer_pid: Optional[int] = None
+_pending_writes: Deque[Future] = deque()
+# Bound on queued writes so AST data cannot pile up if the disk falls behind
+_MAX_PENDING_WRITES = 32
+
+# Number of most frequent node types kept in the AST summary
+_TOP_NODE_TYPES = 50
+
+# Threads used to load AST files when the overview index is missing
+_OVERVIEW_READ_WORKERS = 8
+
+# Node text is truncated to this many characters in serialized output
+_MAX_NODE_TEXT = 200
+# A UTF-8 character is at most 4 bytes, so this prefix always covers _MAX_NODE_TEXT
+_NODE_TEXT_PREFIX_BYTES = _MAX_NODE_TEXT * 4 + 4
+
+
+def _truncated_node_dict(node) -> Dict[str, Any]:
+    """Serialize a node cut off by the depth limit (no text or children)."""
+    return {
+        "type": sys.intern(node.type),
+        "text": "... (max depth reached)",
+        "start_point": list(node.start_point),
+        "end_point": list(node.end_point),
+        "start_byte": node.start_byte,
+        "end_byte": node.end_byte,
+        "children_count": node.child_count,
+    }
+
+
+def _node_dict(node, content_bytes: bytes) -> Dict[str, Any]:
+    """Serialize a node's own fields, leaving its children list empty."""
+    # Get node text (truncate if too long), decoding only the prefix we keep
+    start_byte, end_byte = node.start_byte, node.end_byte
+    node_text = None
+    if end_byte - start_byte > _NODE_TEXT_PREFIX_BYTES:
+        prefix = str(
+            content_bytes[start_byte : start_byte + _NODE_TEXT_PREFIX_BYTES],
+            "utf-8",
+            "ignore",
+        )
+        if len(prefix) > _MAX_NODE_TEXT:
+            node_text = prefix
+    if node_text is None:
+        node_text = str(content_bytes[start_byte:end_byte], "utf-8", "ignore")
+    if len(node_text) > _MAX_NODE_TEXT:
+        node_text = node_text[:_MAX_NODE_TEXT] + "..."
+
+    return {
+        "type": sys.intern(node.type),
+        "text": node_text,
+        # Points are [row, column] pairs
+        "start_point": list(node.start_point),
+        "end_point": list(node.end_point),
+        "start_byte": start_byte,
+        "end_byte": end_byte,
+        "is_named": node.is_named,
+        "children": [],
+    }
+
+
 def serialize_node(
     node, content_bytes: bytes, max_depth: int = None, current_depth: int = 0
 ) -> Dict[str, Any]:
@@ -20,7 +99,7 @@ def serialize_node(
 
     Args:
         node: Tree-sitter node
-        content_bytes: Source code as bytes
+        content_bytes: Source code as bytes (or a memoryview over them)
         max_depth: Maximum depth to traverse (None for unlimited)
         current_depth: Current traversal depth
 
@@ -28,33 +107,9 @@ def serialize_node(
         Dictionary representation of the node
     """
     if max_depth is not None and current_depth >= max_depth:
-        return {
-            "type": node.type,
-            "text": "... (max depth reached)",
-            "start_point": node.start_point,
-            "end_point": node.end_point,
-            "start_byte": node.start_byte,
-            "end_byte": node.end_byte,
-            "children_count": len(node.children),
-        }
+        return _truncated_node_dict(node)
 
-    # Get node text (truncate if too long)
-    node_text = content_bytes[node.start_byte : node.end_byte].decode(
-        "utf-8", errors="ignore"
-    )
-    if len(node_text) > 200:
-        node_text = node_text[:200] + "..."
-
-    node_dict = {
-        "type": node.type,
-        "text": node_text,
-        "start_point": {"row": node.start_point[0], "column": node.start_point[1]},
-        "end_point": {"row": node.end_point[0], "column": node.end_point[1]},
-        "start_byte": node.start_byte,
-        "end_byte": node.end_byte,
-        "is_named": node.is_named,
-        "children": [],
-    }
+    node_dict = _node_dict(node, content_bytes)
 
     # Recursively serialize children
     for child in node.children:
@@ -64,41 +119,121 @@ def serialize_node(
     return node_dict
 
 
-def create_ast_summary(root_node, content_bytes: bytes) -> Dict[str, Any]:
+# (node type counts, max depth, total nodes, byte-range index)
+AstStats = Tuple[Counter, int, int, Dict[Tuple[int, int], Any]]
+
+
+def _walk_stats(
+    root_node, content_bytes: Optional[bytes] = None, max_depth: Optional[int] = None
+) -> Tuple[AstStats, Optional[Dict[str, Any]]]:
+    """
+    Collect node statistics and a byte-range path index in one pass.
+
+    The index maps ``(start_byte, end_byte)`` to the first node (in pre-order)
+    spanning that range, together with a linked trail of its ancestors, so
+    extraction paths can be resolved without re-descending the tree.
+
+    When content_bytes is given, the same pass also builds the tree that
+    ``serialize_node(root_node, content_bytes, max_depth)`` would return.
+
+    Args:
+        root_node: Root node of the AST
+        content_bytes: Source code as bytes, to also serialize the tree
+        max_depth: Depth limit for the serialized tree (None for unlimited)
+
+    Returns:
+        Tuple of ((node type counts, max depth, total nodes, byte-range index),
+        serialized tree or None)
+    """
+    counts: Counter = Counter()
+    byte_index: Dict[Tuple[int, int], Any] = {}
+    tree_depth = 0
+    total = 0
+    serialized: List[Dict[str, Any]] = []
+
+    # Pre-order walk with a tree-sitter cursor, which moves between nodes in C
+    # instead of materializing a children list for every node. frames[d] holds
+    # the (trail, serialized children list) that nodes at depth d + 1 belong to;
+    # each trail is a (node_type, parent_trail) pair linking back to the root,
+    # and the children list is None when not serializing or below the limit.
+    cursor = root_node.walk()
+    frames: List[Tuple[Any, Optional[List[Dict[str, Any]]]]] = []
+    depth = 0
+    trail = None
+    siblings = serialized if content_bytes is not None else None
+    while True:
+        node = cursor.node
+        # Interned types share one string object per distinct node type
+        node_type = sys.intern(node.type)
+        counts[node_type] += 1
+        total += 1
+        if depth > tree_depth:
+            tree_depth = depth
+
+        byte_range = (node.start_byte, node.end_byte)
+        if byte_range not in byte_index:
+            byte_index[byte_range] = (node_type, trail)
+
+        child_siblings = None
+        if siblings is not None:
+            if max_depth is not None and depth >= max_depth:
+                siblings.append(_truncated_node_dict(node))
+            else:
+                node_dict = _node_dict(node, content_bytes)
+                siblings.append(node_dict)
+                child_siblings = node_dict["children"]
+
+        if cursor.goto_first_child():
+            frames.append(((node_type, trail), child_siblings))
+            depth += 1
+        else:
+            while depth and not cursor.goto_next_sibling():
+                cursor.goto_parent()
+                frames.pop()
+                depth -= 1
+            if not depth:
+                break
+        trail, siblings = frames[-1]
+
+    stats = (counts, tree_depth, total, byte_index)
+    return stats, serialized[0] if serialized else None
+
+
+def _materialize_path(entry: Tuple[str, Any]) -> List[str]:
+    """Expand a byte-range index entry into root-to-node AST node types."""
+    node_type, trail = entry
+    path = [node_type]
+    while trail is not None:
+        step_type, trail = trail
+        path.append(step_type)
+    path.reverse()
+    return path
+
+
+def create_ast_summary(
+    root_node, content_bytes: bytes, stats: Optional[AstStats] = None
+) -> Dict[str, Any]:
     """
     Create a summary of the AST structure.
 
     Args:
         root_node: Root node of the AST
         content_bytes: Source code as bytes
+        stats: Precomputed stats from ``_walk_stats`` (computed if omitted)
 
     Returns:
         AST summary dictionary
     """
-
-    def count_nodes_by_type(node, counts=None):
-        if counts is None:
-            counts = {}
-
-        counts[node.type] = counts.get(node.type, 0) + 1
-        for child in node.children:
-            count_nodes_by_type(child, counts)
-
-        return counts
-
-    def get_tree_depth(node, current_depth=0):
-        if not node.children:
-            return current_depth
-        return max(get_tree_depth(child, current_depth + 1) for child in node.children)
-
-    node_counts = count_nodes_by_type(root_node)
+    node_counts, max_depth, total_nodes, _ = stats or _walk_stats(root_node)[0]
 
     return {
-        "total_nodes": sum(node_counts.values()),
-        "max_depth": get_tree_depth(root_node),
-        "node_type_distribution": dict(
-            sorted(node_counts.items(), key=lambda x: x[1], reverse=True)
-        ),
+        "total_nodes": total_nodes,
+        "max_depth": max_depth,
+        # [type, count] pairs, most frequent first
+        "node_type_distribution": [
+            [node_type, count]
+            for node_type, count in node_counts.most_common(_TOP_NODE_TYPES)
+        ],
         "root_type": root_node.type,
         "tree_size_bytes": root_node.end_byte - root_node.start_byte,
     }
@@ -112,10 +247,19 @@ def save_ast_visualization(
     extracted_nodes: List[Dict[str, Any]],
     chunks_dir: Path,
     tree_info: Dict[str, Any] = None,
+    content_bytes: Optional[bytes] = None,
+    save_full_ast: bool = False,
 ):
     """
     Save AST visualization data to files.
 
+    The summary, extraction mapping and extracted nodes are written to
+    ``<stem>_<language>_ast.json``. The depth-limited serialized tree is large,
+    so it is only written (to ``<stem>_<language>_full_ast.json``) on request.
+
+    Files are written by a background thread so the caller can move on to the
+    next file; call flush_ast_writes() before reading them back.
+
     Args:
         file_path: Path to the source file
         language: Programming language
@@ -124,11 +268,16 @@ def save_ast_visualization(
         extracted_nodes: List of extracted semantic nodes
         chunks_dir: Chunks directory (repository-specific) for saving AST data
         tree_info: Tree information including whether AST is available
+        content_bytes: Already-encoded content (encoded from content if omitted)
+        save_full_ast: Also write the serialized AST tree (default: False)
     """
     ast_dir = chunks_dir / "ast_trees"
-    ast_dir.mkdir(parents=True, exist_ok=True)
+    if ast_dir not in _created_ast_dirs:
+        ast_dir.mkdir(parents=True, exist_ok=True)
+        _created_ast_dirs.add(ast_dir)
 
-    content_bytes = content.encode("utf-8")
+    if content_bytes is None:
+        content_bytes = content.encode("utf-8")
     file_stem = Path(file_path).stem
 
     # Create comprehensive AST data
@@ -144,38 +293,117 @@ def save_ast_visualization(
     }
 
     # Only add AST-specific data if we have a real AST
-    if root_node and tree_info and tree_info.get("has_ast", False):
-        ast_data["ast_summary"] = create_ast_summary(root_node, content_bytes)
-        ast_data["full_ast"] = serialize_node(root_node, content_bytes, max_depth=10)
+    has_ast = bool(root_node and tree_info and tree_info.get("has_ast", False))
+    full_ast = None
+    if has_ast:
+        # One walk yields the summary stats, path index and (if wanted) full tree;
+        # memoryview slices avoid copying source bytes for every serialized node
+        stats, full_ast = _walk_stats(
+            root_node,
+            memoryview(content_bytes) if save_full_ast else None,
+            max_depth=10,
+        )
+        ast_data["ast_summary"] = create_ast_summary(root_node, content_bytes, stats)
         ast_data["extraction_mapping"] = create_extraction_mapping(
-            root_node, extracted_nodes, content_bytes
+            root_node, extracted_nodes, content_bytes, stats
         )
     else:
         ast_data["ast_summary"] = {
             "total_nodes": 0,
             "max_depth": 0,
-            "node_type_distribution": {},
+            "node_type_distribution": [],
             "tree_size_bytes": len(content_bytes),
             "fallback_used": True,
         }
-        ast_data["full_ast"] = None
         ast_data["extraction_mapping"] = {
             "fallback_mode": True,
             "extracted_count": len(extracted_nodes),
             "note": "File-level chunking used due to tree-sitter unavailability",
         }
 
-    # Save to JSON file
+    # Save to JSON file in the background
     output_file = ast_dir / f"{file_stem}_{language}_ast.json"
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(ast_data, f, indent=2, ensure_ascii=False)
+    full_ast_file = ast_dir / f"{file_stem}_{language}_full_ast.json"
+    _submit_write(
+        _write_ast_files, ast_dir, output_file, ast_data, full_ast_file, full_ast
+    )
+    return output_file
+
+
+def _write_ast_files(
+    ast_dir: Path,
+    output_file: Path,
+    ast_data: Dict[str, Any],
+    full_ast_file: Path,
+    full_ast: Optional[Dict[str, Any]],
+) -> None:
+    """Write a file's AST data (and full tree, if any) and record it in the index."""
+    try:
+        _write_ast_files_once(ast_dir, output_file, ast_data, full_ast_file, full_ast)
+    except FileNotFoundError:
+        # The directory was removed after this process created (and cached) it
+        ast_dir.mkdir(parents=True, exist_ok=True)
+        _write_ast_files_once(ast_dir, output_file, ast_data, full_ast_file, full_ast)
 
     logger.info(f"AST saved: {output_file}")
-    return output_file
+
+
+def _write_ast_files_once(
+    ast_dir: Path,
+    output_file: Path,
+    ast_data: Dict[str, Any],
+    full_ast_file: Path,
+    full_ast: Optional[Dict[str, Any]],
+) -> None:
+    """Write a file's AST files and index record, assuming ast_dir exists."""
+    dump_json(ast_data, output_file)
+
+    if full_ast is not None:
+        dump_json(
+            {"file_info": ast_data["file_info"], "full_ast": full_ast}, full_ast_file
+        )
+
+    # Record the overview entry so the overview doesn't need to re-read this file
+    record = {"ast_file": output_file.name, **_overview_entry(ast_data)}
+    with open(ast_dir / AST_INDEX_FILE, "ab") as f:
+        f.write(dumps_json(record, indent=False) + b"\n")
+
+
+def _wait_for_write(future: Future) -> None:
+    """Wait for a queued AST write, logging (not raising) its failure."""
+    try:
+        future.result()
+    except Exception as e:
+        logger.warning(f"Could not write AST file: {e}")
+
+
+def _submit_write(fn, *args) -> None:
+    """Queue a write on this process's background AST writer."""
+    global _writer, _writer_pid
+
+    if _writer is None or _writer_pid != os.getpid():
+        _writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ast-writer")
+        _writer_pid = os.getpid()
+        _pending_writes.clear()
+
+    while len(_pending_writes) >= _MAX_PENDING_WRITES:
+        _wait_for_write(_pending_writes.popleft())
+    _pending_writes.append(_writer.submit(fn, *args))
+
+
+def flush_ast_writes() -> None:
+    """Block until every AST write queued by this process has finished."""
+    if _writer_pid != os.getpid():
+        return
+    while _pending_writes:
+        _wait_for_write(_pending_writes.popleft())
 
 
 def create_extraction_mapping(
-    root_node, extracted_nodes: List[Dict[str, Any]], content_bytes: bytes
+    root_node,
+    extracted_nodes: List[Dict[str, Any]],
+    content_bytes: bytes,
+    stats: Optional[AstStats] = None,
 ) -> Dict[str, Any]:
     """
     Create a mapping showing how extracted nodes relate to the full AST.
@@ -184,90 +412,171 @@ def create_extraction_mapping(
         root_node: Root node of the AST
         extracted_nodes: List of extracted semantic nodes
         content_bytes: Source code as bytes
+        stats: Precomputed stats from ``_walk_stats`` (computed if omitted)
 
     Returns:
         Mapping dictionary
     """
+    _, _, total_nodes, byte_index = stats or _walk_stats(root_node)[0]
 
-    def find_node_path(node, target_start_byte, target_end_byte, path=None):
-        if path is None:
-            path = []
-
-        if node.start_byte == target_start_byte and node.end_byte == target_end_byte:
-            return path + [
-                {"type": node.type, "byte_range": [node.start_byte, node.end_byte]}
-            ]
-
-        for i, child in enumerate(node.children):
-            if (
-                child.start_byte <= target_start_byte
-                and child.end_byte >= target_end_byte
-            ):
-                result = find_node_path(
-                    child,
-                    target_start_byte,
-                    target_end_byte,
-                    path
-                    + [
-                        {
-                            "type": node.type,
-                            "child_index": i,
-                            "byte_range": [node.start_byte, node.end_byte],
-                        }
-                    ],
-                )
-                if result:
-                    return result
-
-        return None
-
-    mapping = {
-        "total_ast_nodes": count_total_nodes(root_node),
-        "extracted_count": len(extracted_nodes),
-        "extraction_paths": [],
-    }
+    # Pull every field needed from each extracted node in a single lookup
+    fields = itemgetter("type", "start_byte", "end_byte", "start_line", "end_line")
+    extraction_paths = []
 
     for extracted in extracted_nodes:
-        path = find_node_path(root_node, extracted["start_byte"], extracted["end_byte"])
-        mapping["extraction_paths"].append(
+        node_type, start_byte, end_byte, start_line, end_line = fields(extracted)
+        byte_range = (start_byte, end_byte)
+        entry = byte_index.get(byte_range)
+        extraction_paths.append(
             {
                 "extracted_node": {
-                    "type": extracted["type"],
+                    "type": node_type,
                     "name": extracted.get("name"),
-                    "byte_range": [extracted["start_byte"], extracted["end_byte"]],
-                    "line_range": [extracted["start_line"], extracted["end_line"]],
+                    "byte_range": [start_byte, end_byte],
+                    "line_range": [start_line, end_line],
                 },
-                "ast_path": path or "Not found",
+                "ast_path": _materialize_path(entry) if entry else "Not found",
             }
         )
 
-    return mapping
+    return {
+        "total_ast_nodes": total_nodes,
+        "extracted_count": len(extracted_nodes),
+        "extraction_paths": extraction_paths,
+    }
 
 
-def count_total_nodes(node) -> int:
-    """Count total number of nodes in the AST."""
-    return 1 + sum(count_total_nodes(child) for child in node.children)
+def _overview_entry(ast_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build the per-file overview entry for saved AST data.
 
+    Args:
+        ast_data: AST data as written by save_ast_visualization
 
-def create_ast_overview(chunks_dir: Path) -> Dict[str, Any]:
+    Returns:
+        Overview entry dictionary
     """
-    Create an overview of all AST files in the chunks directory.
+    tree_info = ast_data.get("tree_info", {})
+    has_ast = tree_info.get("has_ast", False)
+
+    return {
+        "file": ast_data["file_info"]["path"],
+        "language": ast_data["file_info"]["language"],
+        "ast_nodes": ast_data["ast_summary"]["total_nodes"] if has_ast else 0,
+        "extracted_nodes": len(ast_data["extracted_nodes"]),
+        "tree_depth": ast_data["ast_summary"].get("max_depth", 0) if has_ast else 0,
+        "has_real_ast": has_ast,
+        "fallback_reason": tree_info.get("fallback_reason") if not has_ast else None,
+    }
+
+
+def _iter_index_records(
+    index_file: Path, log_errors: bool = True
+) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Yield (line number, record) pairs from the NDJSON index."""
+    with open(index_file, "rb") as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                yield line_number, loads_json(line)
+            except Exception as e:
+                if log_errors:
+                    logger.info(f"Error reading {index_file}:{line_number}: {e}")
+
+
+def _iter_latest_index_records(index_file: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the latest index record of each AST file that still exists.
+
+    The index is read twice: first to find the last line recorded for each AST
+    file (they are overwritten on re-runs), then to yield those records, so only
+    line numbers are held in memory.
 
     Args:
-        chunks_dir: Repository-specific chunks directory containing AST files
+        index_file: Path to the NDJSON index
 
-    Returns:
-        Overview dictionary
+    Yields:
+        Index records, each with its 'ast_file' name
     """
-    ast_dir = chunks_dir / "ast_trees"
+    latest: Dict[str, int] = {}
+    for line_number, record in _iter_index_records(index_file):
+        latest[record["ast_file"]] = line_number
+
+    ast_dir = index_file.parent
+    for line_number, record in _iter_index_records(index_file, log_errors=False):
+        ast_file = record["ast_file"]
+        if latest.get(ast_file) == line_number and (ast_dir / ast_file).exists():
+            yield record
 
-    if not ast_dir.exists():
-        return {
-            "error": "No AST directory found",
-            "note": "AST directory is created when --save-ast flag is used during chunking",
-        }
 
-    overview = {
+def _iter_overview_index(index_file: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Yield overview entries from the NDJSON index, keeping the latest per AST file.
+
+    Args:
+        index_file: Path to the NDJSON index
+
+    Yields:
+        Overview entries
+    """
+    for record in _iter_latest_index_records(index_file):
+        del record["ast_file"]
+        yield record
+
+
+def _load_overview_entry(ast_file: Path) -> Optional[Dict[str, Any]]:
+    """Load one AST file and build its overview entry (None if unreadable)."""
+    try:
+        return _overview_entry(load_json(ast_file))
+    except Exception as e:
+        logger.info(f"Error reading {ast_file}: {e}")
+        return None
+
+
+def _scan_overview_entries(ast_dir: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Yield overview entries by loading every AST file in the directory.
+
+    Files are read and parsed on a thread pool since the work is I/O-bound.
+
+    Args:
+        ast_dir: Directory containing AST files
+
+    Yields:
+        Overview entries
+    """
+    ast_files = [
+        ast_file
+        for ast_file in ast_dir.glob("*_ast.json")
+        if not ast_file.name.endswith("_full_ast.json")
+    ]
+
+    with ThreadPoolExecutor(max_workers=_OVERVIEW_READ_WORKERS) as executor:
+        for entry in executor.map(_load_overview_entry, ast_files):
+            if entry is not None:
+                yield entry
+
+
+def _iter_overview_entries(ast_dir: Path) -> Iterator[Dict[str, Any]]:
+    """Yield overview entries from the index, or by scanning AST files without one."""
+    index_file = ast_dir / AST_INDEX_FILE
+    if index_file.exists():
+        return _iter_overview_index(index_file)
+    return _scan_overview_entries(ast_dir)
+
+
+def _missing_ast_dir_overview() -> Dict[str, Any]:
+    """Overview returned when no AST directory exists."""
+    return {
+        "error": "No AST directory found",
+        "note": "AST directory is created when --save-ast flag is used during chunking",
+    }
+
+
+def _new_overview_totals() -> Dict[str, Any]:
+    """Create empty overview aggregates."""
+    return {
         "total_files": 0,
         "languages": {},
         "total_nodes_extracted": 0,
@@ -275,48 +584,50 @@ def create_ast_overview(chunks_dir: Path) -> Dict[str, Any]:
         "tree_sitter_available": False,
         "fallback_files": 0,
         "real_ast_files": 0,
-        "files": [],
     }
 
-    for ast_file in ast_dir.glob("*_ast.json"):
-        try:
-            with open(ast_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
 
-            lang = data["file_info"]["language"]
-            overview["languages"][lang] = overview["languages"].get(lang, 0) + 1
-            overview["total_files"] += 1
-            overview["total_nodes_extracted"] += len(data["extracted_nodes"])
+def _add_overview_entry(totals: Dict[str, Any], entry: Dict[str, Any]) -> None:
+    """Fold one file's overview entry into the aggregates."""
+    lang = entry["language"]
+    totals["languages"][lang] = totals["languages"].get(lang, 0) + 1
+    totals["total_files"] += 1
+    totals["total_nodes_extracted"] += entry["extracted_nodes"]
 
-            # Check if this file used real AST or fallback
-            tree_info = data.get("tree_info", {})
-            has_ast = tree_info.get("has_ast", False)
+    # Check if this file used real AST or fallback
+    if entry["has_real_ast"]:
+        totals["real_ast_files"] += 1
+        totals["tree_sitter_available"] = True
+        totals["total_ast_nodes"] += entry["ast_nodes"]
+    else:
+        totals["fallback_files"] += 1
 
-            if has_ast:
-                overview["real_ast_files"] += 1
-                overview["tree_sitter_available"] = True
-                overview["total_ast_nodes"] += data["ast_summary"]["total_nodes"]
-            else:
-                overview["fallback_files"] += 1
-
-            overview["files"].append(
-                {
-                    "file": data["file_info"]["path"],
-                    "language": lang,
-                    "ast_nodes": data["ast_summary"]["total_nodes"] if has_ast else 0,
-                    "extracted_nodes": len(data["extracted_nodes"]),
-                    "tree_depth": data["ast_summary"].get("max_depth", 0)
-                    if has_ast
-                    else 0,
-                    "has_real_ast": has_ast,
-                    "fallback_reason": tree_info.get("fallback_reason")
-                    if not has_ast
-                    else None,
-                }
-            )
 
-        except Exception as e:
-            logger.info(f"Error reading {ast_file}: {e}")
+def create_ast_overview(chunks_dir: Path) -> Dict[str, Any]:
+    """
+    Create an overview of all AST files in the chunks directory.
+
+    Uses the NDJSON index written by save_ast_visualization when present and
+    falls back to loading every AST file otherwise.
+
+    Args:
+        chunks_dir: Repository-specific chunks directory containing AST files
+
+    Returns:
+        Overview dictionary
+    """
+    flush_ast_writes()
+    ast_dir = chunks_dir / "ast_trees"
+
+    if not ast_dir.exists():
+        return _missing_ast_dir_overview()
+
+    overview = _new_overview_totals()
+    overview["files"] = []
+
+    for entry in _iter_overview_entries(ast_dir):
+        _add_overview_entry(overview, entry)
+        overview["files"].append(entry)
 
     return overview
 
@@ -325,23 +636,70 @@ def save_ast_overview(chunks_dir: Path):
     """
     Save AST overview to a summary file.
 
+    Per-file entries are streamed into the file as they are read, so the
+    overview is never held in memory as a whole; the aggregates follow them.
+    The NDJSON index is rewritten at the same time with only the latest record
+    of each existing AST file, so it does not grow across runs.
+
     Args:
         chunks_dir: Repository-specific chunks directory
-    """
-    overview = create_ast_overview(chunks_dir)
 
+    Returns:
+        Overview aggregates (without the per-file entries)
+    """
+    flush_ast_writes()
     ast_dir = chunks_dir / "ast_trees"
-    ast_dir.mkdir(parents=True, exist_ok=True)  # Ensure directory exists
     overview_file = ast_dir / "ast_overview.json"
 
-    with open(overview_file, "w", encoding="utf-8") as f:
-        json.dump(overview, f, indent=2, ensure_ascii=False)
+    if not ast_dir.exists():
+        ast_dir.mkdir(parents=True, exist_ok=True)
+        overview = _missing_ast_dir_overview()
+        dump_json(overview, overview_file)
+        logger.info(f"📈 AST overview saved: {overview_file}")
+        return overview
+
+    totals = _new_overview_totals()
+    tmp_file = overview_file.with_name(overview_file.name + ".tmp")
+    index_file = ast_dir / AST_INDEX_FILE
+    index_tmp_file = index_file.with_name(index_file.name + ".tmp")
+    has_index = index_file.exists()
+
+    try:
+        with (
+            open(tmp_file, "wb") as f,
+            open(index_tmp_file, "wb") if has_index else nullcontext() as index_out,
+        ):
+            f.write(b'{\n  "files": [')
+            separator = b"\n    "
+            entries = (
+                _iter_latest_index_records(index_file)
+                if has_index
+                else _scan_overview_entries(ast_dir)
+            )
+            for entry in entries:
+                if index_out is not None:
+                    index_out.write(dumps_json(entry, indent=False) + b"\n")
+                    del entry["ast_file"]
+                _add_overview_entry(totals, entry)
+                f.write(separator + dumps_json(entry, indent=False))
+                separator = b",\n    "
+            f.write(b"\n  ],")
+            # Splice the aggregates in as the remaining members of the object
+            f.write(dumps_json(totals)[1:])
+        os.replace(tmp_file, overview_file)
+        if has_index:
+            os.replace(index_tmp_file, index_file)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        index_tmp_file.unlink(missing_ok=True)
+        raise
 
     logger.info(f"📈 AST overview saved: {overview_file}")
-    return overview
+    return totals
 
 
 __all__ = [
+    "flush_ast_writes",
     "save_ast_overview",
     "save_ast_visualization",
     "serialize_node",
@@ -5,38 +5,71 @@ This module provides the main chunking functionality that orchestrates
 file discovery, AST parsing, node collection, and chunk splitting.
 """
 
-import json
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from multiprocessing import cpu_count
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 # Lazy import ast_parser to avoid slow tree-sitter loading
 from .file_discovery import discover_files
 from ..config import CHUNKS_DIR, MAX_TOKENS, get_storage_path
 from ..utils import ProgressTracker, logger
+from ..utils.json_utils import dump_json, load_json
 
 
-def _process_file(
-    file_path: Path, repo_path: Path, max_tokens: int
-) -> Tuple[List[Dict[str, Any]], Optional[str]]:
-    """Process single file (for parallel execution)."""
+# Worker-local references populated by _pool_init (imports happen once per worker)
+_parse_file = None
+_collector = None
+_split_chunk = None
+_flush_ast_writes = None
+
+
+def _pool_init() -> None:
+    """Import the parsing pipeline and create a collector once per worker process."""
+    global _parse_file, _collector, _split_chunk, _flush_ast_writes
     from .ast_parser import parse_file
+    from .ast_visualizer import flush_ast_writes
     from .node_collector import NodeCollector
     from .splitter import split_chunk
 
+    _parse_file = parse_file
+    _collector = NodeCollector()
+    _split_chunk = split_chunk
+    _flush_ast_writes = flush_ast_writes
+
+
+def _process_file(
+    file_path: Path,
+    repo_path: Path,
+    max_tokens: int,
+    save_ast: bool = False,
+    chunks_dir: Optional[Path] = None,
+    save_full_ast: bool = False,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Process single file (for parallel execution)."""
+    if _parse_file is None:
+        _pool_init()
+
     try:
-        parsed = parse_file(file_path, save_ast=False, repo_path=repo_path)
+        parsed = _parse_file(
+            file_path,
+            save_ast=save_ast,
+            chunks_dir=chunks_dir,
+            repo_path=repo_path,
+            save_full_ast=save_full_ast,
+        )
         if not parsed:
             return [], None
 
-        collector = NodeCollector()
-        chunks = collector.collect_nodes(parsed)
+        # Files are deduplicated independently, as workers see arbitrary file subsets
+        _collector.reset()
+        chunks = _collector.collect_nodes(parsed)
 
         all_chunks = []
         for chunk in chunks:
             try:
-                split_chunks = split_chunk(chunk, max_tokens)
+                split_chunks = _split_chunk(chunk, max_tokens)
                 all_chunks.extend(split_chunks)
             except Exception:
                 all_chunks.append(chunk)
@@ -44,6 +77,11 @@ def _process_file(
         return all_chunks, None
     except Exception as e:
         return [], str(file_path)
+    finally:
+        # AST files are written in the background; the worker may exit after
+        # this task, so they must be on disk before returning
+        if save_ast:
+            _flush_ast_writes()
 
 
 def chunk_repository(
@@ -55,6 +93,8 @@ def chunk_repository(
     save_ast: bool = False,
     custom_chunks_dir: Optional[str] = None,
     use_parallel: bool = True,
+    save_full_ast: bool = False,
+    on_chunks: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
 ) -> List[Dict[str, Any]]:
     """
     Chunk a repository into semantic units using AST parsing.
@@ -67,6 +107,10 @@ def chunk_repository(
         output_dir: Optional output directory
         save_ast: Whether to save AST visualization data
         use_parallel: Use parallel processing (default: True)
+        save_full_ast: Also save the serialized AST tree per file (with save_ast)
+        on_chunks: Optional callback receiving each file's chunks as soon as
+            they are produced, so consumers can start before chunking ends;
+            an exception it raises stops chunking and is propagated
 
     Returns:
         List of chunk dictionaries
@@ -117,18 +161,31 @@ def chunk_repository(
         progress = ProgressTracker(len(files), "Chunking files")
 
         max_workers = max(1, cpu_count() - 1)
-        with ProcessPoolExecutor(max_workers=max_workers) as executor:
-            futures = {
-                executor.submit(_process_file, f, repo_path, max_tokens): f
-                for f in files
-            }
-
-            for future in as_completed(futures):
-                chunks, error = future.result()
-                all_chunks.extend(chunks)
-                if error:
-                    failed_files.append(error)
-                progress.update()
+        # Batch files per task to amortize pickling/IPC over many small files
+        batch_size = max(1, len(files) // (max_workers * 4))
+        worker = partial(
+            _process_file,
+            repo_path=repo_path,
+            max_tokens=max_tokens,
+            save_ast=save_ast,
+            chunks_dir=chunks_dir,
+            save_full_ast=save_full_ast,
+        )
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_pool_init
+        ) as executor:
+            try:
+                for chunks, error in executor.map(worker, files, chunksize=batch_size):
+                    all_chunks.extend(chunks)
+                    if on_chunks and chunks:
+                        on_chunks(chunks)
+                    if error:
+                        failed_files.append(error)
+                    progress.update()
+            except BaseException:
+                # Don't wait for files still queued when the consumer gave up
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
 
         progress.finish()
     else:
@@ -142,12 +199,14 @@ def chunk_repository(
         progress = ProgressTracker(len(files), "Chunking files")
 
         for file_path in files:
+            file_start = len(all_chunks)
             try:
                 parsed = parse_file(
                     file_path,
                     save_ast=save_ast,
                     chunks_dir=chunks_dir,
                     repo_path=repo_path,
+                    save_full_ast=save_full_ast,
                 )
                 if not parsed:
                     progress.update()
@@ -168,6 +227,10 @@ def chunk_repository(
             finally:
                 progress.update()
 
+            # Outside the per-file handler, so callback errors stop chunking
+            if on_chunks and len(all_chunks) > file_start:
+                on_chunks(all_chunks[file_start:])
+
         progress.finish()
 
     if failed_files:
@@ -229,8 +292,7 @@ def save_chunks(
         },
     }
 
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    dump_json(data, output_file)
 
     logger.info(f"\n✅ Chunks saved to {output_file}")
     return output_file
@@ -248,8 +310,7 @@ def load_chunks(base_dir: Union[str, Path], repo_name: str) -> List[Dict[str, An
 
     logger.info(f"📂 Loading chunks from {chunks_file}")
 
-    with open(chunks_file, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = load_json(chunks_file)
 
     if isinstance(data, list):
         return data
@@ -38,37 +38,47 @@ def build_context(chunk: Dict[str, Any]) -> str:
     if not isinstance(chunk, dict):
         raise TypeError("Chunk must be a dictionary")
 
+    return "\n".join(_context_parts(chunk))
+
+
+def _context_parts(chunk: Dict[str, Any]) -> List[str]:
+    """Build the context lines for a chunk, reading each field once."""
+    get = chunk.get
+    parent_name = get("parent_name")
+    file_path = get("file_path")
+    language = get("language")
+    node_type = get("node_type")
+    node_name = get("node_name")
+    start_line = get("start_line")
+    end_line = get("end_line")
+
     context_parts: List[str] = []
 
     # Add parent context first if available
-    if chunk.get("parent_id") and chunk.get("parent_name"):
-        parent_type = chunk.get("parent_type", "unknown")
-        parent_name = chunk.get("parent_name")
-        context_parts.append(f"Parent: {parent_name} ({parent_type})")
+    if parent_name and get("parent_id"):
+        context_parts.append(f"Parent: {parent_name} ({get('parent_type', 'unknown')})")
 
     # Add file path
-    if "file_path" in chunk and chunk["file_path"]:
-        context_parts.append(f"File: {chunk['file_path']}")
+    if file_path:
+        context_parts.append(f"File: {file_path}")
 
     # Add language
-    if "language" in chunk and chunk["language"]:
-        context_parts.append(f"Language: {chunk['language']}")
+    if language:
+        context_parts.append(f"Language: {language}")
 
     # Add node type (function, class, etc.)
-    if "node_type" in chunk and chunk["node_type"]:
-        context_parts.append(f"Type: {chunk['node_type']}")
+    if node_type:
+        context_parts.append(f"Type: {node_type}")
 
     # Add symbol name if available
-    if "node_name" in chunk and chunk["node_name"]:
-        context_parts.append(f"Symbol: {chunk['node_name']}")
+    if node_name:
+        context_parts.append(f"Symbol: {node_name}")
 
     # Add line range
-    start_line = chunk.get("start_line")
-    end_line = chunk.get("end_line")
     if start_line is not None and end_line is not None:
         context_parts.append(f"Lines: {start_line}-{end_line}")
 
-    return "\n".join(context_parts) if context_parts else ""
+    return context_parts
 
 
 def build_enriched_content(chunk: Dict[str, Any], content: str) -> str:
@@ -108,14 +118,48 @@ def build_enriched_content(chunk: Dict[str, Any], content: str) -> str:
         >>> 'authenticate_user' in result
         True
     """
-    context = build_context(chunk)
+    if not isinstance(chunk, dict):
+        raise TypeError("Chunk must be a dictionary")
+
+    context_parts = _context_parts(chunk)
 
-    if not context:
+    if not context_parts:
         # No context available, return content as-is
         return content
 
-    # Combine context and content with clear separation
-    return f"{context}\n\n{content}"
+    # Combine context and content with a blank line between, in a single join
+    context_parts.append("")
+    context_parts.append(content)
+    return "\n".join(context_parts)
+
+
+def build_enrichment_prefix(chunk: Dict[str, Any]) -> str:
+    """
+    Build the text that build_enriched_content places before the content.
+
+    ``build_enriched_content(chunk, content)`` equals
+    ``build_enrichment_prefix(chunk) + content``, so callers enriching several
+    contents with the same metadata (such as the splits of one chunk) can
+    build the context once.
+
+    Args:
+        chunk: Chunk dictionary containing metadata
+
+    Returns:
+        Context lines followed by a blank line, or "" if there is no context
+
+    Raises:
+        TypeError: If chunk is not a dictionary
+    """
+    if not isinstance(chunk, dict):
+        raise TypeError("Chunk must be a dictionary")
+
+    context_parts = _context_parts(chunk)
+
+    if not context_parts:
+        return ""
+
+    return "\n".join(context_parts) + "\n\n"
 
 
-__all__ = ["build_context", "build_enriched_content"]
+__all__ = ["build_context", "build_enriched_content", "build_enrichment_prefix"]
@@ -7,14 +7,27 @@ dependencies, and other non-source files.
 """
 
 import os
-from fnmatch import fnmatch
+import re
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import translate
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Callable, FrozenSet, Iterator, List, Optional, Pattern, Tuple, Union
 
 from ..config import DEFAULT_IGNORE_PATTERNS, SUPPORTED_EXTENSIONS
 from ..utils.logger import logger
 
 
+# fnmatch compares os.path.normcase'd names, which is case-insensitive on Windows
+_PATTERN_FLAGS = re.IGNORECASE if os.name == "nt" else 0
+
+# Upper bound on threads walking top-level directories concurrently
+_DISCOVERY_WORKERS = 8
+
+# Supported extensions (".py") and exact file names ("Dockerfile")
+_SUPPORTED_KEYS: FrozenSet[str] = frozenset(SUPPORTED_EXTENSIONS)
+
+
 def discover_files(
     repo_path: Union[str, Path], ignore_patterns: Optional[List[str]] = None
 ) -> List[Path]:
@@ -36,7 +49,31 @@ def discover_files(
         ValidationError: If repo_path doesn't exist or is not a directory
         FileSystemError: If unable to access repository directory
     """
-    from ..utils.exceptions import ValidationError, FileSystemError
+    return list(iter_discover_files(repo_path, ignore_patterns))
+
+
+def iter_discover_files(
+    repo_path: Union[str, Path], ignore_patterns: Optional[List[str]] = None
+) -> Iterator[Path]:
+    """
+    Lazily discover supported code files in the repository.
+
+    Same as discover_files, but files are yielded as each part of the tree is
+    walked so callers can start processing before discovery finishes.
+    repo_path is validated immediately; scan errors surface while iterating.
+
+    Args:
+        repo_path: Path to the repository to scan
+        ignore_patterns: Additional patterns to ignore (extends default patterns)
+
+    Returns:
+        Iterator of Path objects for supported files
+
+    Raises:
+        ValidationError: If repo_path doesn't exist or is not a directory
+        FileSystemError: If unable to access repository directory
+    """
+    from ..utils.exceptions import ValidationError
 
     repo_path = Path(repo_path)
 
@@ -56,56 +93,57 @@ def discover_files(
         # Extend default patterns with custom ones
         ignore_patterns = DEFAULT_IGNORE_PATTERNS + ignore_patterns
 
-    files = []
+    # Compile patterns once per pattern set rather than on every match
+    literals, combined = _compile_patterns(tuple(ignore_patterns))
+
+    return _iter_files(repo_path, literals, combined)
+
+
+def _iter_files(
+    repo_path: Path, literals: FrozenSet[str], combined: Optional[Pattern[str]]
+) -> Iterator[Path]:
+    """
+    Yield supported files under repo_path, logging totals once exhausted.
+
+    Args:
+        repo_path: Validated repository path
+        literals: Literal ignore patterns
+        combined: Fused wildcard ignore regex
+
+    Yields:
+        Path objects for supported files
+    """
+    from ..utils.exceptions import FileSystemError
+
+    found_count = 0
     ignored_count = 0
     permission_errors = []
 
     logger.debug(f"Scanning repository: {repo_path}")
     logger.debug(f"Supported extensions: {list(SUPPORTED_EXTENSIONS.keys())}")
 
+    # Relative paths are sliced off DirEntry.path instead of using relative_to
+    repo_prefix_len = len(os.path.join(str(repo_path), ""))
+
     try:
-        # Handle permission errors gracefully, continue scanning
-        for root, dirs, filenames in os.walk(repo_path):
-            try:
-                # Filter out ignored directories in-place to prevent traversal
-                original_dirs = dirs.copy()
-                dirs[:] = [d for d in dirs if not _should_ignore(d, ignore_patterns)]
-
-                # Log ignored directories for debugging
-                ignored_dirs = set(original_dirs) - set(dirs)
-                if ignored_dirs:
-                    logger.debug(f"Ignoring directories in {root}: {ignored_dirs}")
-
-                # Process files in current directory
-                for filename in filenames:
-                    try:
-                        file_path = Path(root) / filename
-
-                        # Check if file extension is supported
-                        if (
-                            file_path.suffix in SUPPORTED_EXTENSIONS
-                            or filename in SUPPORTED_EXTENSIONS
-                        ):
-                            # Check if file should be ignored
-                            relative_path = str(file_path.relative_to(repo_path))
-                            if not _should_ignore(relative_path, ignore_patterns):
-                                # File is valid - os.walk already confirms existence
-                                # No need for additional stat() call
-                                files.append(file_path)
-                                logger.debug(f"Found supported file: {relative_path}")
-                            else:
-                                ignored_count += 1
-                                logger.debug(f"Ignoring file: {relative_path}")
-
-                    except Exception as e:
-                        # Log individual file errors and continue
-                        logger.debug(f"Error processing file {filename}: {e}")
-                        continue
-
-            except (PermissionError, OSError) as e:
-                # Log directory access errors and continue
-                logger.warning(f"Cannot access directory {root}: {e}")
-                continue
+        files, ignored_count, top_dirs = _scan_directory(
+            str(repo_path), repo_prefix_len, literals, combined
+        )
+        found_count += len(files)
+        yield from files
+
+        # Walk top-level subtrees concurrently (scandir releases the GIL);
+        # results are yielded in listing order so the output stays deterministic
+        walk = partial(
+            _walk_subtree,
+            repo_prefix_len=repo_prefix_len,
+            literals=literals,
+            combined=combined,
+        )
+        for subtree_files, subtree_ignored in _map_subtrees(walk, top_dirs):
+            found_count += len(subtree_files)
+            ignored_count += subtree_ignored
+            yield from subtree_files
 
     except Exception as e:
         raise FileSystemError(
@@ -122,12 +160,175 @@ def discover_files(
         )
 
     logger.info(
-        f"File discovery complete: {len(files)} files found, {ignored_count} files ignored"
+        f"File discovery complete: {found_count} files found, {ignored_count} files ignored"
     )
-    return files
 
 
-def _should_ignore(path: str, patterns: List[str]) -> bool:
+def _map_subtrees(
+    walk: Callable[[str], Tuple[List[Path], int]], top_dirs: List[str]
+) -> Iterator[Tuple[List[Path], int]]:
+    """Apply walk to each top-level directory, on threads when there are several."""
+    if len(top_dirs) < 2:
+        yield from map(walk, top_dirs)
+        return
+
+    workers = min(_DISCOVERY_WORKERS, os.cpu_count() or 1, len(top_dirs))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(walk, top_dirs)
+
+
+def _scan_directory(
+    root: str,
+    repo_prefix_len: int,
+    literals: FrozenSet[str],
+    combined: Optional[Pattern[str]],
+) -> Tuple[List[Path], int, List[str]]:
+    """
+    Scan a single directory for supported files and traversable subdirectories.
+
+    DirEntry caches the type information readdir returned, so classifying
+    entries needs no extra stat() calls.
+
+    Args:
+        root: Directory to scan
+        repo_prefix_len: Length of the repository path prefix in entry paths
+        literals: Literal ignore patterns
+        combined: Fused wildcard ignore regex
+
+    Returns:
+        Tuple of (supported files, ignored file count, subdirectories to visit)
+    """
+    files: List[Path] = []
+    ignored_count = 0
+    subdirs: List[str] = []
+
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except (PermissionError, OSError) as e:
+        # Log directory access errors and continue
+        logger.warning(f"Cannot access directory {root}: {e}")
+        return files, ignored_count, subdirs
+
+    # With nothing to match, skip the per-path _should_ignore calls entirely
+    ignore_enabled = bool(literals) or combined is not None
+    ignored_dirs = []
+
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+
+        if not is_dir:
+            try:
+                filename = entry.name
+                # Same rule as Path.suffix: no suffix for dotfiles or a trailing dot
+                dot = filename.rfind(".")
+                ext = filename[dot:] if 0 < dot < len(filename) - 1 else ""
+
+                # Check if file extension is supported
+                if ext in _SUPPORTED_KEYS or filename in _SUPPORTED_KEYS:
+                    # Check if file should be ignored
+                    relative_path = entry.path[repo_prefix_len:]
+                    if not ignore_enabled or not _should_ignore_file(
+                        relative_path, filename, literals, combined
+                    ):
+                        # The directory listing already confirms existence
+                        files.append(Path(entry.path))
+                        logger.debug(f"Found supported file: {relative_path}")
+                    else:
+                        ignored_count += 1
+                        logger.debug(f"Ignoring file: {relative_path}")
+
+            except Exception as e:
+                # Log individual file errors and continue
+                logger.debug(f"Error processing file {entry.name}: {e}")
+            continue
+
+        # Skip ignored directories to prevent traversal; like os.walk,
+        # symlinked directories are listed but not followed
+        if ignore_enabled and _should_ignore(entry.name, literals, combined):
+            ignored_dirs.append(entry.name)
+        elif not entry.is_symlink():
+            subdirs.append(entry.path)
+
+    # Log ignored directories for debugging
+    if ignored_dirs:
+        logger.debug(f"Ignoring directories in {root}: {ignored_dirs}")
+
+    return files, ignored_count, subdirs
+
+
+def _walk_subtree(
+    top: str,
+    repo_prefix_len: int,
+    literals: FrozenSet[str],
+    combined: Optional[Pattern[str]],
+) -> Tuple[List[Path], int]:
+    """
+    Walk a directory tree top-down, in the same order as os.walk.
+
+    Args:
+        top: Root of the subtree
+        repo_prefix_len: Length of the repository path prefix in entry paths
+        literals: Literal ignore patterns
+        combined: Fused wildcard ignore regex
+
+    Returns:
+        Tuple of (supported files, ignored file count)
+    """
+    files: List[Path] = []
+    ignored_count = 0
+
+    pending = [top]
+    while pending:
+        dir_files, dir_ignored, subdirs = _scan_directory(
+            pending.pop(), repo_prefix_len, literals, combined
+        )
+        files.extend(dir_files)
+        ignored_count += dir_ignored
+        # Reversed so subdirectories are visited in listing order
+        pending.extend(reversed(subdirs))
+
+    return files, ignored_count
+
+
+@lru_cache(maxsize=32)
+def _compile_patterns(
+    patterns: Tuple[str, ...]
+) -> Tuple[FrozenSet[str], Optional[Pattern[str]]]:
+    """
+    Split ignore patterns into literal names and one fused glob regex.
+
+    All wildcard patterns are joined into a single alternation so each path is
+    scanned by the regex engine once rather than once per pattern.
+
+    Args:
+        patterns: Ignore patterns
+
+    Returns:
+        Tuple of (literal path components, combined wildcard regex or None)
+    """
+    literals = set()
+    wildcards = []
+
+    for pattern in patterns:
+        # Normalize pattern separators
+        normalized_pattern = pattern.replace("\\", "/")
+
+        if any(c in normalized_pattern for c in "*?["):
+            wildcards.append(f"(?:{translate(normalized_pattern)})")
+        else:
+            literals.add(normalized_pattern)
+
+    combined = re.compile("|".join(wildcards), _PATTERN_FLAGS) if wildcards else None
+    return frozenset(literals), combined
+
+
+def _should_ignore(
+    path: str, literals: FrozenSet[str], combined: Optional[Pattern[str]]
+) -> bool:
     """
     Check if path matches any ignore pattern.
 
@@ -136,12 +337,14 @@ def _should_ignore(path: str, patterns: List[str]) -> bool:
 
     Args:
         path: File or directory path to check
-        patterns: List of ignore patterns
+        literals: Non-wildcard patterns, matched against whole path components
+        combined: Fused wildcard regex, matched against the path and each of
+                  its components
 
     Returns:
         True if path should be ignored, False otherwise
     """
-    if not path or not patterns:
+    if not path or not (literals or combined):
         return False
 
     # Normalize path separators for cross-platform compatibility (done once)
@@ -149,34 +352,52 @@ def _should_ignore(path: str, patterns: List[str]) -> bool:
     # Split path once for component matching
     path_parts = normalized_path.split("/")
 
-    for pattern in patterns:
-        # Normalize pattern separators
-        normalized_pattern = pattern.replace("\\", "/")
+    # Non-wildcard patterns only match exact path components
+    # This prevents "out" from matching "routes"
+    if literals and not literals.isdisjoint(path_parts):
+        return True
 
-        # Check if pattern has wildcards before doing expensive fnmatch
-        has_wildcards = (
-            "*" in normalized_pattern
-            or "?" in normalized_pattern
-            or "[" in normalized_pattern
-        )
+    if combined is None:
+        return False
 
-        if has_wildcards:
-            # Try glob-style matching on full path
-            if fnmatch(normalized_path, normalized_pattern):
-                return True
+    # Try glob-style matching on full path, then on each path component
+    return bool(combined.match(normalized_path)) or any(
+        combined.match(part) for part in path_parts
+    )
 
-            # Check if any path component matches the pattern
-            if any(fnmatch(part, normalized_pattern) for part in path_parts):
-                return True
-        else:
-            # For non-wildcard patterns, only match exact path components
-            # This prevents "out" from matching "routes"
-            if any(part == normalized_pattern for part in path_parts):
-                return True
 
-    return False
+def _should_ignore_file(
+    relative_path: str,
+    filename: str,
+    literals: FrozenSet[str],
+    combined: Optional[Pattern[str]],
+) -> bool:
+    """
+    Check if a file found during discovery matches any ignore pattern.
+
+    Equivalent to ``_should_ignore(relative_path, ...)`` for files whose parent
+    directories were not pruned: those directory components already failed
+    every pattern, so only the file name components and the full path are
+    matched.
+
+    Args:
+        relative_path: Repository-relative file path
+        filename: File name (last component of relative_path)
+        literals: Non-wildcard patterns, matched against whole path components
+        combined: Fused wildcard regex
+
+    Returns:
+        True if the file should be ignored, False otherwise
+    """
+    if _should_ignore(filename, literals, combined):
+        return True
+
+    return combined is not None and bool(
+        combined.match(relative_path.replace("\\", "/"))
+    )
 
 
 __all__ = [
     "discover_files",
+    "iter_discover_files",
 ]
@@ -5,6 +5,8 @@ This module provides functionality to collect and deduplicate AST nodes
 from parsed files, tracking duplicate code across the codebase.
 """
 
+import sys
+from collections import defaultdict
 from typing import Any, Dict, List, Optional, Set
 
 from .context_builder import build_enriched_content
@@ -24,7 +26,13 @@ class NodeCollector:
         """Initialize the node collector with empty state."""
         self.seen_hashes: Set[str] = set()
         self.chunks: List[Dict[str, Any]] = []
-        self.duplicate_locations: Dict[str, List[str]] = {}
+        self.duplicate_locations: Dict[str, List[str]] = defaultdict(list)
+
+    def reset(self) -> None:
+        """Clear collected chunks and deduplication state for reuse."""
+        self.seen_hashes.clear()
+        self.chunks.clear()
+        self.duplicate_locations.clear()
 
     def collect_nodes(self, parsed_file: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
@@ -51,20 +59,28 @@ class NodeCollector:
             return []
 
         collected = []
-        file_path = parsed_file.get("file_path", "unknown")
-        language = parsed_file.get("language", "unknown")
+        # Interned so every chunk shares one string per distinct value
+        file_path = sys.intern(parsed_file.get("file_path", "unknown"))
+        language = sys.intern(parsed_file.get("language", "unknown"))
 
         for node in parsed_file["nodes"]:
             try:
                 content = node["content"]
                 content_hash = hash_content(content)
 
+                if content_hash in self.seen_hashes:
+                    # Duplicate found - track location without building the chunk
+                    location = f"{file_path}:{node['start_line']}-{node['end_line']}"
+                    self.duplicate_locations[content_hash].append(location)
+                    logger.debug(f"Duplicate code found: {location}")
+                    continue
+
                 # Create chunk metadata first (needed for building enriched content)
                 chunk_metadata = {
                     "file_path": file_path,
                     "language": language,
                     "hash": content_hash,
-                    "node_type": node["type"],
+                    "node_type": sys.intern(node["type"]),
                     "node_name": node.get("name"),
                     "start_line": node["start_line"],
                     "end_line": node["end_line"],
@@ -78,6 +94,10 @@ class NodeCollector:
                 if "cell_type" in node:
                     chunk_metadata["cell_type"] = node["cell_type"]
 
+                parent_type = node["parent_type"]
+                if parent_type is not None:
+                    parent_type = sys.intern(parent_type)
+
                 # Build enriched content for better semantic search
                 # This combines context metadata with code for embedding
                 enriched_content = build_enriched_content(chunk_metadata, content)
@@ -89,27 +109,18 @@ class NodeCollector:
                     **chunk_metadata,
                     "id": node["id"],
                     "parent_id": node["parent_id"],
-                    "parent_type": node["parent_type"],
+                    "parent_type": parent_type,
                     "parent_name": node["parent_name"],
                     "children_ids": node["children_ids"],
                     "is_parent": node["is_parent"],
                 }
 
-                # Track location for duplicate analysis
+                # New unique chunk - track location for duplicate analysis
                 location = f"{file_path}:{node['start_line']}-{node['end_line']}"
-
-                if content_hash in self.seen_hashes:
-                    # Duplicate found - track location
-                    if content_hash not in self.duplicate_locations:
-                        self.duplicate_locations[content_hash] = []
-                    self.duplicate_locations[content_hash].append(location)
-                    logger.debug(f"Duplicate code found: {location}")
-                else:
-                    # New unique chunk
-                    self.seen_hashes.add(content_hash)
-                    chunk["locations"] = [location]
-                    self.chunks.append(chunk)
-                    collected.append(chunk)
+                self.seen_hashes.add(content_hash)
+                chunk["locations"] = [location]
+                self.chunks.append(chunk)
+                collected.append(chunk)
 
             except (KeyError, TypeError) as e:
                 logger.warning(f"Skipping malformed node in {file_path}: {e}")
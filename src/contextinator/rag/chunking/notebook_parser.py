@@ -6,11 +6,13 @@ semantic code chunks from individual cells, using Tree-sitter parsers for
 code and markdown cells.
 """
 
-import uuid
+import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from ..utils.json_utils import loads_json
 from ..utils.logger import logger
+from ..utils.repo_utils import repo_relative_path
 
 # Lazy import for nbformat to avoid startup delay
 _nbformat = None
@@ -31,6 +33,40 @@ def _get_nbformat() -> Any:
     return _nbformat
 
 
+def _load_cells(file_path: Path) -> List[Dict[str, Any]]:
+    """
+    Load the cells of a notebook file.
+
+    Only cell types and sources are used, so nbformat 4 notebooks are decoded
+    directly with loads_json (orjson when installed), skipping nbformat's
+    schema validation. Older formats are upgraded through nbformat.
+
+    Args:
+        file_path: Path to the .ipynb file
+
+    Returns:
+        List of cell dictionaries in nbformat 4 layout
+
+    Raises:
+        ImportError: If the notebook needs upgrading and nbformat is missing
+        OSError: If the file cannot be read
+        ValueError: If the file is not valid JSON
+    """
+    with open(file_path, "rb") as f:
+        raw = f.read()
+
+    nb = loads_json(raw)
+    if (
+        isinstance(nb, dict)
+        and nb.get("nbformat", 0) >= 4
+        and isinstance(nb.get("cells"), list)
+    ):
+        return nb["cells"]
+
+    nbformat = _get_nbformat()
+    return nbformat.reads(raw.decode("utf-8"), as_version=4).cells
+
+
 def parse_notebook(
     file_path: Path, repo_path: Optional[Path] = None
 ) -> Optional[Dict[str, Any]]:
@@ -55,8 +91,7 @@ def parse_notebook(
     # Compute repo-relative path with forward slashes for cross-platform compatibility
     if repo_path:
         try:
-            relative_path = file_path.relative_to(repo_path)
-            file_path_str = relative_path.as_posix()
+            file_path_str = repo_relative_path(file_path, repo_path)
         except ValueError:
             logger.warning(
                 f"File {file_path} is not within repo {repo_path}, using absolute path"
@@ -68,9 +103,7 @@ def parse_notebook(
     try:
         # Read the notebook file
         try:
-            nbformat = _get_nbformat()
-            with open(file_path, "r", encoding="utf-8") as f:
-                nb = nbformat.read(f, as_version=4)
+            cells = _load_cells(file_path)
         except ImportError:
             # nbformat not available - fallback to JSON parsing
             return _fallback_notebook_parse(file_path, file_path_str)
@@ -82,33 +115,39 @@ def parse_notebook(
             logger.warning(f"Failed to parse notebook {file_path}: {e}")
             return _fallback_notebook_parse(file_path, file_path_str)
 
+        # Look up the cell parsers once per notebook rather than once per cell
+        from .ast_parser import get_parser
+
+        python_parser = get_parser("python")
+        markdown_parser = get_parser("markdown")
+
         nodes: List[Dict[str, Any]] = []
-        all_content_parts: List[str] = []
+        # (cell_index, cell_type, source) of non-empty cells; the combined
+        # content is only built once the notebook is known to have nodes
+        content_cells: List[Tuple[int, str, str]] = []
 
         # Process each cell in the notebook
-        for cell_index, cell in enumerate(nb.cells):
-            cell_type = cell.cell_type
-            source = (
-                cell.source if isinstance(cell.source, str) else "".join(cell.source)
-            )
+        for cell_index, cell in enumerate(cells):
+            cell_type = cell["cell_type"]
+            source = cell["source"]
+            if not isinstance(source, str):
+                source = "".join(source)
 
             if not source.strip():
                 continue
 
-            all_content_parts.append(f"# Cell {cell_index + 1} ({cell_type})\n{source}")
+            content_cells.append((cell_index, cell_type, source))
 
             # Determine the language for parsing based on cell type
             if cell_type == "code":
                 # Parse code cells with Python parser (most common in Jupyter)
-                cell_language = "python"
                 cell_nodes = _parse_cell_content(
-                    source, cell_language, cell_index, file_path_str
+                    source, python_parser, "python", cell_index, file_path_str
                 )
             elif cell_type == "markdown":
                 # Parse markdown cells
-                cell_language = "markdown"
                 cell_nodes = _parse_cell_content(
-                    source, cell_language, cell_index, file_path_str
+                    source, markdown_parser, "markdown", cell_index, file_path_str
                 )
             else:
                 # Raw cells or other types - treat as plain text
@@ -125,10 +164,13 @@ def parse_notebook(
             )
             return _fallback_notebook_parse(file_path, file_path_str)
 
-        full_content = "\n\n".join(all_content_parts)
+        full_content = "\n\n".join(
+            f"# Cell {cell_index + 1} ({cell_type})\n{source}"
+            for cell_index, cell_type, source in content_cells
+        )
 
         logger.debug(
-            f"Parsed notebook {file_path} - Found {len(nodes)} nodes from {len(nb.cells)} cells"
+            f"Parsed notebook {file_path} - Found {len(nodes)} nodes from {len(cells)} cells"
         )
 
         return {
@@ -139,9 +181,9 @@ def parse_notebook(
             "tree_info": {
                 "has_ast": True,
                 "is_notebook": True,
-                "total_cells": len(nb.cells),
-                "code_cells": sum(1 for c in nb.cells if c.cell_type == "code"),
-                "markdown_cells": sum(1 for c in nb.cells if c.cell_type == "markdown"),
+                "total_cells": len(cells),
+                "code_cells": sum(1 for c in cells if c["cell_type"] == "code"),
+                "markdown_cells": sum(1 for c in cells if c["cell_type"] == "markdown"),
                 "total_nodes": len(nodes),
             },
         }
@@ -154,13 +196,18 @@ def parse_notebook(
 
 
 def _parse_cell_content(
-    source: str, language: str, cell_index: int, file_path_str: str
+    source: str,
+    parser: Optional[Any],
+    language: str,
+    cell_index: int,
+    file_path_str: str,
 ) -> List[Dict[str, Any]]:
     """
     Parse cell content using the appropriate Tree-sitter parser.
 
     Args:
         source: Cell source code
+        parser: Tree-sitter parser for language, or None if unavailable
         language: Language for parsing ('python' or 'markdown')
         cell_index: Index of the cell in the notebook (0-based)
         file_path_str: File path string for metadata
@@ -168,22 +215,25 @@ def _parse_cell_content(
     Returns:
         List of parsed nodes from the cell
     """
-    from .ast_parser import get_parser, extract_nodes, TREE_SITTER_AVAILABLE
+    from .ast_parser import extract_nodes
 
-    if not TREE_SITTER_AVAILABLE:
-        return _create_raw_cell_node(source, language, cell_index, file_path_str)
+    # Encoded once for the parser, node extraction and the raw fallback
+    source_bytes = source.encode("utf-8")
 
-    parser = get_parser(language)
     if not parser:
-        return _create_raw_cell_node(source, language, cell_index, file_path_str)
+        return _create_raw_cell_node(
+            source, language, cell_index, file_path_str, source_bytes
+        )
 
     try:
-        tree = parser.parse(bytes(source, "utf-8"))
-        nodes = extract_nodes(tree.root_node, source, language)
+        tree = parser.parse(source_bytes)
+        nodes = extract_nodes(tree.root_node, source, language, source_bytes)
 
         # If no semantic nodes found, create a cell-level node
         if not nodes:
-            return _create_raw_cell_node(source, language, cell_index, file_path_str)
+            return _create_raw_cell_node(
+                source, language, cell_index, file_path_str, source_bytes
+            )
 
         # Add cell context to each node
         for node in nodes:
@@ -199,11 +249,17 @@ def _parse_cell_content(
 
     except Exception as e:
         logger.debug(f"Failed to parse cell {cell_index} as {language}: {e}")
-        return _create_raw_cell_node(source, language, cell_index, file_path_str)
+        return _create_raw_cell_node(
+            source, language, cell_index, file_path_str, source_bytes
+        )
 
 
 def _create_raw_cell_node(
-    source: str, cell_type: str, cell_index: int, file_path_str: str
+    source: str,
+    cell_type: str,
+    cell_index: int,
+    file_path_str: str,
+    source_bytes: Optional[bytes] = None,
 ) -> List[Dict[str, Any]]:
     """
     Create a raw node for a cell when AST parsing is not possible.
@@ -213,12 +269,12 @@ def _create_raw_cell_node(
         cell_type: Type of cell ('code', 'markdown', 'raw', etc.)
         cell_index: Index of the cell in the notebook (0-based)
         file_path_str: File path string for metadata
+        source_bytes: Already-encoded source (encoded from source if omitted)
 
     Returns:
         List containing a single cell-level node
     """
-    lines = source.splitlines()
-    node_id = str(uuid.uuid4())
+    node_id = _new_node_id()
 
     return [
         {
@@ -227,9 +283,11 @@ def _create_raw_cell_node(
             "name": f"cell_{cell_index + 1}",
             "content": source,
             "start_line": 1,
-            "end_line": max(1, len(lines)),
+            "end_line": max(1, _line_count(source)),
             "start_byte": 0,
-            "end_byte": len(source.encode("utf-8")),
+            "end_byte": len(
+                source_bytes if source_bytes is not None else source.encode("utf-8")
+            ),
             "is_parent": False,
             "parent_id": None,
             "parent_type": None,
@@ -241,6 +299,22 @@ def _create_raw_cell_node(
     ]
 
 
+def _new_node_id() -> str:
+    """Return a random 128-bit node ID (uuid4 without building a UUID object)."""
+    return os.urandom(16).hex()
+
+
+def _line_count(text: str) -> int:
+    """
+    Count the newline-terminated lines of text plus any unterminated last line.
+
+    This matches tree-sitter row numbering. It is not len(text.splitlines()):
+    only "\\n" ends a line, so "\\r", "\\x0b", "\\x0c", "\\x85", "\\u2028"
+    and "\\u2029" do not start new lines.
+    """
+    return text.count("\n") + (1 if text and not text.endswith("\n") else 0)
+
+
 def _fallback_notebook_parse(file_path: Path, file_path_str: str) -> Dict[str, Any]:
     """
     Fallback parsing when nbformat is unavailable or notebook parsing fails.
@@ -267,12 +341,12 @@ def _fallback_notebook_parse(file_path: Path, file_path_str: str) -> Dict[str, A
         "content": content,
         "nodes": [
             {
-                "id": str(uuid.uuid4()),
+                "id": _new_node_id(),
                 "type": "notebook_file",
                 "name": file_path.name,
                 "content": content,
                 "start_line": 1,
-                "end_line": max(1, len(content.splitlines())),
+                "end_line": max(1, _line_count(content)),
                 "start_byte": 0,
                 "end_byte": len(content.encode("utf-8")),
                 "is_parent": False,
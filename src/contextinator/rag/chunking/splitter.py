@@ -6,12 +6,18 @@ pieces based on token limits while maintaining context through overlapping conte
 """
 
 import uuid
-from typing import Any, Dict, List
+from bisect import bisect_left, bisect_right
+from itertools import accumulate, count
+from typing import Any, Dict, Iterator, List
 
+from .context_builder import build_enrichment_prefix
 from ..config import CHUNK_OVERLAP, MAX_TOKENS
-from ..utils import count_tokens
+from ..utils import count_tokens, count_tokens_batch
 from ..utils.logger import logger
 
+# Initial character width per token of windows over oversized lines
+_CHARS_PER_TOKEN = 3
+
 
 def split_chunk(
     chunk: Dict[str, Any], max_tokens: int = MAX_TOKENS, overlap: int = CHUNK_OVERLAP
@@ -41,6 +47,32 @@ def split_chunk(
         >>> len(splits)  # Number of chunks created
         3
     """
+    return list(iter_split_chunk(chunk, max_tokens, overlap))
+
+
+def iter_split_chunk(
+    chunk: Dict[str, Any], max_tokens: int = MAX_TOKENS, overlap: int = CHUNK_OVERLAP
+) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily split a large chunk into smaller chunks based on token limit.
+
+    Same as split_chunk, but each split is yielded as soon as it is built so
+    callers that consume splits one at a time never hold them all. Arguments
+    are validated immediately.
+
+    Args:
+        chunk: Chunk dictionary with 'content' key and metadata
+        max_tokens: Maximum tokens per chunk (default from config)
+        overlap: Number of tokens to overlap between chunks (default from config)
+
+    Returns:
+        Iterator of split chunks, or of the original chunk if splitting not needed
+
+    Raises:
+        TypeError: If chunk is not a dictionary
+        ValueError: If max_tokens or overlap are invalid
+        KeyError: If chunk missing required 'content' key
+    """
     if not isinstance(chunk, dict):
         raise TypeError("Chunk must be a dictionary")
     if max_tokens <= 0:
@@ -52,72 +84,183 @@ def split_chunk(
     if "content" not in chunk:
         raise KeyError("Chunk must contain 'content' key")
 
+    return _iter_splits(chunk, max_tokens, overlap)
+
+
+def _iter_splits(
+    chunk: Dict[str, Any], max_tokens: int, overlap: int
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the splits of a validated chunk.
+
+    Args:
+        chunk: Chunk dictionary with 'content' key and metadata
+        max_tokens: Maximum tokens per chunk
+        overlap: Number of tokens to overlap between chunks
+
+    Yields:
+        Split chunks, or the original chunk if splitting not needed
+    """
     content = chunk["content"]
     if not content:
         logger.debug("Empty content, returning original chunk")
-        return [chunk]
+        yield chunk
+        return
 
-    lines = content.splitlines()
+    # Byte-level BPE never yields more tokens than UTF-8 bytes, so chunks this
+    # short fit without running the tokenizer
+    if len(content) <= max_tokens and _utf8_len(content) <= max_tokens:
+        logger.debug("Chunk fits in max tokens by byte length, no splitting needed")
+        yield chunk
+        return
 
     # If chunk is small enough, return as-is
     total_tokens = count_tokens(content)
     if total_tokens <= max_tokens:
         logger.debug(f"Chunk fits in {total_tokens} tokens, no splitting needed")
-        return [chunk]
+        yield chunk
+        return
+
+    lines = content.splitlines()
 
     logger.debug(
         f"Splitting chunk with {total_tokens} tokens into max {max_tokens} token pieces"
     )
 
-    splits = []
-    current_split = []
-    current_tokens = 0
-
-    for line in lines:
-        line_tokens = count_tokens(line)
+    # Metadata, and so the enrichment context, is the same for every split
+    prefix = _split_enrichment_prefix(chunk)
+
+    # Each line is tokenized once; the overlap reuses these counts.
+    # cumulative[k] is the token total of lines[:k], so any range sums in O(1)
+    line_token_counts = count_tokens_batch(lines)
+    cumulative = list(accumulate(line_token_counts, initial=0))
+
+    split_indexes = count()
+    total_lines = len(lines)
+    # Lines that alone exceed max_tokens are split by character windows; the
+    # lines between them are split on line boundaries as usual
+    oversized = [i for i, n in enumerate(line_token_counts) if n > max_tokens]
+
+    begin = 0
+    for end in oversized + [total_lines]:
+        for split_content in _iter_line_splits(
+            lines, cumulative, begin, end, max_tokens, overlap
+        ):
+            yield _create_split_chunk(chunk, split_content, next(split_indexes), prefix)
+        if end < total_lines:
+            logger.debug(
+                f"Line {end} has {line_token_counts[end]} tokens, "
+                "splitting it by character windows"
+            )
+            for split_content in _iter_line_windows(lines[end], max_tokens, overlap):
+                yield _create_split_chunk(
+                    chunk, split_content, next(split_indexes), prefix
+                )
+        begin = end + 1
+
+    split_count = next(split_indexes)
+    logger.debug(f"Split into {split_count} chunks")
+    if not split_count:
+        yield chunk
+
+
+def _iter_line_splits(
+    lines: List[str],
+    cumulative: List[int],
+    begin: int,
+    end: int,
+    max_tokens: int,
+    overlap: int,
+) -> Iterator[str]:
+    """
+    Yield the contents of the line-based splits of lines[begin:end].
 
-        # Check if adding this line would exceed the limit
-        if current_tokens + line_tokens > max_tokens and current_split:
-            # Flush current split
-            split_content = "\n".join(current_split)
-            splits.append(_create_split_chunk(chunk, split_content, len(splits)))
+    Args:
+        lines: All lines of the chunk
+        cumulative: Cumulative line token counts (cumulative[k] covers lines[:k])
+        begin: Index of the first line to split
+        end: Index one past the last line to split
+        max_tokens: Maximum tokens per split
+        overlap: Number of tokens to overlap between splits
+
+    Yields:
+        Content of each split
+    """
+    # The current split starts at split_start and already includes
+    # lines[last_included]; the first line is always included
+    split_start = begin
+    last_included = begin
+
+    while split_start < end:
+        # First later line that would push the split over max_tokens
+        limit = cumulative[split_start] + max_tokens
+        flush_at = bisect_right(cumulative, limit, last_included + 2, end + 1) - 1
+        if flush_at >= end:
+            break
 
-            # Reset with overlap
-            overlap_lines = _get_overlap_lines(current_split, overlap)
-            current_split = overlap_lines
-            current_tokens = sum(count_tokens(l) for l in overlap_lines)
+        # Flush current split
+        yield "\n".join(lines[split_start:flush_at])
 
-        current_split.append(line)
-        current_tokens += line_tokens
+        # Reset with overlap; the flushed-at line always joins the new split
+        split_start = _get_overlap_start(cumulative, split_start, flush_at, overlap)
+        last_included = flush_at
 
     # Add remaining lines
-    if current_split:
-        split_content = "\n".join(current_split)
-        splits.append(_create_split_chunk(chunk, split_content, len(splits)))
+    if split_start < end:
+        yield "\n".join(lines[split_start:end])
 
-    logger.debug(f"Split into {len(splits)} chunks")
-    return splits if splits else [chunk]
 
+def _iter_line_windows(line: str, max_tokens: int, overlap: int) -> Iterator[str]:
+    """
+    Yield overlapping character windows of a line too long for one split.
 
-def _create_split_chunk(
-    original_chunk: Dict[str, Any], content: str, split_index: int
-) -> Dict[str, Any]:
+    Windows start at max_tokens * _CHARS_PER_TOKEN characters and shrink until
+    they fit, so dense text (e.g. minified code) still respects max_tokens.
+
+    Args:
+        line: Line with more than max_tokens tokens
+        max_tokens: Maximum tokens per window
+        overlap: Number of tokens to overlap between windows
+
+    Yields:
+        Content of each window
     """
-    Create a new chunk from a split with preserved metadata.
+    window = max_tokens * _CHARS_PER_TOKEN
+    overlap_chars = overlap * _CHARS_PER_TOKEN
+    start = 0
+
+    while start < len(line):
+        end = min(start + window, len(line))
+        tokens = count_tokens(line[start:end])
+        while tokens > max_tokens and end - start > 1:
+            # Shrink in proportion to the overshoot
+            end = start + max(1, (end - start) * max_tokens // tokens)
+            tokens = count_tokens(line[start:end])
+        yield line[start:end]
+
+        if end >= len(line):
+            break
+        # Step back for overlap, but always make progress
+        next_start = end - overlap_chars
+        start = next_start if next_start > start else end
 
-    BUGFIX: Generate unique ID for each split chunk to prevent duplicate IDs in ChromaDB.
+
+def _utf8_len(text: str) -> int:
+    """Return the UTF-8 encoded length of text (an upper bound on its tokens)."""
+    return len(text) if text.isascii() else len(text.encode("utf-8"))
+
+
+def _split_enrichment_prefix(original_chunk: Dict[str, Any]) -> str:
+    """
+    Build the enriched-content prefix shared by every split of a chunk.
 
     Args:
         original_chunk: Original chunk dictionary
-        content: New content for the split
-        split_index: Index of this split (0-based)
 
     Returns:
-        New chunk dictionary with split metadata and unique ID
+        Text to place before each split's content in its enriched content
     """
-    from .context_builder import build_enriched_content
-
-    # Create base metadata for the split (exclude 'id' to generate new unique ID)
+    # Create base metadata for the splits (exclude 'id' to generate new unique IDs)
     chunk_metadata = {
         k: v
         for k, v in original_chunk.items()
@@ -133,18 +276,42 @@ def _create_split_chunk(
         ]
     }
 
-    # Build enriched content for the split chunk
-    enriched_content = build_enriched_content(chunk_metadata, content)
+    return build_enrichment_prefix(chunk_metadata)
 
-    # Generate unique ID for each split chunk (BUGFIX: prevents duplicate IDs)
-    split_id = str(uuid.uuid4())
+
+def _create_split_chunk(
+    original_chunk: Dict[str, Any],
+    content: str,
+    split_index: int,
+    enrichment_prefix: str,
+) -> Dict[str, Any]:
+    """
+    Create a new chunk from a split with preserved metadata.
+
+    BUGFIX: Generate unique ID for each split chunk to prevent duplicate IDs in ChromaDB.
+
+    Args:
+        original_chunk: Original chunk dictionary
+        content: New content for the split
+        split_index: Index of this split (0-based)
+        enrichment_prefix: Prefix from _split_enrichment_prefix(original_chunk)
+
+    Returns:
+        New chunk dictionary with split metadata and unique ID
+    """
+    # Generate unique ID for each split chunk (BUGFIX: prevents duplicate IDs).
+    # Original IDs are already unique, so the split index keeps them distinct;
+    # chunks without one still get a random ID
+    original_id = original_chunk.get("id")
+    split_id = f"{original_id}::s{split_index}" if original_id else str(uuid.uuid4())
 
     return {
         **original_chunk,
         "id": split_id,  # NEW UNIQUE ID for split chunk
-        "original_id": original_chunk.get("id"),  # Preserve original ID for reference
+        "original_id": original_id,  # Preserve original ID for reference
         "content": content,
-        "enriched_content": enriched_content,  # Rebuild enriched content for split
+        # Rebuild enriched content for split
+        "enriched_content": enrichment_prefix + content,
         "is_split": True,
         "split_index": split_index,
         "original_hash": original_chunk.get("hash"),
@@ -152,37 +319,34 @@ def _create_split_chunk(
     }
 
 
-def _get_overlap_lines(lines: List[str], overlap_tokens: int) -> List[str]:
+def _get_overlap_start(
+    cumulative: List[int], start: int, end: int, overlap_tokens: int
+) -> int:
     """
-    Get last N lines that fit within overlap token limit.
+    Find where the last lines that fit within the overlap token limit begin.
 
     Selects lines from the end of the current split to include
-    as context at the beginning of the next split.
+    as context at the beginning of the next split. Token counts are never
+    negative, so the longest fitting tail is found by binary search over the
+    cumulative counts.
 
     Args:
-        lines: List of lines from current split
+        cumulative: Cumulative line token counts (cumulative[k] covers lines[:k])
+        start: Index of the first line in the current split
+        end: Index one past the last line in the current split
         overlap_tokens: Maximum tokens for overlap content
 
     Returns:
-        List of lines to use as overlap context
+        Index of the first overlap line (end for no overlap)
     """
-    if overlap_tokens <= 0 or not lines:
-        return []
-
-    overlap_lines = []
-    tokens = 0
-
-    # Work backwards from the end
-    for line in reversed(lines):
-        line_tokens = count_tokens(line)
-        if tokens + line_tokens > overlap_tokens:
-            break
-        overlap_lines.insert(0, line)
-        tokens += line_tokens
+    if overlap_tokens <= 0:
+        return end
 
-    return overlap_lines
+    # First index whose tail lines[index:end] fits within overlap_tokens
+    return bisect_left(cumulative, cumulative[end] - overlap_tokens, start, end)
 
 
 __all__ = [
+    "iter_split_chunk",
     "split_chunk",
 ]
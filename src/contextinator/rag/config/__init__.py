@@ -14,6 +14,8 @@ from .settings import (
     OPENAI_EMBEDDING_MODEL,
     EMBEDDING_BATCH_SIZE,
     OPENAI_MAX_TOKENS,
+    OPENAI_MAX_BATCH_INPUTS,
+    OPENAI_MAX_BATCH_TOKENS,
     OPENAI_API_KEY,
     USE_CHROMA_SERVER,
     CHROMA_DB_DIR,
@@ -37,6 +39,8 @@ __all__ = [
     "OPENAI_EMBEDDING_MODEL",
     "EMBEDDING_BATCH_SIZE",
     "OPENAI_MAX_TOKENS",
+    "OPENAI_MAX_BATCH_INPUTS",
+    "OPENAI_MAX_BATCH_TOKENS",
     "OPENAI_API_KEY",
     "USE_CHROMA_SERVER",
     "CHROMA_DB_DIR",
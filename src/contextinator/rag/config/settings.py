@@ -7,6 +7,7 @@ and validation logic for the Contextinator application.
 
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Union
 
@@ -227,6 +228,9 @@ DEFAULT_EMBEDDING_MODEL: str = "sentence-transformers/all-MiniLM-L6-v2"
 OPENAI_EMBEDDING_MODEL: str = "text-embedding-3-large"
 EMBEDDING_BATCH_SIZE: int = int(os.getenv("EMBEDDING_BATCH_SIZE", "250"))
 OPENAI_MAX_TOKENS: int = 8191
+# Inputs and total tokens the embeddings endpoint accepts per request
+OPENAI_MAX_BATCH_INPUTS: int = 2048
+OPENAI_MAX_BATCH_TOKENS: int = int(os.getenv("OPENAI_MAX_BATCH_TOKENS", "250000"))
 OPENAI_API_KEY: Optional[str] = os.getenv("OPENAI_API_KEY")
 
 # Vector store settings
@@ -241,10 +245,13 @@ CHUNKS_DIR: str = ".contextinator/chunks"
 EMBEDDINGS_DIR: str = ".contextinator/embeddings"
 
 
+@lru_cache(maxsize=256)
 def sanitize_collection_name(repo_name: str) -> str:
     """
     Sanitize repository name for use as ChromaDB collection name.
 
+    Results are cached per process; invalid names raise and are not cached.
+
     Args:
         repo_name: Raw repository name
 
@@ -352,6 +359,12 @@ def validate_config() -> None:
             "EMBEDDING_BATCH_SIZE must be positive", "EMBEDDING_BATCH_SIZE"
         )
 
+    if OPENAI_MAX_BATCH_TOKENS < OPENAI_MAX_TOKENS:
+        raise ConfigurationError(
+            "OPENAI_MAX_BATCH_TOKENS must be at least OPENAI_MAX_TOKENS",
+            "OPENAI_MAX_BATCH_TOKENS",
+        )
+
     if CHROMA_BATCH_SIZE <= 0:
         raise ConfigurationError(
             "CHROMA_BATCH_SIZE must be positive", "CHROMA_BATCH_SIZE"
@@ -389,6 +402,8 @@ __all__ = [
     "OPENAI_EMBEDDING_MODEL",
     "EMBEDDING_BATCH_SIZE",
     "OPENAI_MAX_TOKENS",
+    "OPENAI_MAX_BATCH_INPUTS",
+    "OPENAI_MAX_BATCH_TOKENS",
     "OPENAI_API_KEY",
     "USE_CHROMA_SERVER",
     "CHROMA_DB_DIR",
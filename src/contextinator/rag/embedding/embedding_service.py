@@ -5,8 +5,10 @@ This module provides functionality to generate embeddings for code chunks
 using OpenAI's embedding API, with batch processing and error handling.
 """
 
+import hashlib
 import json
 import os
+import random
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
@@ -16,11 +18,14 @@ from ..config import (
     EMBEDDING_BATCH_SIZE,
     OPENAI_API_KEY,
     OPENAI_EMBEDDING_MODEL,
+    OPENAI_MAX_BATCH_INPUTS,
+    OPENAI_MAX_BATCH_TOKENS,
     OPENAI_MAX_TOKENS,
     get_storage_path,
     validate_openai_api_key,
 )
-from ..utils import ProgressTracker, logger
+from ..utils import ProgressTracker, count_tokens_batch, logger
+from ..utils.json_utils import load_json
 from ..utils.exceptions import ValidationError, FileSystemError
 
 
@@ -38,6 +43,8 @@ class EmbeddingService:
         import openai
 
         self.client: Optional[openai.OpenAI] = None
+        self._async_client: Optional[openai.AsyncOpenAI] = None
+        self._async_client_loop = None
         self._validate_api_key()
         self._initialize_client()
 
@@ -60,6 +67,23 @@ class EmbeddingService:
         except Exception as e:
             raise RuntimeError(f"Failed to initialize OpenAI client: {str(e)}")
 
+    def _get_async_client(self):
+        """
+        Get the async OpenAI client for the running event loop.
+
+        The client is created once per loop and reused across calls, so batches
+        of every repository embedded on that loop share one keep-alive
+        connection pool instead of opening new TLS connections each time.
+        """
+        import asyncio
+        from openai import AsyncOpenAI
+
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            self._async_client = AsyncOpenAI(api_key=OPENAI_API_KEY)
+            self._async_client_loop = loop
+        return self._async_client
+
     def _test_connection(self) -> None:
         """
         Test the OpenAI API connection with a minimal request.
@@ -122,14 +146,58 @@ class EmbeddingService:
         # Prefer enriched content for semantic search quality
         return chunk.get("enriched_content", chunk.get("content", ""))
 
+    def _make_batches(
+        self, valid_chunks: List[Tuple[int, Dict[str, Any]]], batch_size: int
+    ) -> List[List[Tuple[int, Dict[str, Any]]]]:
+        """
+        Group chunks into API requests within the input and token limits.
+
+        Each batch holds at most batch_size chunks (capped at the API's
+        OPENAI_MAX_BATCH_INPUTS) and at most OPENAI_MAX_BATCH_TOKENS tokens, so
+        large chunks cannot push a request over the endpoint's limit.
+
+        Args:
+            valid_chunks: List of (index, chunk) tuples
+            batch_size: Maximum chunks per batch
+
+        Returns:
+            Batches of (index, chunk) tuples, in input order
+        """
+        batch_size = min(batch_size, OPENAI_MAX_BATCH_INPUTS)
+        token_counts = count_tokens_batch(
+            [self._get_embedding_content(chunk) for _, chunk in valid_chunks],
+            OPENAI_EMBEDDING_MODEL,
+        )
+
+        batches = []
+        batch: List[Tuple[int, Dict[str, Any]]] = []
+        batch_tokens = 0
+        for item, tokens in zip(valid_chunks, token_counts):
+            if batch and (
+                len(batch) >= batch_size
+                or batch_tokens + tokens > OPENAI_MAX_BATCH_TOKENS
+            ):
+                batches.append(batch)
+                batch = []
+                batch_tokens = 0
+            batch.append(item)
+            batch_tokens += tokens
+        if batch:
+            batches.append(batch)
+
+        return batches
+
     def generate_embeddings(
         self,
         chunks: List[Dict[str, Any]],
         use_async: bool = True,
-        batch_size: int = 250,
+        batch_size: Optional[int] = None,
         max_concurrent: int = 5,
     ) -> List[Dict[str, Any]]:
         """Generate embeddings (async if use_async=True)."""
+        batch_size = batch_size or EMBEDDING_BATCH_SIZE
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
         if use_async:
             import asyncio
 
@@ -153,35 +221,21 @@ class EmbeddingService:
                     # Already in async context
                     raise
         else:
-            return self._generate_embeddings_sync(chunks)
+            return self._generate_embeddings_sync(chunks, batch_size)
 
     async def _generate_embeddings_async(
         self, chunks: List[Dict[str, Any]], batch_size: int, max_concurrent: int
     ) -> List[Dict[str, Any]]:
         """Async embedding with concurrency and rate limiting."""
-        from openai import AsyncOpenAI
         import asyncio
         from ..utils.exceptions import EmbeddingError
 
-        client = AsyncOpenAI(api_key=OPENAI_API_KEY)
+        client = self._get_async_client()
         semaphore = asyncio.Semaphore(max_concurrent)
 
         # Validate chunks
         logger.info(f"⏳ Validating {len(chunks)} chunks...")
-        valid_chunks = []
-        for i, chunk in enumerate(chunks):
-            if i % 1000 == 0 and i > 0:
-                logger.info(f"   Validated {i}/{len(chunks)} chunks...")
-            content = self._get_embedding_content(chunk)
-            is_valid, processed = self._validate_chunk_content(content)
-            if is_valid:
-                if processed != content:
-                    chunk = chunk.copy()
-                    if "enriched_content" in chunk:
-                        chunk["enriched_content"] = processed
-                    else:
-                        chunk["content"] = processed
-                valid_chunks.append((i, chunk))
+        valid_chunks = self._valid_chunks(chunks, log_progress=True)
 
         if not valid_chunks:
             return []
@@ -191,35 +245,10 @@ class EmbeddingService:
         )
 
         async def embed_batch(batch):
-            contents = [self._get_embedding_content(c) for _, c in batch]
             async with semaphore:
-                for attempt in range(3):
-                    try:
-                        response = await client.embeddings.create(
-                            model=OPENAI_EMBEDDING_MODEL, input=contents
-                        )
-                        return [
-                            (
-                                idx,
-                                {
-                                    **chunk,
-                                    "embedding": emb.embedding,
-                                    "embedding_model": OPENAI_EMBEDDING_MODEL,
-                                },
-                            )
-                            for (idx, chunk), emb in zip(batch, response.data)
-                        ]
-                    except Exception as e:
-                        if attempt < 2:
-                            await asyncio.sleep(2**attempt)
-                        else:
-                            logger.error(f"❌ Batch failed after 3 attempts: {e}")
-                            raise  # Re-raise to be caught by gather
-
-        batches = [
-            valid_chunks[i : i + batch_size]
-            for i in range(0, len(valid_chunks), batch_size)
-        ]
+                return await self._request_embeddings_async(client, batch)
+
+        batches = self._make_batches(valid_chunks, batch_size)
         logger.info(f"📦 Processing {len(batches)} batches...")
         results = await asyncio.gather(
             *[embed_batch(b) for b in batches], return_exceptions=True
@@ -233,7 +262,7 @@ class EmbeddingService:
                 failed_batches.append((i, str(batch_result)))
                 logger.error(f"⚠️  Batch {i + 1}/{len(batches)} failed: {batch_result}")
             else:
-                embedded.extend([chunk for _, chunk in batch_result])
+                embedded.extend(batch_result)
 
         if failed_batches:
             error_msg = f"{len(failed_batches)}/{len(batches)} batches failed"
@@ -243,14 +272,109 @@ class EmbeddingService:
         logger.info(f"✅ Embedded {len(embedded)} chunks")
         return embedded
 
+    async def _embed_chunks_quietly_async(
+        self, chunks: List[Dict[str, Any]], batch_size: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Embed chunks one request at a time without progress logging.
+
+        For callers that embed a repository piece by piece and report totals
+        themselves; only request failures are logged.
+
+        Args:
+            chunks: Chunks to embed
+            batch_size: Maximum chunks per API request
+
+        Returns:
+            Valid chunks with added 'embedding' field, in input order
+
+        Raises:
+            Exception: The error of the first request that fails after retries
+        """
+        client = self._get_async_client()
+        embedded = []
+        for batch in self._make_batches(self._valid_chunks(chunks), batch_size):
+            embedded.extend(await self._request_embeddings_async(client, batch))
+        return embedded
+
+    def _valid_chunks(
+        self, chunks: List[Dict[str, Any]], log_progress: bool = False
+    ) -> List[Tuple[int, Dict[str, Any]]]:
+        """
+        Select the chunks that can be embedded, truncating oversized content.
+
+        Args:
+            chunks: Chunks to validate
+            log_progress: Log a progress line every 1000 chunks
+
+        Returns:
+            (index, chunk) tuples of valid chunks, with content replaced by its
+            validated form where it changed
+        """
+        valid_chunks = []
+        for i, chunk in enumerate(chunks):
+            if log_progress and i % 1000 == 0 and i > 0:
+                logger.info(f"   Validated {i}/{len(chunks)} chunks...")
+            content = self._get_embedding_content(chunk)
+            is_valid, processed = self._validate_chunk_content(content)
+            if is_valid:
+                if processed != content:
+                    chunk = chunk.copy()
+                    if "enriched_content" in chunk:
+                        chunk["enriched_content"] = processed
+                    else:
+                        chunk["content"] = processed
+                valid_chunks.append((i, chunk))
+        return valid_chunks
+
+    async def _request_embeddings_async(
+        self, client: Any, batch: List[Tuple[int, Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Embed one batch of validated chunks with retries.
+
+        Args:
+            client: Async OpenAI client
+            batch: (index, chunk) tuples forming one API request
+
+        Returns:
+            Chunks of the batch with added 'embedding' field
+
+        Raises:
+            Exception: The API error once retries are exhausted or not retryable
+        """
+        import asyncio
+
+        contents = [self._get_embedding_content(c) for _, c in batch]
+        for attempt in range(3):
+            try:
+                response = await client.embeddings.create(
+                    model=OPENAI_EMBEDDING_MODEL, input=contents
+                )
+                return [
+                    {
+                        **chunk,
+                        "embedding": emb.embedding,
+                        "embedding_model": OPENAI_EMBEDDING_MODEL,
+                    }
+                    for (_, chunk), emb in zip(batch, response.data)
+                ]
+            except Exception as e:
+                if attempt < 2 and self._is_retryable_error(e):
+                    await asyncio.sleep(self._retry_delay(e, attempt))
+                else:
+                    logger.error(f"❌ Batch failed after {attempt + 1} attempts: {e}")
+                    raise
+
     def _generate_embeddings_sync(
-        self, chunks: List[Dict[str, Any]]
+        self, chunks: List[Dict[str, Any]], batch_size: int = EMBEDDING_BATCH_SIZE
     ) -> List[Dict[str, Any]]:
         """
         Generate embeddings for a list of chunks with batch processing and error recovery.
 
         Args:
             chunks: List of chunk dictionaries containing 'content' field
+            batch_size: Maximum chunks per API request
 
         Returns:
             List of chunks with added 'embedding' field
@@ -266,7 +390,7 @@ class EmbeddingService:
 
         logger.info(f"🚀 Starting embedding generation for {len(chunks)} chunks...")
         logger.info(f"📊 Using model: {OPENAI_EMBEDDING_MODEL}")
-        logger.info(f"📦 Batch size: {EMBEDDING_BATCH_SIZE}")
+        logger.info(f"📦 Batch size: {batch_size}")
 
         # Validate and filter chunks with content fixing
         valid_chunks: List[Tuple[int, Dict[str, Any]]] = []
@@ -305,22 +429,17 @@ class EmbeddingService:
         # Process in batches, continue on failures
         embedded_chunks = []
         failed_batches = []
-        total_batches = (
-            len(valid_chunks) + EMBEDDING_BATCH_SIZE - 1
-        ) // EMBEDDING_BATCH_SIZE
+        batches = self._make_batches(valid_chunks, batch_size)
+        total_batches = len(batches)
         progress = ProgressTracker(total_batches, "Generating embeddings")
 
-        for batch_idx in range(0, len(valid_chunks), EMBEDDING_BATCH_SIZE):
-            batch_end = min(batch_idx + EMBEDDING_BATCH_SIZE, len(valid_chunks))
-            batch_chunks = valid_chunks[batch_idx:batch_end]
-
+        for batch_num, batch_chunks in enumerate(batches, 1):
             try:
                 batch_embeddings = self._generate_batch_embeddings(batch_chunks)
                 embedded_chunks.extend(batch_embeddings)
                 progress.update()
             except Exception as e:
                 # Log batch failure and continue with other batches
-                batch_num = batch_idx // EMBEDDING_BATCH_SIZE + 1
                 logger.warning(
                     f"Batch {batch_num}/{total_batches} failed, skipping {len(batch_chunks)} chunks: {e}"
                 )
@@ -409,9 +528,9 @@ class EmbeddingService:
                 is_retryable = self._is_retryable_error(e)
 
                 if attempt < max_retries - 1 and is_retryable:
-                    wait_time = 2**attempt  # Exponential backoff: 1s, 2s, 4s
+                    wait_time = self._retry_delay(e, attempt)
                     logger.warning(
-                        f"API call failed (attempt {attempt + 1}/{max_retries}), retrying in {wait_time}s: {e}"
+                        f"API call failed (attempt {attempt + 1}/{max_retries}), retrying in {wait_time:.1f}s: {e}"
                     )
                     time.sleep(wait_time)
                 else:
@@ -423,6 +542,32 @@ class EmbeddingService:
                         )
                     raise EmbeddingError(error_msg, str(e))
 
+    def _retry_delay(self, error: Exception, attempt: int) -> float:
+        """
+        Compute how long to wait before retrying a failed API call.
+
+        Honors the Retry-After header of rate-limit responses, otherwise backs
+        off exponentially (1s, 2s, 4s). Jitter keeps concurrent batches from
+        retrying in lockstep.
+
+        Args:
+            error: Exception that occurred
+            attempt: Zero-based number of the failed attempt
+
+        Returns:
+            Seconds to wait
+        """
+        delay = float(2**attempt)
+        response = getattr(error, "response", None)
+        retry_after = getattr(response, "headers", {}).get("retry-after")
+        if retry_after:
+            try:
+                delay = max(delay, float(retry_after))
+            except ValueError:
+                pass  # HTTP-date form; keep the exponential backoff
+
+        return delay * random.uniform(1.0, 1.25)
+
     def _is_retryable_error(self, error: Exception) -> bool:
         """
         Determine if an error is retryable.
@@ -467,17 +612,23 @@ def embed_chunks(
     custom_chunks_dir: Optional[str] = None,
     custom_embeddings_dir: Optional[str] = None,
     use_async: bool = True,
-    batch_size: int = 250,
+    batch_size: Optional[int] = None,
     max_concurrent: int = 5,
+    reuse: bool = True,
 ) -> List[Dict[str, Any]]:
     """
     Generate embeddings for repository chunks.
 
+    Chunks whose embedding input is unchanged since the last saved embeddings
+    of the repository reuse those embeddings instead of calling the API.
+
     Args:
         base_dir: Base directory containing .chunks folder
         repo_name: Repository name for isolation
         save: Whether to save embeddings to disk
         chunks_data: Optional pre-loaded chunks data
+        batch_size: Maximum chunks per API request (default: EMBEDDING_BATCH_SIZE)
+        reuse: Whether to reuse previously saved embeddings (default: True)
 
     Returns:
         List of embedded chunks
@@ -498,16 +649,182 @@ def embed_chunks(
         return []
 
     embedding_service = EmbeddingService()
-    embedded_chunks = embedding_service.generate_embeddings(
-        chunks_data, use_async, batch_size, max_concurrent
+    previous = (
+        _load_previous_embeddings(
+            embedding_service, base_dir, repo_name, custom_embeddings_dir
+        )
+        if reuse
+        else {}
     )
 
+    if not previous:
+        embedded_chunks = embedding_service.generate_embeddings(
+            chunks_data, use_async, batch_size, max_concurrent
+        )
+    else:
+        embedded_chunks, to_embed, pending = _reuse_embeddings(
+            embedding_service, chunks_data, previous
+        )
+        logger.info(
+            f"♻️  Reusing {len(embedded_chunks) - len(to_embed)} unchanged embeddings, "
+            f"embedding {len(to_embed)} chunks"
+        )
+        new_embeddings = (
+            embedding_service.generate_embeddings(
+                to_embed, use_async, batch_size, max_concurrent
+            )
+            if to_embed
+            else []
+        )
+        embedded_chunks = _merge_new_embeddings(
+            embedding_service, embedded_chunks, pending, new_embeddings
+        )
+
     if save:
         save_embeddings(embedded_chunks, base_dir, repo_name, custom_embeddings_dir)
 
     return embedded_chunks
 
 
+def _embedding_key(content: str) -> bytes:
+    """Key an embedding by the exact text it was generated from."""
+    return hashlib.sha256(content.encode("utf-8")).digest()
+
+
+def _reuse_embeddings(
+    embedding_service: EmbeddingService,
+    chunks: List[Dict[str, Any]],
+    previous: Dict[bytes, List[float]],
+) -> Tuple[
+    List[Optional[Dict[str, Any]]],
+    List[Dict[str, Any]],
+    List[Tuple[int, Tuple[Any, bytes]]],
+]:
+    """
+    Attach previously saved embeddings to chunks whose embedding input is unchanged.
+
+    Invalid chunks are skipped, as generate_embeddings skips them.
+
+    Args:
+        embedding_service: Service whose embedding content rules apply
+        chunks: Chunks to embed
+        previous: Index from _load_previous_embeddings
+
+    Returns:
+        Tuple of (embedded chunks with None for each chunk still to embed,
+        chunks still to embed, (position, identity) of each None slot)
+    """
+    embedded_chunks: List[Optional[Dict[str, Any]]] = []
+    to_embed = []
+    pending = []
+    for chunk in chunks:
+        content = embedding_service._get_embedding_content(chunk)
+        is_valid, processed = embedding_service._validate_chunk_content(content)
+        if not is_valid:
+            continue
+        key = _embedding_key(processed)
+        embedding = previous.get(key)
+        if embedding is None:
+            to_embed.append(chunk)
+            pending.append((len(embedded_chunks), (chunk.get("id"), key)))
+            embedded_chunks.append(None)
+            continue
+        if processed != content:
+            chunk = chunk.copy()
+            if "enriched_content" in chunk:
+                chunk["enriched_content"] = processed
+            else:
+                chunk["content"] = processed
+        embedded_chunks.append(
+            {
+                **chunk,
+                "embedding": embedding,
+                "embedding_model": OPENAI_EMBEDDING_MODEL,
+            }
+        )
+    return embedded_chunks, to_embed, pending
+
+
+def _merge_new_embeddings(
+    embedding_service: EmbeddingService,
+    embedded_chunks: List[Optional[Dict[str, Any]]],
+    pending: List[Tuple[int, Tuple[Any, bytes]]],
+    new_embeddings: List[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    """
+    Fill the slots left by _reuse_embeddings with newly generated embeddings.
+
+    Failed batches are skipped rather than returned by the sync embedding
+    path, so new embeddings are matched to their slots by chunk id and
+    embedding input, not by position. Slots left without an embedding are
+    dropped.
+
+    Args:
+        embedding_service: Service whose embedding content rules apply
+        embedded_chunks: Embedded chunks with None slots from _reuse_embeddings
+        pending: (position, identity) of each None slot
+        new_embeddings: Chunks returned by the embedding service
+
+    Returns:
+        Embedded chunks in their original order
+    """
+    by_identity: Dict[Tuple[Any, bytes], List[Dict[str, Any]]] = {}
+    for embedded in new_embeddings:
+        key = _embedding_key(embedding_service._get_embedding_content(embedded))
+        by_identity.setdefault((embedded.get("id"), key), []).append(embedded)
+
+    for position, identity in pending:
+        matches = by_identity.get(identity)
+        if matches:
+            embedded_chunks[position] = matches.pop(0)
+
+    missing = embedded_chunks.count(None)
+    if missing:
+        logger.warning(f"⚠️  Dropping {missing} chunks without embeddings")
+        return [chunk for chunk in embedded_chunks if chunk is not None]
+    return embedded_chunks
+
+
+def _load_previous_embeddings(
+    embedding_service: EmbeddingService,
+    base_dir: Union[str, Path],
+    repo_name: str,
+    custom_embeddings_dir: Optional[str] = None,
+) -> Dict[bytes, List[float]]:
+    """
+    Index a repository's saved embeddings by their embedding input.
+
+    Only embeddings from the current OPENAI_EMBEDDING_MODEL are indexed. A
+    missing or unreadable embeddings file yields an empty index.
+
+    Args:
+        embedding_service: Service whose embedding content rules apply
+        base_dir: Base directory containing .embeddings folder
+        repo_name: Repository name for isolation
+        custom_embeddings_dir: Optional custom embeddings directory
+
+    Returns:
+        Mapping of _embedding_key(content) to embedding vector
+    """
+    try:
+        saved_chunks = load_embeddings(base_dir, repo_name, custom_embeddings_dir)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.warning(f"Not reusing saved embeddings: {e}")
+        return {}
+
+    previous = {}
+    for chunk in saved_chunks:
+        if chunk.get("embedding_model") != OPENAI_EMBEDDING_MODEL:
+            continue
+        if chunk.get("embedding"):
+            # Saved chunks hold the already validated (possibly truncated) content
+            content = embedding_service._get_embedding_content(chunk)
+            previous[_embedding_key(content)] = chunk["embedding"]
+    return previous
+
+
 def load_chunks(
     base_dir: Union[str, Path], repo_name: str, custom_chunks_dir: Optional[str] = None
 ) -> List[Dict[str, Any]]:
@@ -547,8 +864,7 @@ def load_chunks(
                 f"⚠️  Large chunks file ({file_size_mb:.1f}MB) - this may take a moment..."
             )
 
-        with open(chunks_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = load_json(chunks_file)
 
         # Handle both old and new format
         if isinstance(data, list):
@@ -674,8 +990,7 @@ def load_embeddings(
     logger.info(f"📂 Loading embeddings from {embeddings_file}")
 
     try:
-        with open(embeddings_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = load_json(embeddings_file)
 
         # Handle both old and new format
         if isinstance(data, list):
@@ -2,14 +2,21 @@
 
 import asyncio
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterable, List, Callable, Sized, Tuple
 import os
 import tempfile
 import shutil
 from ..utils.repo_utils import extract_repo_name_from_url, clone_repo
 from ..chunking import chunk_repository, save_chunks
+from ..config import EMBEDDING_BATCH_SIZE
 from ..embedding import EmbeddingService
+from ..embedding.embedding_service import (
+    _load_previous_embeddings,
+    _merge_new_embeddings,
+    _reuse_embeddings,
+)
 from ..vectorstore import store_repository_embeddings
+from ..utils.exceptions import EmbeddingError
 from ..utils.logger import logger
 
 
@@ -20,6 +27,9 @@ class AsyncIngestionService:
         self.embedding_service = None  # Lazy init to avoid sync client in async context
         self.base_dir = base_dir or "./contextinator_data"
         self._temp_dirs = []  # Track temp dirs for cleanup
+        # Clones shared by every pipeline of the same URL, with their user counts
+        self._clones: Dict[str, "asyncio.Task[Dict[str, Any]]"] = {}
+        self._clone_users: Dict[str, int] = {}
 
     def _get_embedding_service(self):
         """Lazy init embedding service to avoid sync client in async context."""
@@ -81,6 +91,59 @@ class AsyncIngestionService:
                 shutil.rmtree(target_path, ignore_errors=True)
             raise Exception(f"Git clone timeout after {timeout}s")
 
+    async def _acquire_clone(self, repo_url: str) -> str:
+        """
+        Get a clone of repo_url, sharing one in flight or kept from earlier.
+
+        Every call must be paired with _release_clone, even if cloning fails.
+
+        Args:
+            repo_url: Repository URL to clone
+
+        Returns:
+            Path to the cloned repository
+        """
+        self._clone_users[repo_url] = self._clone_users.get(repo_url, 0) + 1
+        task = self._clones.get(repo_url)
+        if task is None:
+            task = asyncio.ensure_future(self.clone_repository_async(repo_url))
+            self._clones[repo_url] = task
+        # Shielded so one cancelled user does not cancel the clone for the others
+        clone_result = await asyncio.shield(task)
+        return clone_result["repo_path"]
+
+    def _release_clone(self, repo_url: str, cleanup: bool) -> None:
+        """
+        Release a clone taken with _acquire_clone.
+
+        The last user removes the clone if cleanup is set; otherwise a
+        successful clone is kept for later pipelines of the same URL.
+
+        Args:
+            repo_url: Repository URL passed to _acquire_clone
+            cleanup: Whether to delete the clone once it is unused
+        """
+        users = self._clone_users[repo_url] - 1
+        if users:
+            self._clone_users[repo_url] = users
+            return
+        del self._clone_users[repo_url]
+
+        task = self._clones[repo_url]
+        succeeded = task.done() and not task.cancelled() and not task.exception()
+        if succeeded and not cleanup:
+            return
+        del self._clones[repo_url]
+
+        if not task.done():
+            task.cancel()
+        elif succeeded:
+            repo_path = task.result()["repo_path"]
+            try:
+                shutil.rmtree(repo_path, ignore_errors=True)
+            except Exception as e:
+                logger.warning(f"Failed to cleanup {repo_path}: {e}")
+
     async def chunk_repository_async(
         self, repo_path: str, repo_name: str
     ) -> List[Dict[str, Any]]:
@@ -114,6 +177,146 @@ class AsyncIngestionService:
         logger.info(f"✅ Embedded {len(embeddings)} chunks")
         return embeddings
 
+    async def chunk_and_embed_async(
+        self,
+        repo_path: str,
+        repo_name: str,
+        batch_size: Optional[int] = None,
+        max_concurrent: int = 5,
+        reuse: bool = False,
+        custom_embeddings_dir: Optional[str] = None,
+        **chunk_kwargs: Any,
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Chunk a repository and embed its chunks with the two stages overlapped.
+
+        Chunking runs in a worker thread and hands over each file's chunks as
+        they are produced; every full batch is embedded on the event loop while
+        chunking continues, so network time overlaps CPU time. With reuse,
+        chunks whose embedding input is unchanged since the embeddings saved
+        under base_dir keep those embeddings instead of calling the API.
+
+        Args:
+            repo_path: Path to the repository to chunk
+            repo_name: Repository name
+            batch_size: Chunks per embedding request (default: EMBEDDING_BATCH_SIZE)
+            max_concurrent: Maximum embedding requests in flight
+            reuse: Whether to reuse previously saved embeddings (default: False)
+            custom_embeddings_dir: Optional custom embeddings directory to reuse from
+            **chunk_kwargs: Extra arguments for chunk_repository
+
+        Returns:
+            Tuple of (chunks, embedded chunks), both in chunking order
+
+        Raises:
+            ValueError: If batch_size or max_concurrent is less than 1
+        """
+        if batch_size is None:
+            batch_size = EMBEDDING_BATCH_SIZE
+        elif batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+        # Create the service up front so a missing API key fails before chunking
+        service = self._get_embedding_service()
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(max_concurrent)
+        embed_tasks = []
+        pending: List[Dict[str, Any]] = []
+        previous = (
+            await loop.run_in_executor(
+                None,
+                lambda: _load_previous_embeddings(
+                    service, self.base_dir, repo_name, custom_embeddings_dir
+                ),
+            )
+            if reuse
+            else {}
+        )
+        reused = 0
+
+        # The first embedding batch to fail is recorded and sets stop, which
+        # also makes the chunking thread stop at its next callback
+        failures: List[BaseException] = []
+        stop = asyncio.Event()
+
+        async def embed_batch(batch):
+            nonlocal reused
+            # Batches embed quietly; totals are logged once at the end
+            if not previous:
+                async with semaphore:
+                    return await service._embed_chunks_quietly_async(batch, batch_size)
+
+            embedded, to_embed, slots = _reuse_embeddings(service, batch, previous)
+            reused += len(embedded) - len(to_embed)
+            new_embeddings = []
+            if to_embed:
+                async with semaphore:
+                    new_embeddings = await service._embed_chunks_quietly_async(
+                        to_embed, batch_size
+                    )
+            return _merge_new_embeddings(service, embedded, slots, new_embeddings)
+
+        def on_batch_done(task):
+            if not task.cancelled() and task.exception() and not failures:
+                failures.append(task.exception())
+                stop.set()
+
+        def start_batch(batch):
+            task = loop.create_task(embed_batch(batch))
+            task.add_done_callback(on_batch_done)
+            embed_tasks.append(task)
+
+        def on_chunks(chunks):
+            # Runs in the chunking thread; tasks are created on the loop
+            if stop.is_set():
+                raise EmbeddingError("Chunking stopped after an embedding failure")
+            pending.extend(chunks)
+            while len(pending) >= batch_size:
+                loop.call_soon_threadsafe(start_batch, pending[:batch_size])
+                del pending[:batch_size]
+
+        logger.info(f"📦 Chunking and embedding {repo_name}")
+        chunking = loop.run_in_executor(
+            None,
+            lambda: chunk_repository(
+                repo_path, repo_name, on_chunks=on_chunks, **chunk_kwargs
+            ),
+        )
+        try:
+            # Wait for chunking, unless an embedding batch fails first
+            stopped = loop.create_task(stop.wait())
+            try:
+                await asyncio.wait(
+                    {chunking, stopped}, return_when=asyncio.FIRST_COMPLETED
+                )
+            finally:
+                stopped.cancel()
+            if failures:
+                raise failures[0]
+            chunks = chunking.result()
+            if pending:
+                start_batch(pending[:])
+
+            results = await asyncio.gather(*embed_tasks)
+        except BaseException:
+            # Stop in-flight embedding work for a repository that failed; the
+            # chunking thread stops at its next callback and its error is dropped
+            stop.set()
+            for task in embed_tasks:
+                task.cancel()
+            chunking.add_done_callback(
+                lambda future: future.cancelled() or future.exception()
+            )
+            raise
+        embeddings = [chunk for batch in results for chunk in batch]
+
+        if reused:
+            logger.info(f"♻️  Reused {reused} unchanged embeddings")
+
+        logger.info(f"✅ Created {len(chunks)} chunks, embedded {len(embeddings)}")
+        return chunks, embeddings
+
     async def store_embeddings_async(
         self,
         repo_name: str,
@@ -148,6 +351,9 @@ class AsyncIngestionService:
             except Exception as e:
                 logger.warning(f"Failed to cleanup {temp_dir}: {e}")
         self._temp_dirs.clear()
+        # Kept clones were among the removed directories
+        for repo_url in [u for u in self._clones if u not in self._clone_users]:
+            del self._clones[repo_url]
 
     async def process_repository_async(
         self,
@@ -158,15 +364,16 @@ class AsyncIngestionService:
         cleanup: bool = True,
     ) -> Dict[str, Any]:
         """Complete async pipeline for single repository."""
-        repo_path = None
         try:
-            clone_result = await self.clone_repository_async(repo_url)
-            repo_path = clone_result["repo_path"]
+            repo_path = await self._acquire_clone(repo_url)
             repo_name = extract_repo_name_from_url(repo_url) or Path(repo_path).name
 
-            chunks = await self.chunk_repository_async(repo_path, repo_name)
-            embeddings = await self.embed_chunks_async(
-                chunks, use_async, max_concurrent
+            chunks, embeddings = await self.chunk_and_embed_async(
+                repo_path,
+                repo_name,
+                max_concurrent=max_concurrent,
+                save=False,
+                output_dir=None,
             )
             stats = await self.store_embeddings_async(
                 repo_name, embeddings, collection_name
@@ -191,56 +398,69 @@ class AsyncIngestionService:
                 "error": str(e),
             }
         finally:
-            if cleanup and repo_path:
-                try:
-                    shutil.rmtree(repo_path, ignore_errors=True)
-                except Exception as e:
-                    logger.warning(f"Failed to cleanup {repo_path}: {e}")
+            self._release_clone(repo_url, cleanup)
 
     async def process_batch_async(
-        self, repos: List[Dict[str, str]], max_concurrent: int = 5, cleanup: bool = True
+        self,
+        repos: Iterable[Dict[str, str]],
+        max_concurrent: int = 5,
+        cleanup: bool = True,
+        on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
     ) -> List[Dict[str, Any]]:
-        """Process multiple repositories concurrently."""
-        semaphore = asyncio.Semaphore(max_concurrent)
-
-        async def process_with_semaphore(repo_info):
-            async with semaphore:
-                return await self.process_repository_async(
-                    repo_url=repo_info["repo_url"],
-                    collection_name=repo_info["collection_name"],
-                    use_async=True,
-                    max_concurrent=3,
-                    cleanup=cleanup,
-                )
-
+        """
+        Process multiple repositories concurrently.
+
+        A fixed pool of max_concurrent workers pulls repositories from repos as
+        they free up, so repos may be a lazy iterable and no task is created
+        for a repository before a worker is ready for it.
+
+        on_result, if given, is called with each repository's result as soon
+        as it finishes, so callers can persist results incrementally.
+        """
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+
+        pending = enumerate(repos)
+        results: Dict[int, Dict[str, Any]] = {}
+
+        async def worker():
+            # The shared iterator is only advanced between awaits, so each
+            # repository goes to exactly one worker
+            for i, repo_info in pending:
+                try:
+                    result = await self.process_repository_async(
+                        repo_url=repo_info["repo_url"],
+                        collection_name=repo_info["collection_name"],
+                        use_async=True,
+                        max_concurrent=3,
+                        cleanup=cleanup,
+                    )
+                except Exception as e:
+                    logger.error(f"❌ Repo {i} failed: {e}")
+                    result = {
+                        "status": "failed",
+                        "repo_url": repo_info.get("repo_url"),
+                        "error": str(e),
+                    }
+                results[i] = result
+                if on_result:
+                    on_result(result)
+
+        total = f"{len(repos)} " if isinstance(repos, Sized) else ""
         logger.info(
-            f"🚀 Processing {len(repos)} repositories concurrently (max={max_concurrent})"
+            f"🚀 Processing {total}repositories concurrently (max={max_concurrent})"
         )
 
         try:
-            results = await asyncio.gather(
-                *[process_with_semaphore(repo) for repo in repos],
-                return_exceptions=True,
-            )
-
-            processed_results = []
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    logger.error(f"❌ Repo {i} failed: {result}")
-                    processed_results.append(
-                        {
-                            "status": "failed",
-                            "repo_url": repos[i]["repo_url"],
-                            "error": str(result),
-                        }
-                    )
-                else:
-                    processed_results.append(result)
+            await asyncio.gather(*[worker() for _ in range(max_concurrent)])
 
+            processed_results = [results[i] for i in sorted(results)]
             success_count = sum(
                 1 for r in processed_results if r.get("status") == "success"
             )
-            logger.info(f"✅ Batch complete: {success_count}/{len(repos)} successful")
+            logger.info(
+                f"✅ Batch complete: {success_count}/{len(processed_results)} successful"
+            )
 
             return processed_results
         finally:
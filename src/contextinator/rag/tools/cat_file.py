@@ -2,6 +2,7 @@
 
 import asyncio
 import hashlib
+import logging
 from typing import Dict, List, Optional
 from ..utils.logger import logger
 from ..config import USE_CHROMA_SERVER
@@ -69,7 +70,8 @@ async def cat_file(
     # Sort chunks by start_line first, then by split_index, then by end_line
     chunks.sort(key=lambda x: (x["start_line"], x["split_index"], x["end_line"]))
     
-    logger.debug(f"Chunk details: {[(c['start_line'], c['end_line'], c['is_split'], c['split_index'], len(c['content'])) for c in chunks]}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Chunk details: {[(c['start_line'], c['end_line'], c['is_split'], c['split_index'], len(c['content'])) for c in chunks]}")
 
     # Reconstruct file
     return _reconstruct_file(chunks)
@@ -83,28 +85,29 @@ def _reconstruct_file(chunks: List[Dict]) -> str:
     # Sort by start_line, then by length (longer first)
     chunks.sort(key=lambda x: (int(x.get('start_line', 0)), -int(x.get('end_line', 0))))
     
-    # Remove chunks that are completely contained in other chunks
+    # Remove chunks that are completely contained in other chunks. In this
+    # order every kept chunk starts at or before c, so c is contained if a kept
+    # chunk ends after it, or ends with it but starts earlier; tracking the
+    # furthest end and where the first kept chunk reaching it starts suffices
     unique = []
+    max_end = None
+    max_end_start = 0
     for c in chunks:
         c_start = int(c.get('start_line', 0))
         c_end = int(c.get('end_line', 0))
-        
-        # Check if this chunk is contained in any already-kept chunk
-        is_contained = False
-        for kept in unique:
-            k_start = int(kept.get('start_line', 0))
-            k_end = int(kept.get('end_line', 0))
-            
-            # If c is completely inside kept, skip it
-            if k_start <= c_start and c_end <= k_end and (k_start != c_start or k_end != c_end):
-                is_contained = True
-                break
-        
-        if not is_contained:
-            unique.append(c)
+
+        if max_end is not None and (
+            max_end > c_end or (max_end == c_end and max_end_start < c_start)
+        ):
+            continue
+
+        if max_end is None or c_end > max_end:
+            max_end, max_end_start = c_end, c_start
+        unique.append(c)
     
     # Concatenate with double newline between chunks
-    return '\n\n'.join(c.get('content', '').strip() for c in unique if c.get('content', '').strip())
+    contents = (c.get('content', '').strip() for c in unique)
+    return '\n\n'.join(content for content in contents if content)
 
 
 __all__ = ["cat_file"]
@@ -42,10 +42,14 @@ async def grep_search(
     if not collection_name or not pattern:
         raise ValueError("Collection name and pattern required")
 
+    # Patterns are prepared once here rather than for every scanned line
+    flags = 0 if case_sensitive else re.IGNORECASE
+    search_pattern = pattern if case_sensitive else pattern.lower()
     regex_pattern = None
     if use_regex:
-        flags = 0 if case_sensitive else re.IGNORECASE
         regex_pattern = re.compile(pattern, flags)
+    elif whole_word:
+        regex_pattern = re.compile(r"\b" + re.escape(search_pattern) + r"\b", flags)
 
     where = {"language": language} if language else None
 
@@ -75,29 +79,29 @@ async def grep_search(
     for doc, meta in zip(
         results["documents"][:max_chunks], results["metadatas"][:max_chunks]
     ):
+        lines = doc.split("\n")
+        if use_regex:
+            # Anchors and lookarounds see line edges, so regexes go line by line
+            search_lines = lines
+        else:
+            # A line can only match if its chunk does, so chunks without a match
+            # are skipped before any per-line work; lowering is done once
+            search_doc = doc if case_sensitive else doc.lower()
+            if whole_word:
+                if not regex_pattern.search(search_doc):
+                    continue
+            elif search_pattern not in search_doc:
+                continue
+            search_lines = lines if case_sensitive else search_doc.split("\n")
+
         file_path = meta.get("file_path", "unknown")
         start_line = meta.get("start_line", 1)
 
-        for i, line in enumerate(doc.split("\n")):
-            matched = False
-
-            if use_regex:
-                matched = bool(regex_pattern.search(line))
+        for i, (line, search_line) in enumerate(zip(lines, search_lines)):
+            if use_regex or whole_word:
+                matched = bool(regex_pattern.search(search_line))
             else:
-                search_line = line if case_sensitive else line.lower()
-                search_pattern = pattern if case_sensitive else pattern.lower()
-
-                if whole_word:
-                    word_pattern = r"\b" + re.escape(search_pattern) + r"\b"
-                    matched = bool(
-                        re.search(
-                            word_pattern,
-                            search_line,
-                            0 if case_sensitive else re.IGNORECASE,
-                        )
-                    )
-                else:
-                    matched = search_pattern in search_line
+                matched = search_pattern in search_line
 
             if matched:
                 file_matches[file_path].append(
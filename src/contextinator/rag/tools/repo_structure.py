@@ -1,5 +1,6 @@
 """Repository structure analyzer tool."""
 
+import os
 from pathlib import Path
 from typing import List, Optional
 import json
@@ -35,17 +36,39 @@ def build_tree_dict(
     if should_ignore(path, ignore_patterns):
         return None
 
-    result = {"name": path.name, "type": "dir" if path.is_dir() else "file"}
+    return _build_node(path, path.is_dir(), ignore_patterns, max_depth, current_depth)
 
-    if path.is_dir():
+
+def _build_node(
+    path: Path,
+    is_dir: bool,
+    ignore_patterns: List[str],
+    max_depth: Optional[int],
+    current_depth: int,
+):
+    """Build the tree dict for a path that is known to be included."""
+    result = {"name": path.name, "type": "dir" if is_dir else "file"}
+
+    # Children past max_depth would all be dropped, so skip listing them
+    if is_dir and (max_depth is None or current_depth < max_depth):
         children = []
         try:
-            for item in sorted(path.iterdir(), key=lambda x: (not x.is_dir(), x.name)):
-                child = build_tree_dict(
-                    item, ignore_patterns, max_depth, current_depth + 1
+            # scandir entries cache is_dir(), so each entry is stat'ed at most once
+            with os.scandir(path) as it:
+                entries = sorted(it, key=lambda e: (not e.is_dir(), e.name))
+            for entry in entries:
+                child_path = path / entry.name
+                if should_ignore(child_path, ignore_patterns):
+                    continue
+                children.append(
+                    _build_node(
+                        child_path,
+                        entry.is_dir(),
+                        ignore_patterns,
+                        max_depth,
+                        current_depth + 1,
+                    )
                 )
-                if child:
-                    children.append(child)
         except PermissionError:
             pass
 
@@ -78,6 +101,30 @@ def format_tree_string(node, prefix="", is_last=True):
     return "\n".join(lines)
 
 
+def render_structure(tree, output_format: str = "tree") -> str:
+    """
+    Render a tree built by build_tree_dict in the given format.
+
+    Args:
+        tree: Tree dict from build_tree_dict
+        output_format: 'json' or 'tree'
+
+    Returns:
+        Rendered structure
+    """
+    if output_format == "json":
+        return json.dumps(tree, indent=2)
+
+    # Format tree starting from children to avoid duplicate root
+    if tree and "children" in tree:
+        tree_lines = []
+        children = tree["children"]
+        for i, child in enumerate(children):
+            tree_lines.append(format_tree_string(child, "", i == len(children) - 1))
+        return "\n".join(tree_lines)
+    return "(empty directory)"
+
+
 async def analyze_structure(
     repo_path: str,
     max_depth: Optional[int] = None,
@@ -85,7 +132,13 @@ async def analyze_structure(
     output_file: Optional[str] = None,
     ignore_patterns: Optional[List[str]] = None,
 ) -> str:
-    """Analyze repository structure (async)."""
+    """
+    Analyze repository structure (async).
+
+    output_format may list several comma-separated formats (e.g. 'tree,json');
+    the directory is walked once and each format is rendered from that tree,
+    separated by a blank line.
+    """
     path = Path(repo_path).resolve()
 
     if not path.exists():
@@ -104,18 +157,9 @@ async def analyze_structure(
         None, lambda: build_tree_dict(path, ignore_patterns, max_depth)
     )
 
-    if output_format == "json":
-        output = json.dumps(tree, indent=2)
-    else:
-        # Format tree starting from children to avoid duplicate root
-        if tree and "children" in tree:
-            tree_lines = []
-            children = tree["children"]
-            for i, child in enumerate(children):
-                tree_lines.append(format_tree_string(child, "", i == len(children) - 1))
-            output = "\n".join(tree_lines)
-        else:
-            output = "(empty directory)"
+    # Every requested format is rendered from the one walk of the tree
+    formats = [f.strip() for f in output_format.split(",") if f.strip()]
+    output = "\n\n".join(render_structure(tree, f) for f in formats or ["tree"])
 
     if output_file:
         await loop.run_in_executor(
@@ -129,4 +173,4 @@ async def analyze_structure(
 # Keep old name for compatibility
 analyze_structure_async = analyze_structure
 
-__all__ = ["analyze_structure", "analyze_structure_async"]
+__all__ = ["analyze_structure", "analyze_structure_async", "render_structure"]
@@ -1,11 +1,15 @@
 """Semantic search with TRUE async (no thread pool)."""
 
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional
 from ..utils.logger import logger
 from ..config import USE_CHROMA_SERVER
 
 _async_embedding_service = None
 _async_chroma_client = None
+# Embeddings of recent queries by enriched query text, least recently used first
+_query_embeddings: "OrderedDict[str, List[float]]" = OrderedDict()
+_QUERY_EMBEDDING_CACHE_SIZE = 64
 
 
 def _get_async_embedding_service():
@@ -36,6 +40,25 @@ async def _get_async_chroma_client():
     return _async_chroma_client
 
 
+async def _embed_query(enriched_query: str) -> List[float]:
+    """Embed a query, reusing the embedding of a recent identical query."""
+    embedding = _query_embeddings.get(enriched_query)
+    if embedding is not None:
+        _query_embeddings.move_to_end(enriched_query)
+        return embedding
+
+    client = _get_async_embedding_service()
+    response = await client.embeddings.create(
+        model="text-embedding-3-large", input=enriched_query
+    )
+    embedding = response.data[0].embedding
+
+    _query_embeddings[enriched_query] = embedding
+    if len(_query_embeddings) > _QUERY_EMBEDDING_CACHE_SIZE:
+        _query_embeddings.popitem(last=False)
+    return embedding
+
+
 async def semantic_search(
     collection_name: str,
     query: str,
@@ -45,8 +68,14 @@ async def semantic_search(
     node_type: Optional[str] = None,
     include_parents: bool = False,
     chromadb_dir: Optional[str] = None,
+    query_embedding: Optional[List[float]] = None,
 ) -> List[Dict[str, Any]]:
-    """TRUE async semantic search (no thread pool!)."""
+    """
+    TRUE async semantic search (no thread pool!).
+
+    The query is embedded unless query_embedding is given; embeddings of
+    recent identical queries are reused instead of calling the API again.
+    """
     from ..utils.exceptions import ValidationError
     import asyncio
 
@@ -54,13 +83,9 @@ async def semantic_search(
         raise ValidationError("Invalid parameters", "params", "valid values")
 
     # Get embedding async (TRUE async - no threads!)
-    client = _get_async_embedding_service()
-    enriched_query = f"Language: {language}\n\n{query}" if language else query
-
-    response = await client.embeddings.create(
-        model="text-embedding-3-large", input=enriched_query
-    )
-    query_embedding = response.data[0].embedding
+    if query_embedding is None:
+        enriched_query = f"Language: {language}\n\n{query}" if language else query
+        query_embedding = await _embed_query(enriched_query)
 
     # Build filters
     where = {}
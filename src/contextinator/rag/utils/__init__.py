@@ -15,17 +15,26 @@ from .exceptions import (
     ValidationError,
     VectorStoreError,
 )
-from .hash_utils import hash_content
 from .logger import logger, setup_logger
-from .progress import ProgressTracker
-from .repo_utils import (
-    clone_repo,
-    git_root,
-    is_valid_git_url,
-    resolve_repo_path,
-)
-from .token_counter import count_tokens
-from .toon_encoder import toon_encode
+
+# The remaining helpers are imported on first access, so startup paths that
+# only need logging and exceptions skip hashing, JSON and repository modules
+_LAZY_IMPORTS = {
+    "hash_content": ".hash_utils",
+    "dump_json": ".json_utils",
+    "dumps_json": ".json_utils",
+    "load_json": ".json_utils",
+    "loads_json": ".json_utils",
+    "ProgressTracker": ".progress",
+    "clone_repo": ".repo_utils",
+    "git_root": ".repo_utils",
+    "is_valid_git_url": ".repo_utils",
+    "repo_relative_path": ".repo_utils",
+    "resolve_repo_path": ".repo_utils",
+    "count_tokens": ".token_counter",
+    "count_tokens_batch": ".token_counter",
+    "toon_encode": ".toon_encoder",
+}
 
 __all__ = [
     "ConfigurationError",
@@ -38,12 +47,29 @@ __all__ = [
     "VectorStoreError",
     "clone_repo",
     "count_tokens",
+    "count_tokens_batch",
+    "dump_json",
+    "dumps_json",
     "git_root",
     "hash_content",
     "is_valid_git_url",
+    "load_json",
+    "loads_json",
     "logger",
     "ProgressTracker",
+    "repo_relative_path",
     "resolve_repo_path",
     "setup_logger",
     "toon_encode",
 ]
+
+
+def __getattr__(name):
+    """Lazy import public names to avoid loading unused helper modules."""
+    if name in _LAZY_IMPORTS:
+        from importlib import import_module
+
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
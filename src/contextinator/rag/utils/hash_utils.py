@@ -7,16 +7,28 @@ deduplication and content identification.
 
 import hashlib
 
+try:
+    import xxhash
+
+    XXHASH_AVAILABLE = True
+except ImportError:
+    xxhash = None
+    XXHASH_AVAILABLE = False
+
 
 def hash_content(content: str) -> str:
     """
-    Generate SHA256 hash of content for deduplication.
+    Generate a hash of content for deduplication.
+
+    Uses 128-bit XXH3 when xxhash is installed and SHA256 otherwise. The hash
+    is only a deduplication key, so it does not need to be cryptographic, but
+    hashes from the two algorithms are not comparable with each other.
 
     Args:
         content: String content to hash
 
     Returns:
-        Hexadecimal SHA256 hash string
+        Hexadecimal hash string
 
     Raises:
         TypeError: If content is not a string
@@ -24,6 +36,9 @@ def hash_content(content: str) -> str:
     if not isinstance(content, str):
         raise TypeError("Content must be a string")
 
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_128_hexdigest(content.encode("utf-8"))
+
     return hashlib.sha256(content.encode("utf-8")).hexdigest()
 
 
@@ -0,0 +1,116 @@
+"""
+JSON serialization utilities for Contextinator.
+
+This module provides helpers for reading and writing the JSON artifacts
+(chunks, AST trees, overviews) using orjson when it is installed, with a
+fallback to the standard library json module.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def dumps_json(data: Any, indent: bool = True) -> bytes:
+    """
+    Serialize data to UTF-8 encoded JSON.
+
+    Args:
+        data: JSON-serializable data structure
+        indent: Pretty-print with two-space indentation (default: True);
+                when False the output is a single line
+
+    Returns:
+        Encoded JSON document
+
+    Raises:
+        TypeError: If data is not JSON-serializable
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(data, option=option)
+        except TypeError:
+            # orjson rejects a few inputs json accepts (e.g. ints wider than 64 bits)
+            pass
+
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode(
+        "utf-8"
+    )
+
+
+def loads_json(raw: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON document.
+
+    Args:
+        raw: Encoded JSON document
+
+    Returns:
+        Parsed JSON data
+
+    Raises:
+        json.JSONDecodeError: If raw is not valid JSON
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def dump_json(data: Any, file_path: Union[str, Path]) -> None:
+    """
+    Atomically write data to a JSON file.
+
+    The document is written to a sibling temporary file in a single call and
+    then moved into place, so readers never observe a partially written file.
+
+    Args:
+        data: JSON-serializable data structure
+        file_path: Destination file path
+
+    Raises:
+        TypeError: If data is not JSON-serializable
+        OSError: If the file cannot be written
+    """
+    file_path = Path(file_path)
+    payload = dumps_json(data)
+    tmp_path = file_path.with_name(file_path.name + ".tmp")
+
+    try:
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def load_json(file_path: Union[str, Path]) -> Any:
+    """
+    Read and parse a JSON file.
+
+    Args:
+        file_path: Path to the JSON file
+
+    Returns:
+        Parsed JSON data
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON
+        OSError: If the file cannot be read
+    """
+    with open(file_path, "rb") as f:
+        return loads_json(f.read())
+
+
+__all__ = ["dump_json", "dumps_json", "load_json", "loads_json"]
@@ -5,9 +5,9 @@ This module provides functions to format and display search results,
 file contents, and other CLI output using the centralized logger.
 """
 
-import json
 from typing import Any, Dict, List, Optional
 
+from .json_utils import dumps_json
 from .logger import logger
 
 
@@ -141,6 +141,9 @@ def export_results_json(results: List[Dict[str, Any]], filepath: str) -> None:
     """
     Export search results to JSON file.
 
+    The document is encoded straight to UTF-8 bytes (with orjson when it is
+    installed) and written in one call, without an intermediate str.
+
     Args:
         results: List of search results
         filepath: Path to output JSON file
@@ -151,8 +154,9 @@ def export_results_json(results: List[Dict[str, Any]], filepath: str) -> None:
     from .exceptions import FileSystemError
 
     try:
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        payload = dumps_json(results)
+        with open(filepath, "wb") as f:
+            f.write(payload)
         logger.info(f"✅ Results exported to: {filepath}")
     except Exception as e:
         raise FileSystemError(f"Failed to export JSON: {e}", filepath, "write")
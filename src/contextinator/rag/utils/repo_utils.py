@@ -7,8 +7,10 @@ cloning, path resolution, and URL validation.
 
 import os
 import tempfile
+from functools import lru_cache
+from pathlib import Path
 from subprocess import run, CalledProcessError
-from typing import Optional
+from typing import Optional, Union
 
 from .logger import logger
 from .exceptions import FileSystemError
@@ -27,18 +29,8 @@ def git_root(path: Optional[str] = None) -> str:
     Raises:
         FileSystemError: If not a git repository or git command fails
     """
-    path_params = []
-    if path:
-        path_params = ["-C", str(path)]
-
     try:
-        result = run(
-            ["git"] + path_params + ["rev-parse", "--show-toplevel"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        return result.stdout.strip()
+        return _git_toplevel(os.path.abspath(path) if path else os.getcwd())
     except (CalledProcessError, FileNotFoundError) as e:
         check_path = path or os.getcwd()
         raise FileSystemError(
@@ -48,6 +40,32 @@ def git_root(path: Optional[str] = None) -> str:
         )
 
 
+@lru_cache(maxsize=256)
+def _git_toplevel(abs_path: str) -> str:
+    """
+    Run git rev-parse for an absolute path, caching results per process.
+
+    Only successful lookups are cached; failures raise and are retried.
+
+    Args:
+        abs_path: Absolute directory path
+
+    Returns:
+        Git repository root path
+
+    Raises:
+        CalledProcessError: If abs_path is not in a git repository
+        FileNotFoundError: If git is not installed
+    """
+    result = run(
+        ["git", "-C", abs_path, "rev-parse", "--show-toplevel"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip()
+
+
 def clone_repo(repo_url: str, target_dir: Optional[str] = None) -> str:
     """
     Clone a git repository to target directory or temp directory.
@@ -172,10 +190,42 @@ def extract_repo_name_from_url(repo_url: Optional[str]) -> Optional[str]:
     return parts[-1] if parts else None
 
 
+def repo_relative_path(
+    file_path: Union[str, Path], repo_path: Union[str, Path]
+) -> str:
+    """
+    Get a file's path relative to the repository root, with forward slashes.
+
+    Equivalent to ``Path(file_path).relative_to(repo_path).as_posix()``, but
+    slices the common string prefix in the usual case where file_path was
+    built under repo_path, avoiding Path parsing for every file.
+
+    Args:
+        file_path: Path to a file inside the repository
+        repo_path: Repository root path
+
+    Returns:
+        Repository-relative path using '/' separators
+
+    Raises:
+        ValueError: If file_path is not within repo_path
+    """
+    file_str = str(file_path)
+    prefix = os.path.join(str(Path(repo_path)), "")
+
+    if file_str.startswith(prefix):
+        relative = file_str[len(prefix) :]
+    else:
+        relative = str(Path(file_path).relative_to(repo_path))
+
+    return relative if os.sep == "/" else relative.replace(os.sep, "/")
+
+
 __all__ = [
     "git_root",
     "clone_repo",
     "resolve_repo_path",
     "is_valid_git_url",
     "extract_repo_name_from_url",
+    "repo_relative_path",
 ]
@@ -4,13 +4,17 @@ Custom help formatter using Rich library for better CLI output.
 
 import argparse
 import sys
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.text import Text
-from rich import box
+from functools import lru_cache
 
-console = Console()
+
+# Rich is only imported once help is actually rendered, so building the
+# parser for a regular command does not pay for it
+@lru_cache(maxsize=None)
+def _get_console():
+    """Return the shared Rich console used for help output."""
+    from rich.console import Console
+
+    return Console()
 
 
 class RichHelpFormatter(argparse.RawDescriptionHelpFormatter):
@@ -25,6 +29,7 @@ class RichHelpFormatter(argparse.RawDescriptionHelpFormatter):
         if " " in self._prog:
             # Capture console output
             from io import StringIO
+            from rich.console import Console
 
             buffer = StringIO()
             rich_console = Console(file=buffer, force_terminal=True, width=100)
@@ -125,6 +130,10 @@ class RichHelpFormatter(argparse.RawDescriptionHelpFormatter):
 
 def print_main_help():
     """Print the main help message with rich formatting."""
+    from rich import box
+    from rich.table import Table
+
+    console = _get_console()
 
     # Header
     console.print()
@@ -274,6 +283,9 @@ def print_command_group_help(title, commands_info):
         title: Group title
         commands_info: List of tuples (command_name, description)
     """
+    from rich.table import Table
+
+    console = _get_console()
     console.print()
     console.print(f"[bold yellow]{title}[/bold yellow]")
     console.print()
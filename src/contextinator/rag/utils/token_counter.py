@@ -6,12 +6,20 @@ OpenAI's official tokenizer, ensuring accurate token counts for chunking.
 """
 
 from functools import lru_cache
+from typing import List
 
 import tiktoken
 
 from .logger import logger
 
 
+# Texts shorter than this are memoized; longer ones are rarely repeated
+_CACHED_TEXT_MAX_LEN = 512
+
+# Fewest uncached texts for which count_tokens_batch uses encode_batch
+_MIN_BATCH_ENCODE = 8
+
+
 @lru_cache(maxsize=8)
 def _get_encoding(model: str) -> tiktoken.Encoding:
     """
@@ -45,6 +53,8 @@ def count_tokens(text: str, model: str = "text-embedding-3-large") -> int:
 
     This uses BPE (Byte Pair Encoding) tokenization which accurately matches
     how OpenAI models tokenize text, ensuring chunk sizes stay within limits.
+    Special-token text such as <|endoftext|> is counted as ordinary text, as
+    the embeddings API reads it, rather than raising ValueError.
 
     Args:
         text: Text to count tokens for
@@ -70,8 +80,67 @@ def count_tokens(text: str, model: str = "text-embedding-3-large") -> int:
     if not text:
         return 0
 
+    if len(text) < _CACHED_TEXT_MAX_LEN:
+        return _count_tokens_cached(text, model)
+
     encoding = _get_encoding(model)
-    return len(encoding.encode(text))
+    return len(encoding.encode(text, disallowed_special=()))
 
 
-__all__ = ["count_tokens"]
+def count_tokens_batch(
+    texts: List[str], model: str = "text-embedding-3-large"
+) -> List[int]:
+    """
+    Count tokens for many texts in one call.
+
+    Short texts are served from the same cache as count_tokens; longer ones
+    are encoded together with tiktoken's encode_batch, which runs the Rust
+    encoder on a thread pool outside the GIL.
+
+    Args:
+        texts: Texts to count tokens for
+        model: Model name to use for tokenization (default: text-embedding-3-large)
+
+    Returns:
+        Number of tokens in each text, in input order
+
+    Raises:
+        TypeError: If any text is not a string
+        ValueError: If model is empty or None
+    """
+    counts = [0] * len(texts)
+    long_indices = []
+
+    for i, text in enumerate(texts):
+        if not isinstance(text, str):
+            raise TypeError("Text must be a string")
+        if not text:
+            continue
+        if len(text) < _CACHED_TEXT_MAX_LEN:
+            counts[i] = _count_tokens_cached(text, model)
+        else:
+            long_indices.append(i)
+
+    if long_indices:
+        encoding = _get_encoding(model)
+        if len(long_indices) < _MIN_BATCH_ENCODE:
+            # Not worth starting encode_batch's thread pool
+            for i in long_indices:
+                counts[i] = len(encoding.encode(texts[i], disallowed_special=()))
+        else:
+            encoded = encoding.encode_batch(
+                [texts[i] for i in long_indices], disallowed_special=()
+            )
+            for i, tokens in zip(long_indices, encoded):
+                counts[i] = len(tokens)
+
+    return counts
+
+
+@lru_cache(maxsize=100_000)
+def _count_tokens_cached(text: str, model: str) -> int:
+    """Count tokens for short texts, which repeat often (blank lines, imports)."""
+    return len(_get_encoding(model).encode(text, disallowed_special=()))
+
+
+__all__ = ["count_tokens", "count_tokens_batch"]
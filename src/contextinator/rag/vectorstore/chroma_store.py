@@ -23,6 +23,55 @@ from ..config import (
 )
 from ..utils import ProgressTracker, logger
 
+# ChromaDB clients shared by every store in the process, keyed by their target,
+# so repeated stores (e.g. a batch of repositories) reuse open connections
+_client_cache: Dict[Tuple[str, str], Any] = {}
+
+
+def _get_server_client(host: str, port: int) -> Any:
+    """
+    Get the cached ChromaDB server client for host:port, connecting if needed.
+
+    Args:
+        host: ChromaDB server host
+        port: ChromaDB server port
+
+    Returns:
+        ChromaDB HTTP client
+
+    Raises:
+        Exception: If the server cannot be reached (nothing is cached then)
+    """
+    key = ("server", f"{host}:{port}")
+    client = _client_cache.get(key)
+    if client is None:
+        client = chromadb.HttpClient(host=host, port=port)
+        # Test connection
+        client.heartbeat()
+        _client_cache[key] = client
+    return client
+
+
+def _get_local_client(db_path: str) -> Any:
+    """
+    Get the cached persistent ChromaDB client for db_path, opening it if needed.
+
+    Args:
+        db_path: ChromaDB database directory
+
+    Returns:
+        ChromaDB persistent client
+    """
+    key = ("local", os.path.abspath(db_path))
+    client = _client_cache.get(key)
+    if client is None:
+        client = chromadb.PersistentClient(
+            path=db_path,
+            settings=Settings(anonymized_telemetry=False, allow_reset=True),
+        )
+        _client_cache[key] = client
+    return client
+
 
 class ChromaVectorStore:
     """
@@ -83,10 +132,7 @@ class ChromaVectorStore:
                 parsed_url = urlparse(CHROMA_SERVER_URL)
                 host = parsed_url.hostname or "localhost"
                 port = parsed_url.port or 8000
-                self.client = chromadb.HttpClient(host=host, port=port)
-
-                # Test connection
-                self.client.heartbeat()
+                self.client = _get_server_client(host, port)
                 logger.info("ChromaDB server connection successful")
                 self.using_server = True  # Mark that we're using server
                 return
@@ -128,10 +174,7 @@ class ChromaVectorStore:
             )
 
         try:
-            self.client = chromadb.PersistentClient(
-                path=self.db_path,
-                settings=Settings(anonymized_telemetry=False, allow_reset=True),
-            )
+            self.client = _get_local_client(self.db_path)
             logger.info(f"ChromaDB local persistence at: {self.db_path}")
         except Exception as e:
             raise VectorStoreError(
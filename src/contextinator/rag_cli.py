@@ -1,42 +1,115 @@
 import argparse
+import asyncio
 import sys
+from pathlib import Path
 from contextinator.rag.utils import resolve_repo_path, logger
 from contextinator.rag.utils.exceptions import FileSystemError
 from contextinator.rag.utils.rich_help import print_main_help, RichHelpFormatter
 import os
-from contextinator.rag.chunking import chunk_repository
-from contextinator.rag.config import get_storage_path
 
 
-def chunk_func(args):
-    from pathlib import Path
-    from contextinator.rag.utils.repo_utils import extract_repo_name_from_url
+def _run_async(coro):
+    """Run a coroutine to completion, on uvloop's faster event loop if installed."""
+    # uvloop is optional (and unavailable on Windows); uvloop.run needs >= 0.18
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    return uvloop.run(coro)
+
+
+def _run_in_background(args):
+    """
+    Re-run the current command in a detached process that logs to a file.
+
+    Used by --embed-mode async: the command line is repeated with
+    --embed-mode sync, so the background run does exactly what a blocking
+    run would, while this process returns immediately.
+
+    Args:
+        args: Parsed command arguments (command, output)
+
+    Returns:
+        Path of the background run's log file
+    """
+    import subprocess
+    import time
 
-    repo_url = getattr(args, "repo_url", None)
+    log_dir = Path(args.output or os.getcwd()) / ".contextinator" / "logs"
+    log_path = log_dir / f"{args.command}-{time.strftime('%Y%m%d-%H%M%S')}.log"
+    command = [sys.executable, "-m", "contextinator.rag_cli", *sys.argv[1:]]
 
     try:
-        repo_path = resolve_repo_path(
-            repo_url=repo_url, path=getattr(args, "path", None)
-        )
-    except FileSystemError as e:
-        logger.error(str(e))
+        log_dir.mkdir(parents=True, exist_ok=True)
+        with open(log_path, "ab") as log_file:
+            process = subprocess.Popen(
+                command + ["--embed-mode", "sync"],
+                stdin=subprocess.DEVNULL,
+                stdout=log_file,
+                stderr=subprocess.STDOUT,
+                # Keep running after the terminal that started it closes
+                start_new_session=True,
+                creationflags=getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0),
+            )
+    except OSError as e:
+        logger.error(f"Could not start background embedding: {e}")
         sys.exit(1)
 
+    logger.info(f"📬 Embedding queued in background process {process.pid}")
+    logger.info(f"   Log: {log_path}")
+    return log_path
+
+
+def _resolve_repo(args):
+    """
+    Resolve the repository path, name and base output directory from args.
+
+    Args:
+        args: Parsed command arguments (repo_url, path, repo_name, output)
+
+    Returns:
+        Tuple of (repo_path, repo_name, base_dir)
+
+    Raises:
+        FileSystemError: If the repository cannot be resolved
+    """
+    from contextinator.rag.utils.repo_utils import extract_repo_name_from_url
+
+    repo_url = args.repo_url
+
+    repo_path = resolve_repo_path(repo_url=repo_url, path=args.path)
+
     # Determine repository name
     # If cloned from URL, extract name from URL instead of temp directory name
     if repo_url:
         repo_name = extract_repo_name_from_url(repo_url)
+    elif getattr(args, "repo_name", None):
+        repo_name = args.repo_name
     else:
         repo_name = Path(repo_path).name
 
     # Use output dir if specified, otherwise current directory
-    output_dir = getattr(args, "output", None) or os.getcwd()
+    base_dir = args.output or os.getcwd()
+
+    return repo_path, repo_name, base_dir
+
+
+def chunk_func(args):
+    from contextinator.rag.chunking import chunk_repository
+    from contextinator.rag.config import get_storage_path
+
+    try:
+        repo_path, repo_name, output_dir = _resolve_repo(args)
+    except FileSystemError as e:
+        logger.error(str(e))
+        sys.exit(1)
 
     # Get custom chunks directory if specified
     custom_chunks_dir = getattr(
         args, "chunks_dir", None
     )  # Check if AST saving is requested
-    save_ast = getattr(args, "save_ast", False)
+    save_ast = args.save_ast
+    save_full_ast = args.save_full_ast
 
     chunks = chunk_repository(
         repo_path=repo_path,
@@ -45,52 +118,42 @@ def chunk_func(args):
         output_dir=output_dir,
         save_ast=save_ast,
         custom_chunks_dir=custom_chunks_dir,
+        save_full_ast=save_full_ast,
     )
     logger.info(f"✅ Chunking complete: {len(chunks)} chunks created")
 
-    if args.save:
+    if args.save or save_ast:
         chunks_path = get_storage_path(
             output_dir, "chunks", repo_name, custom_chunks_dir
         )
+
+    if args.save:
         logger.info(f"Chunks saved in: {chunks_path}/")
 
     if save_ast:
         logger.info("AST trees saved for analysis")
-        chunks_path = get_storage_path(
-            output_dir, "chunks", repo_name, custom_chunks_dir
-        )
         logger.info(f"Check: {chunks_path}/ast_trees/ for AST files")
 
 
 def embed_func(args):
     """Generate embeddings for existing chunks."""
+    if args.embed_mode == "async":
+        _run_in_background(args)
+        return
+
+    from contextinator.rag.config import get_storage_path
     from contextinator.rag.embedding import embed_chunks
-    from contextinator.rag.utils import resolve_repo_path, logger
-    from contextinator.rag.utils.repo_utils import extract_repo_name_from_url
-    from pathlib import Path
-    import os
-    # Set API key if provided
 
-    if hasattr(args, "api_key") and args.api_key:
+    # Set API key if provided
+    if args.api_key:
         os.environ["OPENAI_API_KEY"] = args.api_key
 
     try:
-        repo_url = getattr(args, "repo_url", None)
-
-        repo_path = resolve_repo_path(
-            repo_url=repo_url, path=getattr(args, "path", None)
-        )
+        repo_path, repo_name, base_dir = _resolve_repo(args)
 
-        # Determine repository name
-        if repo_url:
-            repo_name = extract_repo_name_from_url(repo_url)
-        else:
-            repo_name = Path(repo_path).name
-
-        base_dir = getattr(args, "output", None) or os.getcwd()
         # Get custom directory arguments
-        custom_chunks_dir = getattr(args, "chunks_dir", None)
-        custom_embeddings_dir = getattr(args, "embeddings_dir", None)
+        custom_chunks_dir = args.chunks_dir
+        custom_embeddings_dir = args.embeddings_dir
         logger.info(f"Generating embeddings for repository: {repo_name}")
 
         # Generate embeddings
@@ -100,6 +163,9 @@ def embed_func(args):
             save=args.save,
             custom_chunks_dir=custom_chunks_dir,
             custom_embeddings_dir=custom_embeddings_dir,
+            batch_size=args.batch_size,
+            max_concurrent=args.max_concurrent_batches,
+            reuse=not args.no_reuse,
         )
 
         logger.info(
@@ -114,27 +180,36 @@ def embed_func(args):
 
     except Exception as e:
         logger.error(f"Embedding generation failed: {str(e)}")
-        exit(1)
+        sys.exit(1)
+
+
+def _write_stdout(text):
+    """Write text plus a newline to stdout in a single binary write."""
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        # Replaced stdout (e.g. a StringIO under test) has no binary layer
+        print(text)
+        return
+    sys.stdout.flush()
+    buffer.write((text + "\n").encode(sys.stdout.encoding or "utf-8", "replace"))
+    buffer.flush()
 
 
 def structure_func(args):
     """Analyze and display repository structure."""
-    import asyncio
     from contextinator.rag.tools.repo_structure import analyze_structure_async
     from contextinator.rag.utils import resolve_repo_path, logger
 
     try:
-        repo_url = getattr(args, "repo_url", None)
+        repo_url = args.repo_url
 
-        repo_path = resolve_repo_path(
-            repo_url=repo_url, path=getattr(args, "path", None)
-        )
+        repo_path = resolve_repo_path(repo_url=repo_url, path=args.path)
 
-        max_depth = getattr(args, "depth", None)
-        output_format = getattr(args, "format", "tree")
-        output_file = getattr(args, "output", None)
+        max_depth = args.depth
+        output_format = args.format
+        output_file = args.output
 
-        structure = asyncio.run(
+        structure = _run_async(
             analyze_structure_async(
                 repo_path=repo_path,
                 max_depth=max_depth,
@@ -143,7 +218,9 @@ def structure_func(args):
             )
         )
 
-        print(structure)
+        # The file was already written by analyze_structure_async
+        if not output_file:
+            _write_stdout(structure)
 
     except Exception as e:
         logger.error(f"Structure analysis failed: {str(e)}")
@@ -154,37 +231,20 @@ def store_embeddings_func(args):
     """Store embeddings in ChromaDB vector store."""
     from contextinator.rag.embedding import load_embeddings
     from contextinator.rag.vectorstore import store_repository_embeddings
-    from contextinator.rag.utils import resolve_repo_path, logger
-    from contextinator.rag.utils.repo_utils import extract_repo_name_from_url
-    from pathlib import Path
-    import os
 
     try:
-        repo_url = getattr(args, "repo_url", None)
-
-        repo_path = resolve_repo_path(
-            repo_url=repo_url, path=getattr(args, "path", None)
-        )
+        repo_path, repo_name, base_dir = _resolve_repo(args)
 
-        # Determine repository name
-        if repo_url:
-            repo_name = extract_repo_name_from_url(repo_url)
-        elif getattr(args, "repo_name", None):
-            repo_name = args.repo_name
-        else:
-            repo_name = Path(repo_path).name
-
-        base_dir = getattr(args, "output", None) or os.getcwd()
         # Get custom directory arguments
-        custom_embeddings_dir = getattr(args, "embeddings_dir", None)
-        custom_chromadb_dir = getattr(args, "chromadb_dir", None)
+        custom_embeddings_dir = args.embeddings_dir
+        custom_chromadb_dir = args.chromadb_dir
         logger.info(f"Storing embeddings for repository: {repo_name}")
 
         # Load embeddings
         embedded_chunks = load_embeddings(base_dir, repo_name, custom_embeddings_dir)
 
         # Determine collection name
-        collection_name = getattr(args, "collection_name", None) or repo_name
+        collection_name = args.collection_name or repo_name
 
         # Store in ChromaDB
         stats = store_repository_embeddings(
@@ -201,67 +261,58 @@ def store_embeddings_func(args):
 
     except Exception as e:
         logger.error(f"Embedding storage failed: {str(e)}")
-        exit(1)
+        sys.exit(1)
 
 
 def pipeline_func(args):
     """Combined chunk + embed + store-embeddings pipeline."""
-    from contextinator.rag.embedding import embed_chunks
+    if args.embed_mode == "async":
+        _run_in_background(args)
+        return
+
+    from contextinator.rag.config import get_storage_path
+    from contextinator.rag.embedding import save_embeddings
+    from contextinator.rag.ingestion import AsyncIngestionService
     from contextinator.rag.vectorstore import store_repository_embeddings
-    from contextinator.rag.utils import resolve_repo_path, logger
-    from contextinator.rag.utils.repo_utils import extract_repo_name_from_url
-    from pathlib import Path
-    import os
 
     try:
-        repo_url = getattr(args, "repo_url", None)
-
-        repo_path = resolve_repo_path(
-            repo_url=repo_url, path=getattr(args, "path", None)
-        )
-
-        # Determine repository name
-        if repo_url:
-            repo_name = extract_repo_name_from_url(repo_url)
-        else:
-            repo_name = Path(repo_path).name
+        repo_path, repo_name, base_dir = _resolve_repo(args)
 
         # Get custom directory arguments
-        custom_chunks_dir = getattr(args, "chunks_dir", None)
-        custom_embeddings_dir = getattr(args, "embeddings_dir", None)
-        custom_chromadb_dir = getattr(args, "chromadb_dir", None)
-        base_dir = getattr(args, "output", None) or os.getcwd()
+        custom_chunks_dir = args.chunks_dir
+        custom_embeddings_dir = args.embeddings_dir
+        custom_chromadb_dir = args.chromadb_dir
 
         logger.info(f"Starting complete pipeline for repository: {repo_name}")
 
-        # Step 1: Chunk repository
-        logger.info("\n📝 Step 1: Chunking repository...")
-        chunks = chunk_repository(
-            repo_path=repo_path,
-            repo_name=repo_name,
-            save=args.save,
-            output_dir=base_dir,
-            custom_chunks_dir=custom_chunks_dir,
+        # Steps 1-2: Chunk repository and generate embeddings; batches are
+        # embedded while the rest of the repository is still being chunked
+        logger.info("\n📝🧠 Steps 1-2: Chunking repository and generating embeddings...")
+        service = AsyncIngestionService(base_dir=base_dir)
+        chunks, embedded_chunks = _run_async(
+            service.chunk_and_embed_async(
+                repo_path,
+                repo_name,
+                batch_size=args.batch_size,
+                max_concurrent=args.max_concurrent_batches,
+                reuse=not args.no_reuse,
+                custom_embeddings_dir=custom_embeddings_dir,
+                save=args.save,
+                output_dir=base_dir,
+                custom_chunks_dir=custom_chunks_dir,
+            )
         )
 
         if not chunks:
             logger.info("❌ No chunks generated. Pipeline stopped.")
-            exit(1)
+            sys.exit(1)
 
-        # Step 2: Generate embeddings
-        logger.info("\n🧠 Step 2: Generating embeddings...")
-        embedded_chunks = embed_chunks(
-            base_dir,
-            repo_name,
-            save=args.save,
-            chunks_data=chunks,
-            custom_chunks_dir=custom_chunks_dir,
-            custom_embeddings_dir=custom_embeddings_dir,
-        )
+        if args.save:
+            save_embeddings(embedded_chunks, base_dir, repo_name, custom_embeddings_dir)
 
         # Step 3: Store in vector database
         logger.info("\n🗄️  Step 3: Storing in vector database...")
-        collection_name = getattr(args, "collection_name", None) or repo_name
+        collection_name = args.collection_name or repo_name
         stats = store_repository_embeddings(
             base_dir, repo_name, embedded_chunks, collection_name
         )
@@ -289,7 +340,7 @@ def pipeline_func(args):
 
     except Exception as e:
         logger.error(f"Pipeline failed: {str(e)}")
-        exit(1)
+        sys.exit(1)
 
 
 def query_func(args):
@@ -299,10 +350,8 @@ def query_func(args):
 
 def async_batch_func(args):
     """Process multiple repositories asynchronously."""
-    import asyncio
-    import json
     from contextinator.rag.ingestion import AsyncIngestionService
-    from pathlib import Path
+    from contextinator.rag.utils.json_utils import dump_json, dumps_json, load_json
 
     try:
         # Load repos from JSON file
@@ -311,39 +360,64 @@ def async_batch_func(args):
             logger.error(f"Repos file not found: {repos_file}")
             sys.exit(1)
 
-        with open(repos_file, "r") as f:
-            repos = json.load(f)
+        repos = load_json(repos_file)
 
         if not isinstance(repos, list):
             logger.error("Repos file must contain a JSON array of repo objects")
             sys.exit(1)
 
         # Validate repo format
-        for i, repo in enumerate(repos):
-            if "repo_url" not in repo or "collection_name" not in repo:
-                logger.error(
-                    f"Repo {i} missing required fields: repo_url, collection_name"
-                )
-                sys.exit(1)
+        required = {"repo_url", "collection_name"}
+        bad = [
+            i
+            for i, repo in enumerate(repos)
+            if not isinstance(repo, dict) or not required.issubset(repo)
+        ]
+        if bad:
+            logger.error(
+                f"Repos at indices {bad} missing required fields: repo_url, collection_name"
+            )
+            sys.exit(1)
 
-        base_dir = getattr(args, "output", None) or os.getcwd()
-        max_concurrent = getattr(args, "max_concurrent", 3)
-        cleanup = not getattr(args, "no_cleanup", False)
+        base_dir = args.output or os.getcwd()
+        max_concurrent = args.max_concurrent
+        cleanup = not args.no_cleanup
 
         logger.info(f"🚀 Starting async batch processing for {len(repos)} repositories")
         logger.info(f"   Base directory: {base_dir}")
         logger.info(f"   Max concurrent: {max_concurrent}")
         logger.info(f"   Cleanup: {cleanup}")
 
+        results_file = args.results_file
+        results_path = Path(results_file) if results_file else None
+        # NDJSON results are written line by line as each repo finishes, so an
+        # interrupted batch keeps the results it already has
+        stream_results = results_path is not None and results_path.suffix in (
+            ".ndjson",
+            ".jsonl",
+        )
+
         # Run async batch processing
-        async def run_batch():
+        async def run_batch(on_result=None):
             service = AsyncIngestionService(base_dir=base_dir)
             results = await service.process_batch_async(
-                repos=repos, max_concurrent=max_concurrent, cleanup=cleanup
+                repos=repos,
+                max_concurrent=max_concurrent,
+                cleanup=cleanup,
+                on_result=on_result,
             )
             return results
 
-        results = asyncio.run(run_batch())
+        if stream_results:
+            with open(results_path, "wb") as results_out:
+
+                def write_result(result):
+                    results_out.write(dumps_json(result, indent=False) + b"\n")
+                    results_out.flush()
+
+                results = _run_async(run_batch(write_result))
+        else:
+            results = _run_async(run_batch())
 
         # Report results
         success_count = sum(1 for r in results if r.get("status") == "success")
@@ -364,10 +438,9 @@ def async_batch_func(args):
                     )
 
         # Save results if requested
-        if hasattr(args, "results_file") and args.results_file:
-            results_path = Path(args.results_file)
-            with open(results_path, "w") as f:
-                json.dump(results, f, indent=2)
+        if results_path:
+            if not stream_results:
+                dump_json(results, results_path)
             logger.info(f"\n💾 Results saved to: {results_path}")
 
         sys.exit(0 if failed_count == 0 else 1)
@@ -388,7 +461,6 @@ def async_batch_func(args):
 def search_func(args):
     """Semantic search using natural language queries."""
     from contextinator.rag.tools import semantic_search
-    import asyncio
     from contextinator.rag.utils.output_formatter import (
         format_search_results,
         export_results_json,
@@ -396,48 +468,64 @@ def search_func(args):
     )
 
     try:
-        query = (
-            " ".join(args.query_text)
-            if isinstance(args.query_text, list)
-            else args.query_text
-        )
-
-        results = asyncio.run(
-            semantic_search(
-                collection_name=args.collection,
-                query=query,
-                n_results=args.n_results,
-                language=getattr(args, "language", None),
-                include_parents=getattr(args, "include_parents", False),
-                chromadb_dir=getattr(args, "chromadb_dir", None),
-            )
-        )
+        if args.batch_stdin:
+            queries = (line.strip() for line in sys.stdin)
+        else:
+            query = args.query_text or ""
+            query = " ".join(query) if isinstance(query, list) else query
+            # Blank queries are skipped when run, so reject them up front
+            if not query.strip():
+                logger.error("A query is required unless --batch-stdin is given")
+                sys.exit(1)
+            queries = [query]
+
+        # All queries run in one event loop, so the embedding and ChromaDB
+        # clients cached by semantic_search keep their connections warm
+        async def run_queries():
+            all_results = []
+            for query in queries:
+                if not query:
+                    continue
+                results = await semantic_search(
+                    collection_name=args.collection,
+                    query=query,
+                    n_results=args.n_results,
+                    language=args.language,
+                    include_parents=args.include_parents,
+                    chromadb_dir=args.chromadb_dir,
+                )
+                if not args.json and not args.toon:
+                    format_search_results(
+                        results, query=query, collection=args.collection
+                    )
+                all_results.append(
+                    {
+                        "query": query,
+                        "collection": args.collection,
+                        "total_results": len(results),
+                        "results": results,
+                    }
+                )
+            return all_results
 
-        result_data = {
-            "query": query,
-            "collection": args.collection,
-            "total_results": len(results),
-            "results": results,
-        }
+        all_results = _run_async(run_queries())
+        # A single query exports its result object; a batch exports the list
+        result_data = all_results if args.batch_stdin else all_results[0]
 
         if args.json:
             export_results_json(result_data, args.json)
 
-        if getattr(args, "toon", None):
+        if args.toon:
             export_results_toon(result_data, args.toon)
 
-        if not args.json and not getattr(args, "toon", None):
-            format_search_results(results, query=query, collection=args.collection)
-
     except Exception as e:
         logger.error(f"Search failed: {e}")
-        exit(1)
+        sys.exit(1)
 
 
 def symbol_func(args):
     """Find symbols (functions/classes) by name."""
     from contextinator.rag.tools import symbol_search
-    import asyncio
     from contextinator.rag.utils.output_formatter import (
         format_search_results,
         export_results_json,
@@ -445,12 +533,12 @@ def symbol_func(args):
     )
 
     try:
-        results = asyncio.run(
+        results = _run_async(
             symbol_search(
                 collection_name=args.collection,
                 symbol_name=args.symbol_name,
-                symbol_type=getattr(args, "type", None),
-                chromadb_dir=getattr(args, "chromadb_dir", None),
+                symbol_type=args.type,
+                chromadb_dir=args.chromadb_dir,
             )
         )
 
@@ -464,31 +552,30 @@ def symbol_func(args):
         if args.json:
             export_results_json(result_data, args.json)
 
-        if getattr(args, "toon", None):
+        if args.toon:
             export_results_toon(result_data, args.toon)
 
-        if not args.json and not getattr(args, "toon", None):
+        if not args.json and not args.toon:
             format_search_results(
                 results, query=f"Symbol: {args.symbol_name}", collection=args.collection
             )
 
     except Exception as e:
         logger.error(f"Symbol search failed: {e}")
-        exit(1)
+        sys.exit(1)
 
 
 def cat_file_func(args):
     """Display complete file contents from chunks."""
-    import asyncio
     from contextinator.rag.tools import cat_file
     from contextinator.rag.utils.output_formatter import export_results_json
 
     try:
-        content = asyncio.run(
+        content = _run_async(
             cat_file(
                 collection_name=args.collection,
                 file_path=args.file_path,
-                chromadb_dir=getattr(args, "chromadb_dir", None),
+                chromadb_dir=args.chromadb_dir,
             )
         )
 
@@ -497,80 +584,79 @@ def cat_file_func(args):
                 {"file_path": args.file_path, "content": content}, args.json
             )
         else:
-            print(f"File: {args.file_path}")
-            print("=" * 80)
-            print(content)
+            _write_stdout(f"File: {args.file_path}\n{'=' * 80}\n{content}")
 
     except Exception as e:
         logger.error(f"Cat file failed: {e}")
-        exit(1)
+        sys.exit(1)
 
 
 def grep_func(args):
     """Advanced grep search with optional regex support."""
     from contextinator.rag.tools import grep_search
-    import asyncio
     from contextinator.rag.utils.output_formatter import export_results_json
 
     try:
-        results = asyncio.run(
+        results = _run_async(
             grep_search(
                 collection_name=args.collection,
                 pattern=args.pattern,
-                max_chunks=getattr(args, "limit", 100),
-                use_regex=getattr(args, "regex", False),
-                case_sensitive=getattr(args, "case_sensitive", False),
-                whole_word=getattr(args, "whole_word", False),
-                context_lines=getattr(args, "context", 0),
-                language=getattr(args, "language", None),
-                chromadb_dir=getattr(args, "chromadb_dir", None),
+                max_chunks=args.limit,
+                use_regex=args.regex,
+                case_sensitive=args.case_sensitive,
+                whole_word=args.whole_word,
+                context_lines=args.context,
+                language=args.language,
+                chromadb_dir=args.chromadb_dir,
             )
         )
 
         if args.json:
             export_results_json(results, args.json)
         else:
-            mode = "Regex" if getattr(args, "regex", False) else "Text"
-            print(f"{mode} Pattern: '{args.pattern}'")
-            print(
-                f"Found {results['total_matches']} matches in {results['total_files']} files\n"
-            )
+            mode = "Regex" if args.regex else "Text"
+            # Collected and written at once rather than printed line by line
+            out = [
+                f"{mode} Pattern: '{args.pattern}'\n",
+                f"Found {results['total_matches']} matches in {results['total_files']} files\n\n",
+            ]
 
             for file_result in results["files"]:
-                print(
-                    f"\n📄 {file_result['path']} ({file_result['match_count']} matches)"
+                out.append(
+                    f"\n📄 {file_result['path']} ({file_result['match_count']} matches)\n"
                 )
                 for match in file_result["matches"][:10]:
-                    if getattr(args, "context", 0) > 0:
-                        if match.get("context_before"):
-                            for ctx in match["context_before"]:
-                                print(f"      {ctx}")
-                        print(f"  Line {match['line_number']}: {match['content']}")
-                        if match.get("context_after"):
-                            for ctx in match["context_after"]:
-                                print(f"      {ctx}")
-                    else:
-                        print(f"  Line {match['line_number']}: {match['content']}")
+                    if args.context > 0:
+                        out.extend(
+                            f"      {ctx}\n" for ctx in match.get("context_before") or ()
+                        )
+                    out.append(f"  Line {match['line_number']}: {match['content']}\n")
+                    if args.context > 0:
+                        out.extend(
+                            f"      {ctx}\n" for ctx in match.get("context_after") or ()
+                        )
                 if len(file_result["matches"]) > 10:
-                    print(f"  ... and {len(file_result['matches']) - 10} more matches")
+                    out.append(
+                        f"  ... and {len(file_result['matches']) - 10} more matches\n"
+                    )
+            sys.stdout.writelines(out)
 
     except Exception as e:
         logger.error(f"Grep search failed: {e}")
-        exit(1)
+        sys.exit(1)
 
 
 def read_file_func(args):
     """Reconstruct and display complete file from chunks."""
-    import asyncio
     from contextinator.rag.tools import cat_file
     from contextinator.rag.utils.output_formatter import export_results_json, export_results_toon
 
     try:
-        content = asyncio.run(
+        content = _run_async(
             cat_file(
                 collection_name=args.collection,
                 file_path=args.file_path,
-                chromadb_dir=getattr(args, "chromadb_dir", None),
+                chromadb_dir=args.chromadb_dir,
             )
         )
 
@@ -578,14 +664,14 @@ def read_file_func(args):
 
         if args.json:
             export_results_json(file_data, args.json)
-        elif getattr(args, "toon", None):
+        elif args.toon:
             export_results_toon(file_data, args.toon)
         else:
-            print(content)
+            _write_stdout(content)
 
     except Exception as e:
         logger.error(f"Read file failed: {e}")
-        exit(1)
+        sys.exit(1)
 
 
 def search_advanced_func(args):
@@ -600,13 +686,13 @@ def search_advanced_func(args):
     try:
         # Use semantic search if query provided
         if args.semantic:
-            results = asyncio.run(
+            results = _run_async(
                 semantic_search(
                     collection_name=args.collection,
                     query=args.semantic,
                     n_results=args.limit,
-                    language=args.language if hasattr(args, "language") else None,
-                    chromadb_dir=getattr(args, "chromadb_dir", None),
+                    language=args.language,
+                    chromadb_dir=args.chromadb_dir,
                 )
             )
             query_desc = f"Semantic: {args.semantic}"
@@ -620,7 +706,7 @@ def search_advanced_func(args):
 
             if args.json:
                 export_results_json(result_data, args.json)
-            elif getattr(args, "toon", None):
+            elif args.toon:
                 export_results_toon(result_data, args.toon)
             else:
                 format_search_results(
@@ -629,12 +715,12 @@ def search_advanced_func(args):
 
         elif args.pattern:
             # Use grep search for pattern
-            results = asyncio.run(
+            results = _run_async(
                 grep_search(
                     collection_name=args.collection,
                     pattern=args.pattern,
                     max_chunks=args.limit,
-                    chromadb_dir=getattr(args, "chromadb_dir", None),
+                    chromadb_dir=args.chromadb_dir,
                 )
             )
 
@@ -647,24 +733,22 @@ def search_advanced_func(args):
                 )
         else:
             logger.error("Please provide either --semantic or --pattern")
-            exit(1)
+            sys.exit(1)
 
     except Exception as e:
         logger.error(f"Advanced search failed: {e}")
-        exit(1)
+        sys.exit(1)
 
 
 def db_info_func(args):
     """Show ChromaDB database information."""
     from contextinator.rag.vectorstore import ChromaVectorStore
-    import os
-    from pathlib import Path
 
     try:
         # Use output directory if provided, otherwise current directory
         base_dir = getattr(args, "output", None) or os.getcwd()
-        repo_name = getattr(args, "repo_name", None) or Path(base_dir).name
-        custom_chromadb_dir = getattr(args, "chromadb_dir", None)
+        repo_name = args.repo_name or Path(base_dir).name
+        custom_chromadb_dir = args.chromadb_dir
         vector_store = ChromaVectorStore(
             base_dir=base_dir,
             repo_name=repo_name,
@@ -680,39 +764,37 @@ def db_info_func(args):
             logger.info("📭 No collections found in the database")
             return
 
-        logger.info(f"Found {len(collections)} collection(s):")
-        logger.info("")
+        logger.info("Found %d collection(s):", len(collections))
 
+        # One write for the whole listing rather than a log call per field
+        lines = [""]
         for collection in collections:
-            logger.info("  📖 Collection: %s", collection["name"])
-            logger.info("     📊 Documents: %d", collection["count"])
+            lines.append(f"  📖 Collection: {collection['name']}")
+            lines.append(f"     📊 Documents: {collection['count']}")
             if collection.get("metadata"):
-                logger.info(
-                    "     📝 Description: %s",
-                    collection["metadata"].get("description", "N/A"),
-                )
-            logger.info("")
+                description = collection["metadata"].get("description", "N/A")
+                lines.append(f"     📝 Description: {description}")
+            lines.append("")
+        _write_stdout("\n".join(lines))
 
         # Show total documents
         total_docs = sum(col["count"] for col in collections)
-        logger.info(f"Total documents across all collections: {total_docs}")
+        logger.info("Total documents across all collections: %d", total_docs)
 
     except Exception as e:
         logger.error(f"Failed to get database info: {str(e)}")
-        exit(1)
+        sys.exit(1)
 
 
 def db_list_func(args):
     """List all collections in ChromaDB."""
     from contextinator.rag.vectorstore import ChromaVectorStore
-    import os
-    from pathlib import Path
 
     try:
         # Use output directory if provided, otherwise current directory
         base_dir = getattr(args, "output", None) or os.getcwd()
-        custom_chromadb_dir = getattr(args, "chromadb_dir", None)
-        repo_name = getattr(args, "repo_name", None) or Path(base_dir).name
+        custom_chromadb_dir = args.chromadb_dir
+        repo_name = args.repo_name or Path(base_dir).name
 
         vector_store = ChromaVectorStore(
             base_dir=base_dir,
@@ -735,21 +817,19 @@ def db_list_func(args):
 
     except Exception as e:
         logger.error(f"Failed to list collections: {str(e)}")
-        exit(1)
+        sys.exit(1)
 
 
 def db_show_func(args):
     """Show details of a specific collection."""
     from contextinator.rag.vectorstore import ChromaVectorStore
     from contextinator.rag.config import sanitize_collection_name
-    import os
-    from pathlib import Path
 
     try:
         # Use output directory if provided, otherwise current directory
         base_dir = getattr(args, "output", None) or os.getcwd()
-        custom_chromadb_dir = getattr(args, "chromadb_dir", None)
-        repo_name = getattr(args, "repo_name", None) or Path(base_dir).name
+        custom_chromadb_dir = args.chromadb_dir
+        repo_name = args.repo_name or Path(base_dir).name
 
         collection_name = args.collection_name
         vector_store = ChromaVectorStore(
@@ -767,10 +847,10 @@ def db_show_func(args):
             logger.error(f"Collection '{collection_name}' not found")
             return
 
-        logger.info(f"Collection: {info['name']}")
-        logger.info(f"Documents: {info['count']}")
+        logger.info("Collection: %s", info["name"])
+        logger.info("Documents: %d", info["count"])
         if info.get("metadata"):
-            logger.info("Description: {info['metadata'].get('description', 'N/A')}")
+            logger.info("Description: %s", info["metadata"].get("description", "N/A"))
 
         # Get a few sample documents if requested
         if args.sample and info["count"] > 0:
@@ -782,40 +862,41 @@ def db_show_func(args):
                 sample_size = min(args.sample, info["count"])
                 results = collection.get(limit=sample_size)
 
-                logger.info("📄 Sample documents (showing {sample_size}):")
+                logger.info("📄 Sample documents (showing %d):", sample_size)
+
+                # One write for all samples rather than a log call per field
+                lines = []
                 for i, (doc_id, document, metadata) in enumerate(
-                    zip(results["ids"], results["documents"], results["metadatas"])
+                    zip(results["ids"], results["documents"], results["metadatas"]),
+                    1,
                 ):
-                    logger.info("  Document {i+1}:")
-                    logger.info("    ID: %s", doc_id)
-                    logger.info(
-                        "    Content: %s%s",
-                        document[:200],
-                        "..." if len(document) > 200 else "",
-                    )
+                    lines.append(f"  Document {i}:")
+                    lines.append(f"    ID: {doc_id}")
+                    ellipsis = "..." if len(document) > 200 else ""
+                    lines.append(f"    Content: {document[:200]}{ellipsis}")
                     if metadata:
-                        logger.info("    Metadata: %s", metadata)
+                        lines.append(f"    Metadata: {metadata}")
+                if lines:
+                    _write_stdout("\n".join(lines))
 
             except Exception as e:
-                logger.warning("Could not fetch sample documents: {str(e)}")
+                logger.warning("Could not fetch sample documents: %s", e)
 
     except Exception as e:
-        logger.error("Failed to show collection: {str(e)}")
-        exit(1)
+        logger.error("Failed to show collection: %s", e)
+        sys.exit(1)
 
 
 def db_clear_func(args):
     """Clear/delete a specific collection."""
     from contextinator.rag.vectorstore import ChromaVectorStore
     from contextinator.rag.config import sanitize_collection_name
-    import os
-    from pathlib import Path
 
     try:
         # Use output directory if provided, otherwise current directory
         base_dir = getattr(args, "output", None) or os.getcwd()
-        custom_chromadb_dir = getattr(args, "chromadb_dir", None)
-        repo_name = getattr(args, "repo_name", None) or Path(base_dir).name
+        custom_chromadb_dir = args.chromadb_dir
+        repo_name = args.repo_name or Path(base_dir).name
 
         collection_name = args.collection_name
         vector_store = ChromaVectorStore(
@@ -842,41 +923,26 @@ def db_clear_func(args):
             logger.info(f"✅ Collection '{collection_name}' deleted successfully")
         except Exception as e:
             logger.error(f"Failed to delete collection: {str(e)}")
-            exit(1)
+            sys.exit(1)
 
     except Exception as e:
         logger.error(f"Failed to clear collection: {str(e)}")
-        exit(1)
-
+        sys.exit(1)
 
-def main():
-    # Check if no arguments or just --help/-h is provided
-    if len(sys.argv) == 1 or (
-        len(sys.argv) == 2 and sys.argv[1] in ["--help", "-h", "help"]
-    ):
-        print_main_help()
-        sys.exit(0)
 
-    parser = argparse.ArgumentParser(
-        prog="contextinator",
-        description="Contextinator — Turn any codebase into semantically-aware, searchable knowledge for AI",
-        add_help=False,  # We handle help ourselves
-        epilog="Examples:\n"
-        "  %(prog)s chunk --repo-url https://github.com/user/repo --save\n"
-        '  %(prog)s search "authentication logic" -c MyRepo -n 5\n'
-        '  %(prog)s search-advanced -c MyRepo --semantic "error handling" --language python\n\n'
-        "For detailed help on a command: %(prog)s <command> --help",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-    )
-
-    # Add custom help argument
-    parser.add_argument(
-        "-h", "--help", action="store_true", help="Show this help message"
-    )
+def _positive_int(value):
+    """Parse an integer option that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
 
-    sub = parser.add_subparsers(title="commands", dest="command")
 
-    # chunk
+def _add_chunk_parser(sub):
+    """Add the chunk subcommand parser."""
     p_chunk = sub.add_parser(
         "chunk",
         help="Chunks the local Git codebase into semantic units and (optionally) save them",
@@ -892,6 +958,11 @@ def main():
         action="store_true",
         help="Save AST trees for analysis and debugging",
     )
+    p_chunk.add_argument(
+        "--save-full-ast",
+        action="store_true",
+        help="With --save-ast, also save the full serialized AST tree per file",
+    )
     p_chunk.add_argument(
         "--repo-url", help="GitHub/Git repository URL to clone and chunk"
     )
@@ -909,7 +980,9 @@ def main():
     )
     p_chunk.set_defaults(func=chunk_func)
 
-    # embed
+
+def _add_embed_parser(sub):
+    """Add the embed subcommand parser."""
     p_embed = sub.add_parser(
         "embed",
         help="Generate embeddings for existing chunks using OpenAI and (optionally) save them",
@@ -942,9 +1015,35 @@ def main():
     p_embed.add_argument(
         "--api-key", help="OpenAI API key (alternative to OPENAI_API_KEY env var)"
     )
+    p_embed.add_argument(
+        "--batch-size",
+        type=_positive_int,
+        help="Maximum chunks per embedding API request (default: EMBEDDING_BATCH_SIZE or 250)",
+    )
+    p_embed.add_argument(
+        "--max-concurrent-batches",
+        type=_positive_int,
+        default=5,
+        help="Max embedding requests in flight at once (default: 5)",
+    )
+    p_embed.add_argument(
+        "--no-reuse",
+        action="store_true",
+        help="Re-embed every chunk instead of reusing unchanged embeddings "
+        "from the last saved run",
+    )
+    p_embed.add_argument(
+        "--embed-mode",
+        choices=["sync", "async"],
+        default="sync",
+        help="sync waits for embedding to finish; async runs the command in a "
+        "background process logging to .contextinator/logs/ (default: sync)",
+    )
     p_embed.set_defaults(func=embed_func)
 
-    # store-embeddings
+
+def _add_store_embeddings_parser(sub):
+    """Add the store-embeddings subcommand parser."""
     p_store = sub.add_parser(
         "store-embeddings",
         help="Load embeddings into ChromaDB vector store",
@@ -976,7 +1075,9 @@ def main():
     )
     p_store.set_defaults(func=store_embeddings_func)
 
-    # combined pipeline: chunk-embed-store-embeddings
+
+def _add_chunk_embed_store_embeddings_parser(sub):
+    """Add the chunk-embed-store-embeddings subcommand parser."""
     p_pipeline = sub.add_parser(
         "chunk-embed-store-embeddings",
         help="Run chunk, embed and store-embeddings in a single command",
@@ -1014,9 +1115,35 @@ def main():
     p_pipeline.add_argument(
         "--api-key", help="OpenAI API key (alternative to OPENAI_API_KEY env var)"
     )
+    p_pipeline.add_argument(
+        "--batch-size",
+        type=_positive_int,
+        help="Maximum chunks per embedding API request (default: EMBEDDING_BATCH_SIZE or 250)",
+    )
+    p_pipeline.add_argument(
+        "--max-concurrent-batches",
+        type=_positive_int,
+        default=5,
+        help="Max embedding requests in flight at once (default: 5)",
+    )
+    p_pipeline.add_argument(
+        "--no-reuse",
+        action="store_true",
+        help="Re-embed every chunk instead of reusing unchanged embeddings "
+        "from the last saved run",
+    )
+    p_pipeline.add_argument(
+        "--embed-mode",
+        choices=["sync", "async"],
+        default="sync",
+        help="sync waits for embedding to finish; async runs the command in a "
+        "background process logging to .contextinator/logs/ (default: sync)",
+    )
     p_pipeline.set_defaults(func=pipeline_func)
 
-    # query
+
+def _add_query_parser(sub):
+    """Add the query subcommand parser."""
     p_query = sub.add_parser(
         "query",
         help="Query the vector store for semantically similar code chunks",
@@ -1035,7 +1162,9 @@ def main():
     )
     p_query.set_defaults(func=query_func)
 
-    # db-info
+
+def _add_db_info_parser(sub):
+    """Add the db-info subcommand parser."""
     p_db_info = sub.add_parser(
         "db-info",
         help="Show ChromaDB database information and statistics",
@@ -1051,7 +1180,9 @@ def main():
     )
     p_db_info.set_defaults(func=db_info_func)
 
-    # db-list
+
+def _add_db_list_parser(sub):
+    """Add the db-list subcommand parser."""
     p_db_list = sub.add_parser(
         "db-list",
         help="List all collections in ChromaDB",
@@ -1067,7 +1198,9 @@ def main():
     )
     p_db_list.set_defaults(func=db_list_func)
 
-    # db-show
+
+def _add_db_show_parser(sub):
+    """Add the db-show subcommand parser."""
     p_db_show = sub.add_parser(
         "db-show",
         help="Show details of a specific collection",
@@ -1087,7 +1220,9 @@ def main():
     )
     p_db_show.set_defaults(func=db_show_func)
 
-    # db-clear
+
+def _add_db_clear_parser(sub):
+    """Add the db-clear subcommand parser."""
     p_db_clear = sub.add_parser(
         "db-clear",
         help="Delete a specific collection",
@@ -1108,7 +1243,20 @@ def main():
         help="Custom chromadb directory (overrides default .contextinator/chromadb)",
     )
 
-    # structure
+
+def _structure_formats(value):
+    """Validate a comma-separated list of structure output formats."""
+    formats = [f.strip() for f in value.split(",")]
+    invalid = [f for f in formats if f not in ("tree", "json")]
+    if invalid:
+        raise argparse.ArgumentTypeError(
+            f"invalid format(s): {', '.join(invalid)} (choose from tree, json)"
+        )
+    return ",".join(formats)
+
+
+def _add_structure_parser(sub):
+    """Add the structure subcommand parser."""
     p_structure = sub.add_parser(
         "structure",
         help="Analyze and display repository structure as a tree",
@@ -1123,18 +1271,17 @@ def main():
     )
     p_structure.add_argument(
         "--format",
-        choices=["tree", "json"],
+        type=_structure_formats,
         default="tree",
-        help="Output format (default: tree)",
+        help="Output format: tree, json, or a comma-separated list such as "
+        "tree,json (default: tree)",
     )
     p_structure.add_argument("--output", "-o", help="Save output to file")
     p_structure.set_defaults(func=structure_func)
 
-    # ========================================================================
-    # SEARCH TOOL COMMANDS
-    # ========================================================================
 
-    # search (semantic search)
+def _add_search_parser(sub):
+    """Add the search subcommand parser."""
     p_search = sub.add_parser(
         "search",
         help="Semantic search using natural language queries",
@@ -1143,10 +1290,11 @@ def main():
         '  %(prog)s "authentication logic" -c MyRepo\n'
         '  %(prog)s "error handling" -c MyRepo --language python -n 10\n'
         '  %(prog)s "database queries" -c MyRepo --include-parents\n'
-        '  %(prog)s "API endpoints" -c MyRepo --toon results.json',
+        '  %(prog)s "API endpoints" -c MyRepo --toon results.json\n'
+        "  %(prog)s -c MyRepo --batch-stdin < queries.txt",
         formatter_class=RichHelpFormatter,
     )
-    p_search.add_argument("query_text", nargs="+", help="Natural language query")
+    p_search.add_argument("query_text", nargs="*", help="Natural language query")
     p_search.add_argument("--collection", "-c", required=True, help="Collection name")
     p_search.add_argument(
         "--n-results", "-n", type=int, default=5, help="Number of results (default: 5)"
@@ -1165,9 +1313,16 @@ def main():
         "--chromadb-dir",
         help="Custom chromadb directory (overrides default .contextinator/chromadb)",
     )
+    p_search.add_argument(
+        "--batch-stdin",
+        action="store_true",
+        help="Read one query per line from stdin and run them all in one session",
+    )
     p_search.set_defaults(func=search_func)
 
-    # symbol (symbol search)
+
+def _add_symbol_parser(sub):
+    """Add the symbol subcommand parser."""
     p_symbol = sub.add_parser(
         "symbol",
         help="Find symbols (functions/classes) by exact or partial name match",
@@ -1194,7 +1349,9 @@ def main():
     )
     p_symbol.set_defaults(func=symbol_func)
 
-    # pattern (regex search)
+
+def _add_cat_parser(sub):
+    """Add the cat subcommand parser."""
     p_cat = sub.add_parser(
         "cat",
         help="Display complete file contents from chunks",
@@ -1206,7 +1363,9 @@ def main():
     p_cat.add_argument("--chromadb-dir", help="Custom chromadb directory")
     p_cat.set_defaults(func=cat_file_func)
 
-    # grep (advanced search with $contains)
+
+def _add_grep_parser(sub):
+    """Add the grep subcommand parser."""
     p_grep = sub.add_parser(
         "grep",
         help="Advanced grep search with optional regex support",
@@ -1237,7 +1396,9 @@ def main():
     p_grep.add_argument("--chromadb-dir", help="Custom chromadb directory")
     p_grep.set_defaults(func=grep_func)
 
-    # read-file (file reconstruction)
+
+def _add_read_file_parser(sub):
+    """Add the read-file subcommand parser."""
     p_read_file = sub.add_parser(
         "read-file",
         help="Reconstruct and display complete file from chunks",
@@ -1258,7 +1419,9 @@ def main():
     )
     p_read_file.set_defaults(func=read_file_func)
 
-    # search-advanced (advanced/hybrid search)
+
+def _add_search_advanced_parser(sub):
+    """Add the search-advanced subcommand parser."""
     p_search_adv = sub.add_parser(
         "search-advanced",
         help="Advanced search with multiple criteria and filters",
@@ -1299,7 +1462,9 @@ def main():
     )
     p_search_adv.set_defaults(func=search_advanced_func)
 
-    # async-batch (async batch processing)
+
+def _add_async_batch_parser(sub):
+    """Add the async-batch subcommand parser."""
     p_async_batch = sub.add_parser(
         "async-batch",
         help="Process multiple repositories asynchronously",
@@ -1334,10 +1499,75 @@ def main():
         "--no-cleanup", action="store_true", help="Keep temporary cloned directories"
     )
     p_async_batch.add_argument(
-        "--results", dest="results_file", help="Save results to JSON file"
+        "--results",
+        dest="results_file",
+        help="Save results to JSON file (.ndjson/.jsonl: one line per repo as it finishes)",
     )
     p_async_batch.set_defaults(func=async_batch_func)
 
+
+_COMMAND_PARSERS = {
+    "chunk": _add_chunk_parser,
+    "embed": _add_embed_parser,
+    "store-embeddings": _add_store_embeddings_parser,
+    "chunk-embed-store-embeddings": _add_chunk_embed_store_embeddings_parser,
+    "query": _add_query_parser,
+    "db-info": _add_db_info_parser,
+    "db-list": _add_db_list_parser,
+    "db-show": _add_db_show_parser,
+    "db-clear": _add_db_clear_parser,
+    "structure": _add_structure_parser,
+    "search": _add_search_parser,
+    "symbol": _add_symbol_parser,
+    "cat": _add_cat_parser,
+    "grep": _add_grep_parser,
+    "read-file": _add_read_file_parser,
+    "search-advanced": _add_search_advanced_parser,
+    "async-batch": _add_async_batch_parser,
+}
+
+
+def main():
+    # Check if no arguments or just --help/-h is provided
+    if len(sys.argv) == 1 or (
+        len(sys.argv) == 2 and sys.argv[1] in ["--help", "-h", "help"]
+    ):
+        print_main_help()
+        sys.exit(0)
+
+    parser = argparse.ArgumentParser(
+        prog="contextinator",
+        description="Contextinator — Turn any codebase into semantically-aware, searchable knowledge for AI",
+        add_help=False,  # We handle help ourselves
+        epilog="Examples:\n"
+        "  %(prog)s chunk --repo-url https://github.com/user/repo --save\n"
+        '  %(prog)s search "authentication logic" -c MyRepo -n 5\n'
+        '  %(prog)s search-advanced -c MyRepo --semantic "error handling" --language python\n\n'
+        "For detailed help on a command: %(prog)s <command> --help",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+
+    # Add custom help argument
+    parser.add_argument(
+        "-h", "--help", action="store_true", help="Show this help message"
+    )
+
+    # The top-level parser has no options taking values, so the first
+    # positional argument is the subcommand; build only its parser
+    command = next((arg for arg in sys.argv[1:] if not arg.startswith("-")), None)
+    if command in _COMMAND_PARSERS:
+        # Usage still lists every command even though only one parser is built
+        sub = parser.add_subparsers(
+            title="commands",
+            dest="command",
+            metavar="{" + ",".join(_COMMAND_PARSERS) + "}",
+        )
+        _COMMAND_PARSERS[command](sub)
+    else:
+        sub = parser.add_subparsers(title="commands", dest="command")
+        for add_parser in _COMMAND_PARSERS.values():
+            add_parser(sub)
+
     args = parser.parse_args()
 
     # Handle help flag